@@ -0,0 +1,167 @@
+"""
+JSON API Module
+REST endpoints for the calculator, mounted on the NiceGUI/FastAPI app
+
+All handlers are async and do no I/O: every calculation is a table lookup,
+so running them on the event loop avoids a thread-pool hop per request.
+Responses are serialized straight to bytes (with orjson when installed),
+and the payloads of the bounded key spaces (sura pairs, sura info, single
+pages on the standard layout) are built once and reused. A reused payload
+always has the same keys as the computed response it stands in for.
+
+Endpoints:
+    GET /api/range?first=Al-Fatiha&second=An-Nas[&layout=...][&fields=...]
+    GET /api/ayah-range?start=2:1&end=2:286[&layout=...]
+    GET /api/pages?start=1[&end=20][&layout=...]
+    GET /api/sura/{name}
+    GET /api/search?q=baq[&limit=10]
+    GET /metrics (Prometheus text format, see metrics.py)
+"""
+
+import json
+
+from fastapi import APIRouter, FastAPI, Path, Query
+from fastapi.responses import Response
+
+from calculator import calculator
+from metrics import CONTENT_TYPE, ENABLED as METRICS_ENABLED, MetricsMiddleware, registry
+from mushaf_layouts import DEFAULT_LAYOUT
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+API_PREFIX = "/api"
+MAX_NAME_LENGTH = 64  # Longest accepted sura name or ayah position
+MAX_SEARCH_RESULTS = 114
+
+router = APIRouter(prefix=API_PREFIX, tags=["calculator"])
+metrics_router = APIRouter(tags=["metrics"])
+
+registry.register_cache("results", calculator.cache)
+
+# Ready-to-serve payloads for the standard layout, filled on first request
+_sura_info_payloads = {}
+_page_payloads = {}
+
+
+def dumps(data):
+    """Serialize a result to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def json_response(payload, status_code=200):
+    """Wrap pre-serialized JSON bytes in a response"""
+    return Response(content=payload, status_code=status_code, media_type="application/json")
+
+
+def result_response(result):
+    """Serialize a calculator result; failed calculations become 400 responses"""
+    if hasattr(result, "to_dict"):
+        result = result.to_dict()
+    return json_response(dumps(result), 200 if result.get("success") else 400)
+
+
+def _is_default_layout(layout):
+    return layout is None or layout == DEFAULT_LAYOUT
+
+
+@router.get("/range")
+async def sura_range(
+    first: str = Query(..., min_length=1, max_length=MAX_NAME_LENGTH, description="First sura name or number"),
+    second: str = Query(..., min_length=1, max_length=MAX_NAME_LENGTH, description="Second sura name or number"),
+    layout: str = Query(None, max_length=MAX_NAME_LENGTH, description="Mushaf layout name"),
+    fields: str = Query(None, max_length=512, description="Comma-separated result fields")
+):
+    """Ayahs and pages between two suras"""
+    if fields is None and _is_default_layout(layout):
+        payload = calculator.get_pair_payload(first, second)
+        if payload is not None:
+            return json_response(payload)
+    return result_response(calculator.calculate_ayahs_between_suras(first, second, layout, fields))
+
+
+@router.get("/ayah-range")
+async def ayah_range(
+    start: str = Query(..., min_length=3, max_length=MAX_NAME_LENGTH, description='Start position, e.g. "2:142"'),
+    end: str = Query(..., min_length=3, max_length=MAX_NAME_LENGTH, description='End position, e.g. "3:92"'),
+    layout: str = Query(None, max_length=MAX_NAME_LENGTH, description="Mushaf layout name")
+):
+    """Ayahs, pages and juz between two ayah positions"""
+    return result_response(calculator.calculate_ayahs_between_positions(start, end, layout))
+
+
+@router.get("/pages")
+async def page_lookup(
+    start: int = Query(..., ge=1, le=9999, description="First page"),
+    end: int = Query(None, ge=1, le=9999, description="Last page (defaults to start)"),
+    layout: str = Query(None, max_length=MAX_NAME_LENGTH, description="Mushaf layout name")
+):
+    """Suras and ayahs printed on a page or range of pages"""
+    if end is None or end == start:
+        if _is_default_layout(layout):
+            payload = _page_payloads.get(start)
+            if payload is None:
+                result = calculator.get_page_contents(start)
+                if not result["success"]:
+                    return result_response(result)
+                payload = _page_payloads[start] = dumps(result)
+            return json_response(payload)
+        return result_response(calculator.get_page_contents(start, layout))
+    return result_response(calculator.get_suras_in_pages(start, end, layout))
+
+
+@router.get("/sura/{name}")
+async def sura_info(name: str = Path(..., min_length=1, max_length=MAX_NAME_LENGTH)):
+    """Details of one sura by name or number"""
+    info = calculator.get_sura_info(name)
+    if info is None:
+        return json_response(dumps({
+            "success": False,
+            "error": f"'{name}' is not a valid sura name"
+        }), 404)
+
+    payload = _sura_info_payloads.get(info["number"])
+    if payload is None:
+        payload = _sura_info_payloads[info["number"]] = dumps({"success": True, **info})
+    return json_response(payload)
+
+
+@router.get("/search")
+async def search(
+    q: str = Query(..., min_length=1, max_length=MAX_NAME_LENGTH, description="Part of a sura name"),
+    limit: int = Query(10, ge=1, le=MAX_SEARCH_RESULTS, description="Maximum number of matches")
+):
+    """Suras whose names contain the query, names starting with it first"""
+    matches = calculator.search_suras(q, limit)
+    return json_response(dumps({"success": True, "query": q, "results": matches}))
+
+
+@metrics_router.get("/metrics")
+async def metrics():
+    """Operation and HTTP metrics in the Prometheus text format"""
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
+
+
+def install_metrics(app):
+    """Serve /metrics on an app and record its HTTP requests (no-op when metrics are off)"""
+    app.include_router(metrics_router)
+    if METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+
+def create_api_app():
+    """
+    Standalone FastAPI app serving only the JSON API (used by --api-only)
+
+    Returns:
+        FastAPI: App with the calculator routes
+    """
+    calculator.precompute_pairs()  # Load the pair matrix before the first request
+    api_app = FastAPI(title="Quran Ayah Calculator API")
+    api_app.include_router(router)
+    install_metrics(api_app)
+    return api_app
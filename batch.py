@@ -0,0 +1,176 @@
+"""
+Batch Calculation Module
+Vectorized range calculations over arrays of (start, end) pairs
+
+Uses NumPy when it is installed and falls back to pure Python otherwise.
+Results are columnar: one array per field, plus a validity mask in place
+of per-item error dicts.
+"""
+
+from array import array
+
+from quran_data import get_name_index, normalize_sura_name
+from quran_index import get_tables, parse_position
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+BATCH_UNITS = ("sura", "ayah")
+
+
+def _resolve_suras(values):
+    """Map sura names/numbers to sura numbers, 0 where invalid"""
+    if np is not None and isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        numbers = values.astype(np.int32)
+        return np.where((numbers >= 1) & (numbers <= get_tables().sura_table.count), numbers, 0)
+
+    name_index = get_name_index()
+    resolved = {}  # Queries repeat a lot, so resolve each distinct value once
+    numbers = []
+    for value in values:
+        if not isinstance(value, (str, int)) and not (np is not None and isinstance(value, np.integer)):
+            numbers.append(0)  # Only names and numbers name a sura; lists and dicts cannot be looked up
+            continue
+        number = resolved.get(value)
+        if number is None:
+            number = resolved[value] = name_index.get(normalize_sura_name(value), 0)
+        numbers.append(number)
+    return np.asarray(numbers, dtype=np.int32) if np is not None else numbers
+
+
+def _resolve_positions(values):
+    """Map ayah positions to 0-based global indexes, -1 where invalid"""
+    tables = get_tables()
+    if (np is not None and isinstance(values, np.ndarray) and values.dtype.kind in "iu"
+            and values.ndim == 2 and values.shape[1] == 2):
+        table = tables.sura_table
+        suras = values[:, 0].astype(np.int32)
+        ayahs = values[:, 1].astype(np.int32)
+        valid_suras = (suras >= 1) & (suras <= table.count)
+        safe_suras = np.where(valid_suras, suras, 1)
+        counts = np.frombuffer(table.ayahs, dtype=np.uint16).astype(np.int32)
+        prefix = np.frombuffer(table.ayah_prefix, dtype=np.uint32).astype(np.int32)
+        valid = valid_suras & (ayahs >= 1) & (ayahs <= counts[safe_suras])
+        return np.where(valid, prefix[safe_suras - 1] + ayahs - 1, -1)
+
+    ayah_index = tables.ayah_index
+    resolved = {}
+    indexes = []
+    for value in values:
+        key = tuple(value) if isinstance(value, list) else value
+        index = resolved.get(key)
+        if index is None:
+            position = parse_position(value)
+            index = resolved[key] = -1 if position is None else ayah_index.to_global(*position)
+        indexes.append(index)
+    return np.asarray(indexes, dtype=np.int32) if np is not None else indexes
+
+
+def _sura_page_columns(mushaf):
+    """First and last page of every sura for a layout (index 0 is padding)"""
+    count = get_tables().sura_table.count
+    page_start = array("H", [0] + [mushaf.sura_page_start(n) for n in range(1, count + 1)])
+    page_end = array("H", [0] + [mushaf.sura_page_end(n) for n in range(1, count + 1)])
+    return page_start, page_end
+
+
+def calculate_many(starts, ends, mushaf, unit="sura"):
+    """
+    Calculate totals for many (start, end) pairs at once
+
+    Args:
+        starts: Sequence (or NumPy array) of sura names/numbers, or ayah positions
+        ends: Sequence of the same kind and length as starts
+        mushaf (MushafLayout): Layout used for page numbers
+        unit (str): "sura" for sura ranges or "ayah" for ayah positions
+
+    Returns:
+        dict: Columns valid, total_ayahs, total_pages, number_of_suras and is_forward.
+        Entries where valid is False hold zeros.
+    """
+    if unit not in BATCH_UNITS:
+        raise ValueError(f"'{unit}' is not a valid batch unit")
+    if len(starts) != len(ends):
+        raise ValueError("starts and ends must have the same length")
+
+    tables = get_tables()
+    if unit == "sura":
+        first, second = _resolve_suras(starts), _resolve_suras(ends)
+        invalid = 0
+        prefix = tables.sura_table.ayah_prefix
+        page_start, page_end = _sura_page_columns(mushaf)
+        sura_of = None
+    else:
+        first, second = _resolve_positions(starts), _resolve_positions(ends)
+        invalid = -1
+        prefix = None
+        page_start = page_end = mushaf.page_of
+        sura_of = tables.ayah_index.sura_of
+
+    calculate = _calculate_numpy if np is not None else _calculate_python
+    return calculate(first, second, invalid, prefix, page_start, page_end, sura_of)
+
+
+def _calculate_numpy(first, second, invalid, prefix, page_start, page_end, sura_of):
+    """Vectorized calculation with NumPy (int32 keeps the working set small)"""
+    valid = (first != invalid) & (second != invalid)
+    low = np.where(valid, np.minimum(first, second), 1)
+    high = np.where(valid, np.maximum(first, second), 1)
+    page_start = np.asarray(page_start, dtype=np.int32)
+    page_end = np.asarray(page_end, dtype=np.int32)
+
+    if prefix is not None:
+        prefix = np.frombuffer(prefix, dtype=np.uint32).astype(np.int32)
+        total_ayahs = prefix[high] - prefix[low - 1]
+        total_pages = np.abs(page_end[high] - page_start[low]) + 1
+        number_of_suras = high - low + 1
+        is_forward = first < second
+    else:
+        sura_of = np.frombuffer(sura_of, dtype=np.uint8).astype(np.int32)
+        total_ayahs = high - low + 1
+        total_pages = page_end[high] - page_start[low] + 1
+        number_of_suras = sura_of[high] - sura_of[low] + 1
+        is_forward = first <= second
+
+    return {
+        "valid": valid,
+        "total_ayahs": np.where(valid, total_ayahs, 0),
+        "total_pages": np.where(valid, total_pages, 0),
+        "number_of_suras": np.where(valid, number_of_suras, 0),
+        "is_forward": valid & is_forward
+    }
+
+
+def _calculate_python(first, second, invalid, prefix, page_start, page_end, sura_of):
+    """Pure Python fallback producing the same columns"""
+    count = len(first)
+    valid = [a != invalid and b != invalid for a, b in zip(first, second)]
+    total_ayahs = array("I", [0]) * count
+    total_pages = array("I", [0]) * count
+    number_of_suras = array("I", [0]) * count
+    is_forward = [False] * count
+
+    for i, (a, b) in enumerate(zip(first, second)):
+        if not valid[i]:
+            continue
+        low, high = (a, b) if a <= b else (b, a)
+        if prefix is not None:
+            total_ayahs[i] = prefix[high] - prefix[low - 1]
+            total_pages[i] = abs(page_end[high] - page_start[low]) + 1
+            number_of_suras[i] = high - low + 1
+            is_forward[i] = a < b
+        else:
+            total_ayahs[i] = high - low + 1
+            total_pages[i] = page_end[high] - page_start[low] + 1
+            number_of_suras[i] = sura_of[high] - sura_of[low] + 1
+            is_forward[i] = a <= b
+
+    return {
+        "valid": valid,
+        "total_ayahs": total_ayahs,
+        "total_pages": total_pages,
+        "number_of_suras": number_of_suras,
+        "is_forward": is_forward
+    }
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Quran Calculator Batch CLI
+Streams range queries from stdin, CSV or JSONL files and writes one result per line
+
+Each query is a pair of endpoints: sura names/numbers ("Al-Fatiha",
+"36"), ayah positions ("2:142") or page numbers, selected with --unit.
+Input is read and written lazily, so memory use stays constant no matter
+how large the file is.
+
+Usage:
+    python batch_cli.py queries.csv > results.jsonl
+    cat queries.jsonl | python batch_cli.py --format jsonl --unit ayah
+    python batch_cli.py big.csv --workers 8 --output results.csv --output-format csv
+
+Input:
+    CSV: two columns (start, end); a header row is skipped
+    JSONL: objects with "start"/"end" (or "from"/"to") keys, or [start, end] arrays
+"""
+
+import argparse
+import csv
+import json
+import sys
+from collections import deque
+from itertools import islice
+
+from calculator import calculator
+
+UNITS = ("sura", "ayah", "juz", "hizb", "quarter", "page")
+OUTPUT_FIELDS = ("start", "end", "success", "total_ayahs", "total_pages", "number_of_suras", "direction", "error")
+
+
+def read_csv_queries(lines):
+    """Yield (start, end) pairs from CSV lines, skipping a header and blank rows"""
+    first_row = True
+    for row in csv.reader(lines):
+        if not any(cell.strip() for cell in row):
+            continue
+        if first_row:
+            # The header, if any, is the first non-empty row (leading blank lines are allowed)
+            first_row = False
+            if row[0].strip().lower() in ("start", "from", "sura1", "first"):
+                continue
+        if len(row) < 2:
+            yield row[0].strip(), None  # Reported as an error result
+            continue
+        yield row[0].strip(), row[1].strip()
+
+
+def read_jsonl_queries(lines):
+    """Yield (start, end) pairs from JSON lines"""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            query = json.loads(line)
+        except ValueError:
+            yield line, None  # Reported as an error result
+            continue
+        if isinstance(query, dict):
+            yield query.get("start", query.get("from")), query.get("end", query.get("to"))
+        elif isinstance(query, list) and len(query) == 2:
+            yield query[0], query[1]
+        else:
+            yield line, None
+
+
+def calculate_query(query, unit="sura", layout=None):
+    """
+    Calculate one query and reduce it to a flat output record
+
+    Returns:
+        dict: One value per OUTPUT_FIELDS key
+    """
+    start, end = query
+    if start is None or end is None:
+        result = {"success": False, "error": "Query needs a start and an end"}
+    elif unit == "sura":
+        result = calculator.calculate_ayahs_between_suras(start, end, layout=layout)
+    elif unit == "ayah":
+        result = calculator.calculate_ayahs_between_positions(start, end, layout=layout)
+    elif unit == "page":
+        try:
+            result = calculator.get_suras_in_pages(int(start), int(end), layout=layout)
+        except (TypeError, ValueError):
+            result = {"success": False, "error": f"'{start}'-'{end}' is not a valid page range"}
+    else:
+        try:
+            result = calculator.calculate_ayahs_between_divisions(int(start), int(end), unit, layout=layout)
+        except (TypeError, ValueError):
+            result = {"success": False, "error": f"'{start}'-'{end}' is not a valid {unit} range"}
+
+    return {
+        "start": start,
+        "end": end,
+        "success": result.get("success", False),
+        "total_ayahs": result.get("total_ayahs", 0),
+        "total_pages": result.get("total_pages", 0),
+        "number_of_suras": result.get("number_of_suras", 0),
+        "direction": result.get("direction"),
+        "error": result.get("error")
+    }
+
+
+def _calculate_chunk(args):
+    """Worker entry point: calculate a chunk of queries"""
+    queries, unit, layout = args
+    return [calculate_query(query, unit, layout) for query in queries]
+
+
+def _chunks(queries, size):
+    """Group an iterator of queries into lists of at most size items"""
+    while True:
+        chunk = list(islice(queries, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def calculate_queries(queries, unit="sura", layout=None, workers=1, chunk_size=2000):
+    """
+    Yield result records for an iterator of queries, in input order
+
+    With workers > 1 the queries are sharded across a process pool in
+    chunks. At most 2 * workers chunks are submitted and not yet yielded, so
+    neither the input nor finished results are read ahead without bound
+    when the output is slower than the workers.
+    """
+    if workers <= 1:
+        for query in queries:
+            yield calculate_query(query, unit, layout)
+        return
+
+    from multiprocessing import Pool
+
+    max_pending = 2 * workers
+    with Pool(workers) as pool:
+        pending = deque()  # Async results of submitted chunks, oldest first
+        for chunk in _chunks(iter(queries), chunk_size):
+            if len(pending) >= max_pending:
+                yield from pending.popleft().get()
+            pending.append(pool.apply_async(_calculate_chunk, ((chunk, unit, layout),)))
+        while pending:
+            yield from pending.popleft().get()
+
+
+def write_jsonl(records, output):
+    """Write records as JSON lines"""
+    for record in records:
+        output.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        output.write("\n")
+
+
+def write_csv(records, output):
+    """Write records as CSV with a header row"""
+    writer = csv.DictWriter(output, fieldnames=OUTPUT_FIELDS, lineterminator="\n")
+    writer.writeheader()
+    for record in records:
+        writer.writerow(record)
+
+
+def detect_format(path):
+    """Guess the input format from a file name"""
+    if path and path.lower().endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    return "csv"
+
+
+def main():
+    """Main function to run the batch CLI"""
+    parser = argparse.ArgumentParser(description='Quran Calculator - batch range queries')
+    parser.add_argument('input', nargs='?', default='-',
+                       help='Input file (CSV or JSONL); "-" or omitted reads stdin')
+    parser.add_argument('--format', '-f', choices=['csv', 'jsonl'],
+                       help='Input format (default: from the file extension, CSV for stdin)')
+    parser.add_argument('--output', '-o', default='-',
+                       help='Output file; "-" or omitted writes stdout')
+    parser.add_argument('--output-format', choices=['jsonl', 'csv'], default='jsonl',
+                       help='Output format (default: jsonl)')
+    parser.add_argument('--unit', '-u', choices=UNITS, default='sura',
+                       help='What the query endpoints are (default: sura)')
+    parser.add_argument('--layout', default=None,
+                       help='Mushaf layout name (default: standard 604-page Mushaf)')
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                       help='Worker processes; output order is preserved (default: 1)')
+    parser.add_argument('--chunk-size', type=int, default=2000,
+                       help='Queries per worker task (default: 2000)')
+
+    args = parser.parse_args()
+
+    input_format = args.format or detect_format(None if args.input == '-' else args.input)
+    input_file = (sys.stdin if args.input == '-'
+                  else open(args.input, newline='', encoding='utf-8'))
+    output_file = (sys.stdout if args.output == '-'
+                   else open(args.output, 'w', newline='', encoding='utf-8'))
+
+    try:
+        reader = read_jsonl_queries if input_format == 'jsonl' else read_csv_queries
+        records = calculate_queries(reader(input_file), args.unit, args.layout,
+                                    args.workers, args.chunk_size)
+        writer = write_csv if args.output_format == 'csv' else write_jsonl
+        writer(records, output_file)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    except BrokenPipeError:
+        sys.exit(0)  # e.g. piped into head
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Benchmark Script for Quran Calculator
+Microbenchmarks for the calculator, validation and search hot paths, plus
+the import time of the calculator against a fixed budget
+
+Each case is calibrated to run for at least --min-time per repetition,
+then timed --repeats times with the garbage collector off (like timeit).
+Results keep every sample and the median, quartiles, mean and standard
+deviation per call, so two runs can be compared statistically.
+
+Usage:
+    python benchmark.py                                  # import-time budget check
+    python benchmark.py --runs 20 --budget-ms 15
+    python benchmark.py run                              # run the suite, write benchmarks/latest.json
+    python benchmark.py run --save benchmarks/baseline.json
+    python benchmark.py run --filter validate --repeats 30
+    python benchmark.py compare                          # latest.json against baseline.json
+    python benchmark.py compare old.json new.json --threshold 0.05
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# Budget for `import calculator` in a fresh interpreter (bytecode already compiled)
+IMPORT_TIME_BUDGET_MS = 15.0
+
+BENCHMARK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks")
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, "baseline.json")
+LATEST_PATH = os.path.join(BENCHMARK_DIR, "latest.json")
+DEFAULT_REPEATS = 15
+DEFAULT_MIN_TIME = 0.02  # Seconds per repetition
+DEFAULT_THRESHOLD = 0.10  # Median slowdown flagged as a regression
+RESULT_VERSION = 1
+
+
+def measure_import_time(module="calculator", runs=10):
+    """
+    Measure the cumulative import time of a module in fresh interpreters
+
+    Uses `python -X importtime`, so interpreter startup is not counted.
+
+    Returns:
+        list: Import time of each run in milliseconds
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    # Warm-up run so bytecode is compiled before timing
+    subprocess.run([sys.executable, "-c", f"import {module}"], cwd=base_dir, env=env, check=True)
+
+    timings = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=base_dir, env=env, capture_output=True, text=True, check=True
+        )
+        for line in completed.stderr.splitlines():
+            # Format: "import time: self | cumulative | name"
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                timings.append(int(parts[1].strip()) / 1000)
+    return timings
+
+
+def check_import_budget(runs=10, budget_ms=IMPORT_TIME_BUDGET_MS):
+    """Print the import time and return True if its median is within budget"""
+    timings = measure_import_time(runs=runs)
+    median = statistics.median(timings)
+
+    print(f"import calculator: median {median:.2f} ms, "
+          f"min {min(timings):.2f} ms, max {max(timings):.2f} ms ({runs} runs)")
+
+    if median <= budget_ms:
+        print(f"✓ Within the {budget_ms:.1f} ms budget")
+        return True
+    print(f"❌ Over the {budget_ms:.1f} ms budget")
+    return False
+
+
+def build_cases():
+    """
+    The benchmark cases, in report order
+
+    Calculator cases use an uncached calculator so they time the calculation
+    itself; "calculate.cached" times the default (cached) instance.
+
+    Returns:
+        dict: Case name to a zero-argument callable
+    """
+    from calculator import QuranCalculator, calculator
+    from validation import validator
+
+    uncached = QuranCalculator(cache_size=0)
+    calculator.calculate_ayahs_between_suras("Al-Fatiha", "An-Nas")  # Fill the cache entry
+
+    return {
+        "calculate.narrow": lambda: uncached.calculate_ayahs_between_suras("Al-Mulk", "Al-Qalam"),
+        "calculate.wide": lambda: uncached.calculate_ayahs_between_suras("Al-Fatiha", "An-Nas"),
+        "calculate.reverse": lambda: uncached.calculate_ayahs_between_suras("An-Nas", "Al-Baqarah"),
+        "calculate.cached": lambda: calculator.calculate_ayahs_between_suras("Al-Fatiha", "An-Nas"),
+        "sura_info": lambda: uncached.get_sura_info("Ya-Sin"),
+        "search.short": lambda: uncached.search_suras("al"),
+        "search.long": lambda: uncached.search_suras("baqarah"),
+        "validate.valid": lambda: validator.validate_sura_name("Al-Baqarah"),
+        "validate.typo": lambda: validator.validate_sura_name("Al-Bakarah"),
+        "validate.garbage": lambda: validator.validate_sura_name("xq7" * 40),
+        "autocomplete.prefix": lambda: validator.get_autocomplete_suggestions("al"),
+        "autocomplete.infix": lambda: validator.get_autocomplete_suggestions("rah"),
+    }
+
+
+def _time_loops(func, loops):
+    """Seconds taken by `loops` calls of func, with the garbage collector off"""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - started
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def time_case(func, repeats=DEFAULT_REPEATS, min_time=DEFAULT_MIN_TIME):
+    """
+    Time one case
+
+    The loop count is doubled until one repetition takes at least min_time
+    (this also warms caches), then each repetition gives one sample.
+
+    Returns:
+        tuple: (loops, samples) - calls per repetition and seconds per call
+    """
+    loops = 1
+    while _time_loops(func, loops) < min_time:
+        loops *= 2
+    return loops, [_time_loops(func, loops) / loops for _ in range(repeats)]
+
+
+def summarize_samples(samples):
+    """Median, quartiles, mean, stdev, min and max of a list of samples"""
+    ordered = sorted(samples)
+    if len(ordered) >= 2:
+        q1, _, q3 = statistics.quantiles(ordered, n=4, method="inclusive")
+        stdev = statistics.stdev(ordered)
+    else:
+        q1 = q3 = ordered[0]
+        stdev = 0.0
+    return {
+        "median": statistics.median(ordered),
+        "q1": q1,
+        "q3": q3,
+        "mean": statistics.fmean(ordered),
+        "stdev": stdev,
+        "min": ordered[0],
+        "max": ordered[-1]
+    }
+
+
+def run_suite(names=None, repeats=DEFAULT_REPEATS, min_time=DEFAULT_MIN_TIME, import_runs=10, report=print):
+    """
+    Run the benchmark suite
+
+    Args:
+        names (list): Substrings selecting cases (None runs all)
+        repeats (int): Samples per case
+        min_time (float): Minimum seconds per repetition
+        import_runs (int): Fresh interpreters for "import.calculator" (0 skips it)
+        report (callable): Called with one line per finished case
+
+    Returns:
+        dict: Results with environment info; times are seconds per call
+    """
+    cases = build_cases()
+    selected = [name for name in cases if not names or any(part in name for part in names)]
+
+    benchmarks = {}
+    for name in selected:
+        loops, samples = time_case(cases[name], repeats, min_time)
+        benchmarks[name] = {"loops": loops, "samples": samples, **summarize_samples(samples)}
+        report(_format_line(name, benchmarks[name]))
+
+    if import_runs and (not names or any(part in "import.calculator" for part in names)):
+        samples = [ms / 1000 for ms in measure_import_time(runs=import_runs)]
+        benchmarks["import.calculator"] = {"loops": 1, "samples": samples, **summarize_samples(samples)}
+        report(_format_line("import.calculator", benchmarks["import.calculator"]))
+
+    return {
+        "version": RESULT_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine()
+        },
+        "config": {"repeats": repeats, "min_time": min_time},
+        "benchmarks": benchmarks
+    }
+
+
+def _format_time(seconds):
+    """Human-readable duration"""
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    if seconds >= 1e-6:
+        return f"{seconds * 1e6:.2f} µs"
+    return f"{seconds * 1e9:.0f} ns"
+
+
+def _format_line(name, stats):
+    spread = (stats["q3"] - stats["q1"]) / stats["median"] * 100 if stats["median"] else 0.0
+    return f"{name:<22} {_format_time(stats['median']):>10}  (IQR ±{spread / 2:.1f}%, {len(stats['samples'])} samples)"
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two suite results case by case
+
+    A case is a regression when its median is more than threshold slower
+    than the baseline median and the interquartile ranges do not overlap
+    (current q1 above baseline q3), so noise alone is not flagged.
+    Improvements are detected the same way in the other direction.
+
+    Returns:
+        list: (name, baseline_median, current_median, ratio, status) tuples,
+              status being "regression", "improvement", "unchanged", "new" or "missing"
+    """
+    rows = []
+    old_cases, new_cases = baseline["benchmarks"], current["benchmarks"]
+    for name in list(old_cases) + [name for name in new_cases if name not in old_cases]:
+        old, new = old_cases.get(name), new_cases.get(name)
+        if old is None or new is None:
+            rows.append((name, old and old["median"], new and new["median"], None,
+                         "new" if old is None else "missing"))
+            continue
+        ratio = new["median"] / old["median"] if old["median"] else float("inf")
+        if ratio > 1 + threshold and new["q1"] > old["q3"]:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold) and new["q3"] < old["q1"]:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        rows.append((name, old["median"], new["median"], ratio, status))
+    return rows
+
+
+def print_comparison(rows):
+    """Print a comparison table; return the number of regressions"""
+    marks = {"regression": "❌", "improvement": "✓", "unchanged": " ", "new": "+", "missing": "-"}
+    print(f"  {'benchmark':<22} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, old, new, ratio, status in rows:
+        change = f"{(ratio - 1) * 100:+.1f}%" if ratio is not None else status
+        print(f"{marks[status]} {name:<22} {_format_time(old) if old else '-':>10} "
+              f"{_format_time(new) if new else '-':>10} {change:>8}")
+    return sum(1 for row in rows if row[4] == "regression")
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_results(results, path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+        file.write("\n")
+
+
+def main():
+    """Run the benchmarks"""
+    parser = argparse.ArgumentParser(description='Quran Calculator benchmarks')
+    parser.add_argument('--runs', type=int, default=10,
+                       help='Number of fresh interpreters to time (default: 10)')
+    parser.add_argument('--budget-ms', type=float, default=IMPORT_TIME_BUDGET_MS,
+                       help=f'Import time budget in ms (default: {IMPORT_TIME_BUDGET_MS})')
+    commands = parser.add_subparsers(dest='command')
+
+    run_parser = commands.add_parser('run', help='Run the microbenchmark suite')
+    run_parser.add_argument('--filter', '-k', action='append',
+                           help='Only cases whose name contains this text (repeatable)')
+    run_parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS,
+                           help=f'Samples per case (default: {DEFAULT_REPEATS})')
+    run_parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME,
+                           help=f'Minimum seconds per sample (default: {DEFAULT_MIN_TIME})')
+    run_parser.add_argument('--import-runs', type=int, default=10,
+                           help='Fresh interpreters for the import time case, 0 to skip (default: 10)')
+    run_parser.add_argument('--save', default=LATEST_PATH,
+                           help='Where to write the results (default: benchmarks/latest.json)')
+
+    compare_parser = commands.add_parser('compare', help='Compare two results files')
+    compare_parser.add_argument('baseline', nargs='?', default=BASELINE_PATH,
+                               help='Baseline results (default: benchmarks/baseline.json)')
+    compare_parser.add_argument('current', nargs='?', default=LATEST_PATH,
+                               help='Current results (default: benchmarks/latest.json)')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                               help=f'Median slowdown flagged as a regression (default: {DEFAULT_THRESHOLD})')
+
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        results = run_suite(args.filter, args.repeats, args.min_time, args.import_runs)
+        save_results(results, args.save)
+        print(f"✓ Results written to {args.save}")
+    elif args.command == 'compare':
+        try:
+            baseline, current = load_results(args.baseline), load_results(args.current)
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot read results: {e}")
+            sys.exit(2)
+        regressions = print_comparison(compare_results(baseline, current, args.threshold))
+        if regressions:
+            print(f"❌ {regressions} regression(s) over {args.threshold:.0%}")
+            sys.exit(1)
+        print("✓ No regressions")
+    elif not check_import_budget(args.runs, args.budget_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
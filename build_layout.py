@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Build a Mushaf layout data file
+Converts a CSV of (sura, ayah, page) rows into the compact .qlay format
+read by mushaf_layouts
+
+Usage:
+    python build_layout.py indopak_610.csv --name indopak_610 --pages 610
+    python build_layout.py --builtin --name madani_export
+"""
+
+import argparse
+import csv
+import os
+import sys
+
+from mushaf_layouts import LAYOUT_EXTENSION, LAYOUTS_DIR, get_layout, write_layout_file
+from quran_index import get_tables
+
+
+def read_pages_from_csv(path):
+    """Read a sura,ayah,page CSV (header optional) into a per-ayah page list"""
+    ayah_index = get_tables().ayah_index
+    pages = [None] * ayah_index.total_ayahs
+    
+    with open(path, newline="", encoding="utf-8") as csv_file:
+        for row in csv.reader(csv_file):
+            if not row or not row[0].strip().isdigit():
+                continue  # Skip header and blank lines
+            sura_num, ayah_num, page = (int(value) for value in row[:3])
+            if not ayah_index.is_valid_position(sura_num, ayah_num):
+                raise ValueError(f"Invalid ayah position {sura_num}:{ayah_num}")
+            pages[ayah_index.to_global(sura_num, ayah_num)] = page
+            
+    missing = [i for i, page in enumerate(pages) if page is None]
+    if missing:
+        sura_num, ayah_num = ayah_index.to_position(missing[0])
+        raise ValueError(f"{len(missing)} ayahs have no page, starting at {sura_num}:{ayah_num}")
+    return pages
+
+
+def main():
+    """Main function to build a layout file"""
+    parser = argparse.ArgumentParser(description='Build a Mushaf layout (.qlay) data file')
+    parser.add_argument('csv_file', nargs='?',
+                       help='CSV file with sura,ayah,page rows')
+    parser.add_argument('--name', '-n', required=True,
+                       help='Layout name (used as the file name and the layout= selector)')
+    parser.add_argument('--pages', type=int, default=None,
+                       help='Total pages in the Mushaf (default: last page in the data)')
+    parser.add_argument('--builtin', action='store_true',
+                       help='Export the built-in 604-page layout instead of reading a CSV')
+    parser.add_argument('--output-dir', default=LAYOUTS_DIR,
+                       help='Directory for the layout file (default: layouts/)')
+    
+    args = parser.parse_args()
+    
+    if args.builtin:
+        builtin = get_layout()
+        pages, page_count = list(builtin.page_of), builtin.page_count
+    elif args.csv_file:
+        pages, page_count = read_pages_from_csv(args.csv_file), args.pages
+    else:
+        parser.error("a CSV file or --builtin is required")
+        
+    os.makedirs(args.output_dir, exist_ok=True)
+    output_path = os.path.join(args.output_dir, args.name + LAYOUT_EXTENSION)
+    
+    try:
+        write_layout_file(output_path, pages, page_count)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+        
+    print(f"✓ Wrote {output_path} ({os.path.getsize(output_path)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
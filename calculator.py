@@ -3,18 +3,97 @@ Quran Calculator Module
 Handles calculations for ayahs between suras with actual page information
 """
 
-from quran_data import SURAS, get_sura_number_by_name, is_valid_sura_name
+from quran_data import SURAS, get_sura_number_by_name
+from quran_index import get_tables, parse_position
+import batch
+from mushaf_layouts import DEFAULT_LAYOUT, get_layout, on_layout_discarded
+from pair_matrix import PAIRS_PATH, PairMatrix
+from range_result import RangeResult
+from result_cache import DEFAULT_CACHE_SIZE, LRUCache, freeze
+from metrics import timed
+from search_index import search_sura_numbers
+
+
+# Arabic names for the division units used in result descriptions
+DIVISION_NAMES = {"juz": "الجزء", "hizb": "الحزب", "quarter": "الربع"}
 
 
 class QuranCalculator:
     """Calculator for Quran ayah calculations with actual page data"""
     
-    def __init__(self):
+    def __init__(self, cache_size=DEFAULT_CACHE_SIZE, cache_ttl=None):
+        """
+        Args:
+            cache_size (int): Maximum number of cached results (0 disables caching)
+            cache_ttl (float): Seconds a cached result stays valid (None for no expiry)
+        """
         self.suras = SURAS
         # Quran constants
         self.TOTAL_PAGES = 604  # Standard Mushaf pages
         self.TOTAL_AYAHS = 6236  # Total ayahs in Quran
         self.AVERAGE_AYAHS_PER_PAGE = self.TOTAL_AYAHS / self.TOTAL_PAGES  # ~10.3 ayahs per page
+        # Per-sura summaries, built once per layout on first use
+        self._summaries_by_layout = {}
+        # All-pairs matrix for the standard layout, see precompute_pairs()
+        self.pair_matrix = None
+        # Search result entries per sura, built on the first search
+        self._search_entries = None
+        # Results of repeated queries; set cache.enabled = False to bypass it
+        self.cache = LRUCache(cache_size, cache_ttl)
+        on_layout_discarded(self._discard_layout)
+    
+    def _discard_layout(self, name):
+        """Drop everything derived from a layout that was re-registered or unloaded"""
+        self._summaries_by_layout.pop(name, None)
+        self.cache.discard(lambda key: key[-1] == name)
+        if name == DEFAULT_LAYOUT:
+            self.pair_matrix = None
+    
+    # Index tables are loaded on first use so importing this module stays cheap
+    @property
+    def table(self):
+        return get_tables().sura_table
+    
+    @property
+    def ayah_index(self):
+        return get_tables().ayah_index
+    
+    @property
+    def division_index(self):
+        return get_tables().division_index
+    
+    def _sura_summaries(self, mushaf):
+        """Per-sura summary dicts for a layout; index 0 is padding so slices match sura numbers"""
+        summaries = self._summaries_by_layout.get(mushaf.name)
+        if summaries is None:
+            summaries = [None] + [
+                freeze(self._build_sura_summary(sura_num, mushaf))
+                for sura_num in range(1, self.table.count + 1)
+            ]
+            self._summaries_by_layout[mushaf.name] = summaries
+        return summaries
+    
+    def _build_sura_summary(self, sura_num, mushaf):
+        """Build the summary dict used in included_suras for one sura"""
+        sura_info = self.suras[sura_num]
+        return {
+            "number": sura_num,
+            "name": sura_info["name"],
+            "arabic": sura_info["arabic"],
+            "ayahs": sura_info["ayahs"],
+            "page_start": mushaf.sura_page_start(sura_num),
+            "page_end": None, # Simplified to None
+            "total_pages": 1
+        }
+    
+    def _layout_error(self, layout):
+        """Error result for an unknown layout name"""
+        return {
+            "success": False,
+            "error": f"'{layout}' is not a known Mushaf layout",
+            "total_ayahs": 0,
+            "total_pages": 0
+        }
     
     def get_page_range_for_sura(self, sura_num):
         """
@@ -35,21 +114,36 @@ class QuranCalculator:
         
         return start_page, None, 1
     
-    def calculate_page_range_between_suras(self, start_sura_num, end_sura_num):
+    def _sura_reference(self, sura_num, mushaf):
+        """Build the short sura dict used for range endpoints"""
+        sura_info = self.suras[sura_num]
+        return {
+            "number": sura_num,
+            "name": sura_info["name"],
+            "arabic": sura_info["arabic"],
+            "ayahs": sura_info["ayahs"],
+            "page_start": mushaf.sura_page_start(sura_num),
+            "page_end": None # Simplified to None
+        }
+    
+    def calculate_page_range_between_suras(self, start_sura_num, end_sura_num, layout=None):
         """
         Calculate the page range between two suras using page_start and page_end
         
         Args:
             start_sura_num (int): Starting sura number
             end_sura_num (int): Ending sura number
+            layout (str): Mushaf layout name (defaults to the standard Madani Mushaf)
             
         Returns:
-            dict: Page range information using start and end pages
+            dict: Page range information using start and end pages (an error dict for an unknown layout)
         """
-        start_page = self.suras[start_sura_num]["page_start"]
-        end_page = self.suras[end_sura_num]["page_end"]
-        # Calculate total pages from start of first sura to end of second sura
-        total_pages = abs(end_page - start_page) + 1
+        mushaf = get_layout(layout)
+        if mushaf is None:
+            return self._layout_error(layout)
+        
+        # Total pages from start of first sura to end of second sura
+        start_page, end_page, total_pages = mushaf.pages_between(start_sura_num, end_sura_num)
         
         return {
             "start_page": start_page,
@@ -57,7 +151,8 @@ class QuranCalculator:
             "total_pages": total_pages
         }
 
-    def calculate_ayahs_between_suras(self, sura1_name, sura2_name):
+    @timed("calculator.calculate_ayahs_between_suras")
+    def calculate_ayahs_between_suras(self, sura1_name, sura2_name, layout=None, fields=None):
         """
         Calculate the number of ayahs between two suras (inclusive) with actual page data
         Supports both forward and reverse calculation (e.g., from sura 15 to 5 or 5 to 15)
@@ -65,12 +160,21 @@ class QuranCalculator:
         Args:
             sura1_name (str): Name of the first sura
             sura2_name (str): Name of the second sura
+            layout (str): Mushaf layout name (defaults to the standard Madani Mushaf)
+            fields (list or str): Only return these keys (plus "success"), as a plain dict
+                                  (e.g. "total_ayahs,total_pages")
             
         Returns:
-            dict: Contains result, total_ayahs, actual page ranges, direction, and other details
+            RangeResult: Dict-like result with total_ayahs, actual page ranges, direction, and other
+            details (a plain dict when fields is given or on error)
         """
-        # Validate sura names
-        if not is_valid_sura_name(sura1_name):
+        mushaf = get_layout(layout)
+        if mushaf is None:
+            return self._layout_error(layout)
+        
+        # Resolve sura names through the precomputed name index (one lookup each)
+        sura1_num = get_sura_number_by_name(sura1_name)
+        if sura1_num is None:
             return {
                 "success": False,
                 "error": f"'{sura1_name}' is not a valid sura name",
@@ -78,7 +182,8 @@ class QuranCalculator:
                 "total_pages": 0
             }
         
-        if not is_valid_sura_name(sura2_name):
+        sura2_num = get_sura_number_by_name(sura2_name)
+        if sura2_num is None:
             return {
                 "success": False,
                 "error": f"'{sura2_name}' is not a valid sura name",
@@ -86,114 +191,469 @@ class QuranCalculator:
                 "total_pages": 0
             }
         
-        # Get sura numbers
+        # Keyed on the resolved numbers, so "Al-Fatiha", "1" and "الفاتحة" share an entry
+        cache_key = ("suras", sura1_num, sura2_num, mushaf.name)
+        result = self.cache.get(cache_key)
+        if result is None:
+            # Totals are computed now; descriptive sub-objects only when accessed
+            totals = None
+            if self.pair_matrix is not None and mushaf.name == DEFAULT_LAYOUT:
+                totals = self.pair_matrix.lookup(sura1_num, sura2_num)[:4]
+            result = self.cache.put(cache_key, RangeResult(self, mushaf, sura1_num, sura2_num, totals))
+        if fields is None:
+            return result
+        
+        if isinstance(fields, str):
+            fields = [field.strip() for field in fields.split(",") if field.strip()]
+        try:
+            return result.to_dict(fields)
+        except KeyError as e:
+            return {
+                "success": False,
+                "error": e.args[0],
+                "total_ayahs": 0,
+                "total_pages": 0
+            }
+    
+    def precompute_pairs(self, path=PAIRS_PATH):
+        """
+        Load (or build and cache on disk) the results of every sura pair, so
+        sura-to-sura queries on the standard layout become single table lookups
+        
+        Returns:
+            PairMatrix: The loaded matrix
+        """
+        if self.pair_matrix is None:
+            self.pair_matrix = PairMatrix.load_or_build(get_layout(), path)
+        return self.pair_matrix
+    
+    @timed("calculator.get_pair_payload")
+    def get_pair_payload(self, sura1_name, sura2_name):
+        """
+        Get the ready-to-serve JSON payload for a sura pair on the standard layout
+        
+        The payload is the full result (the same keys as
+        calculate_ayahs_between_suras(...).to_dict()), serialized once and
+        kept in the result cache.
+        
+        Args:
+            sura1_name (str): Name or number of the first sura
+            sura2_name (str): Name or number of the second sura
+            
+        Returns:
+            bytes: Compact JSON result, or None if either name is invalid
+        """
         sura1_num = get_sura_number_by_name(sura1_name)
         sura2_num = get_sura_number_by_name(sura2_name)
-        
-        # This shouldn't happen since we validated above, but handle it for safety
         if sura1_num is None or sura2_num is None:
+            return None
+        
+        cache_key = ("pair_payload", sura1_num, sura2_num, DEFAULT_LAYOUT)
+        payload = self.cache.get(cache_key)
+        if payload is None:
+            import json  # Kept out of module import, see benchmark.IMPORT_TIME_BUDGET_MS
+            self.precompute_pairs()
+            result = self.calculate_ayahs_between_suras(sura1_num, sura2_num)
+            payload = self.cache.put(cache_key, json.dumps(
+                result.to_dict(), ensure_ascii=False, separators=(",", ":")
+            ).encode())
+        return payload
+    
+    @timed("calculator.calculate_many")
+    def calculate_many(self, starts, ends, unit="sura", layout=None):
+        """
+        Calculate totals for many (start, end) pairs at once, vectorized with NumPy when available
+        
+        Args:
+            starts: Sequence or NumPy array of sura names/numbers, or ayah positions
+                    ((sura, ayah) pairs, "sura:ayah" strings or an (n, 2) integer array)
+            ends: Sequence of the same kind and length as starts
+            unit (str): "sura" for sura ranges or "ayah" for ayah positions
+            layout (str): Mushaf layout name (defaults to the standard Madani Mushaf)
+            
+        Returns:
+            dict: Columns valid, total_ayahs, total_pages, number_of_suras and is_forward.
+            Invalid names or positions are False in the valid mask instead of error dicts.
+        """
+        mushaf = get_layout(layout)
+        if mushaf is None:
+            return self._layout_error(layout)
+        
+        if unit not in batch.BATCH_UNITS or len(starts) != len(ends):
+            return {
+                "success": False,
+                "error": f"'{unit}' is not a valid batch unit" if unit not in batch.BATCH_UNITS
+                         else "starts and ends must have the same length",
+                "total_ayahs": 0,
+                "total_pages": 0
+            }
+        
+        return batch.calculate_many(starts, ends, mushaf, unit)
+    
+    def _position_summary(self, sura_num, ayah_num, mushaf):
+        """Build the summary dict for a single ayah position"""
+        sura_info = self.suras[sura_num]
+        return {
+            "sura": sura_num,
+            "ayah": ayah_num,
+            "name": sura_info["name"],
+            "arabic": sura_info["arabic"],
+            "page": mushaf.page_of[self.ayah_index.to_global(sura_num, ayah_num)],
+            "juz": self.ayah_index.juz(sura_num, ayah_num),
+            "reference": f"{sura_num}:{ayah_num}"
+        }
+    
+    @timed("calculator.calculate_ayahs_between_positions")
+    def calculate_ayahs_between_positions(self, position1, position2, layout=None):
+        """
+        Calculate the number of ayahs and pages between two ayah positions (inclusive)
+        Supports both forward and reverse order, e.g. "2:142" to "3:92"
+        
+        Args:
+            position1: First position as (sura, ayah), "sura:ayah" or "Sura-Name:ayah"
+            position2: Second position in the same formats
+            layout (str): Mushaf layout name (defaults to the standard Madani Mushaf)
+            
+        Returns:
+            dict: Contains result, total_ayahs, page range, juz range, direction and positions
+        """
+        mushaf = get_layout(layout)
+        if mushaf is None:
+            return self._layout_error(layout)
+        
+        first = parse_position(position1)
+        if first is None:
+            return {
+                "success": False,
+                "error": f"'{position1}' is not a valid ayah position",
+                "total_ayahs": 0,
+                "total_pages": 0
+            }
+        
+        second = parse_position(position2)
+        if second is None:
             return {
                 "success": False,
-                "error": "Could not find sura numbers",
+                "error": f"'{position2}' is not a valid ayah position",
                 "total_ayahs": 0,
                 "total_pages": 0
             }
         
-        # Determine calculation direction and order
-        is_forward = sura1_num < sura2_num
-        direction = "forward" if is_forward else "reverse"
+        # Global indexes are precomputed offsets, so no iteration is needed
+        first_index = self.ayah_index.to_global(*first)
+        second_index = self.ayah_index.to_global(*second)
+        
+        cache_key = ("ayahs", first_index, second_index, mushaf.name)
+        result = self.cache.get(cache_key)
+        if result is None:
+            result = self.cache.put(cache_key, freeze(
+                self._position_range(first, second, first_index, second_index, mushaf)
+            ))
+        return result
+    
+    def _position_range(self, first, second, first_index, second_index, mushaf):
+        """Build the result of calculate_ayahs_between_positions for validated positions"""
+        is_forward = first_index <= second_index
+        start_index, end_index = sorted((first_index, second_index))
+        start = self.ayah_index.to_position(start_index)
+        end = self.ayah_index.to_position(end_index)
+        
+        start_page = mushaf.page_of[start_index]
+        end_page = mushaf.page_of[end_index]
+        total_pages = end_page - start_page + 1
+        
+        if is_forward:
+            direction_description = f"من الآية {first[0]}:{first[1]} إلى الآية {second[0]}:{second[1]} (ترتيب أمامي)"
+        else:
+            direction_description = f"من الآية {first[0]}:{first[1]} إلى الآية {second[0]}:{second[1]} (ترتيب عكسي)"
+        
+        return {
+            "success": True,
+            "total_ayahs": end_index - start_index + 1,
+            "total_pages": total_pages,
+            "page_range": {
+                "start_page": start_page,
+                "end_page": end_page,
+                "total_pages": total_pages
+            },
+            "juz_range": {
+                "start_juz": self.ayah_index.juz_of[start_index],
+                "end_juz": self.ayah_index.juz_of[end_index]
+            },
+            "direction": "forward" if is_forward else "reverse",
+            "is_forward": is_forward,
+            "direction_description": direction_description,
+            "start_position": self._position_summary(*start, mushaf),
+            "end_position": self._position_summary(*end, mushaf),
+            "number_of_suras": end[0] - start[0] + 1
+        }
+    
+    @timed("calculator.get_page_contents")
+    def get_page_contents(self, page, layout=None):
+        """
+        Find what is printed on a Mushaf page
+        
+        Args:
+            page (int): Page number
+            layout (str): Mushaf layout name (defaults to the standard Madani Mushaf)
+            
+        Returns:
+            dict: First and last ayah on the page, the suras it touches and its ayah count
+        """
+        mushaf = get_layout(layout)
+        if mushaf is None:
+            return self._layout_error(layout)
+        
+        if not mushaf.page_index.is_valid_page(page):
+            return {
+                "success": False,
+                "error": f"'{page}' is not a valid page number",
+                "total_ayahs": 0
+            }
+        
+        return self.get_suras_in_pages(page, page, mushaf.name)
+    
+    @timed("calculator.get_suras_in_pages")
+    def get_suras_in_pages(self, start_page, end_page, layout=None):
+        """
+        Find the suras and ayahs covered by a range of Mushaf pages (inclusive)
+        
+        Args:
+            start_page (int): First page of the range
+            end_page (int): Last page of the range
+            layout (str): Mushaf layout name (defaults to the standard Madani Mushaf)
+            
+        Returns:
+            dict: First and last ayah, included suras and total ayahs for the pages
+        """
+        mushaf = get_layout(layout)
+        if mushaf is None:
+            return self._layout_error(layout)
+        
+        for page in (start_page, end_page):
+            if not mushaf.page_index.is_valid_page(page):
+                return {
+                    "success": False,
+                    "error": f"'{page}' is not a valid page number",
+                    "total_ayahs": 0
+                }
         
-        # For calculation purposes, always use the correct chronological order
-        start_sura = min(sura1_num, sura2_num)
-        end_sura = max(sura1_num, sura2_num)
+        start_page, end_page = sorted((start_page, end_page))
+        cache_key = ("pages", start_page, end_page, mushaf.name)
+        result = self.cache.get(cache_key)
+        if result is None:
+            result = self.cache.put(cache_key, freeze(self._page_range(start_page, end_page, mushaf)))
+        return result
+    
+    def _page_range(self, start_page, end_page, mushaf):
+        """Build the result of get_suras_in_pages for a validated, ordered page range"""
+        span = mushaf.page_index.ayah_span(start_page, end_page)
+        if span is None:
+            return {
+                "success": False,
+                "error": f"No ayahs found on pages {start_page}-{end_page}",
+                "total_ayahs": 0
+            }
         
-        # Calculate total ayahs and collect sura information
-        total_ayahs = 0
-        included_suras = []
+        first_index, last_index = span
+        first_sura, first_ayah = self.ayah_index.to_position(first_index)
+        last_sura, last_ayah = self.ayah_index.to_position(last_index)
         
-        for sura_num in range(start_sura, end_sura + 1):
-            sura_info = self.suras[sura_num]
-            sura_ayahs = sura_info["ayahs"]
-            start_page, _, sura_pages = self.get_page_range_for_sura(sura_num)
+        return {
+            "success": True,
+            "start_page": start_page,
+            "end_page": end_page,
+            "total_pages": end_page - start_page + 1,
+            "total_ayahs": last_index - first_index + 1,
+            "first_ayah": self._position_summary(first_sura, first_ayah, mushaf),
+            "last_ayah": self._position_summary(last_sura, last_ayah, mushaf),
+            "included_suras": self._sura_summaries(mushaf)[first_sura:last_sura + 1],
+            "number_of_suras": last_sura - first_sura + 1
+        }
+    
+    @timed("calculator.calculate_ayahs_between_divisions")
+    def calculate_ayahs_between_divisions(self, first, second, unit="juz", layout=None):
+        """
+        Calculate ayahs and pages between two juz, hizb or quarter divisions (inclusive)
+        Returns the same result shape as calculate_ayahs_between_suras
+        
+        Args:
+            first (int): Number of the first division
+            second (int): Number of the second division
+            unit (str): "juz" (1-30), "hizb" (1-60) or "quarter" (1-240)
+            layout (str): Mushaf layout name (defaults to the standard Madani Mushaf)
             
-            total_ayahs += sura_ayahs
-            included_suras.append({
-                "number": sura_num,
-                "name": sura_info["name"],
-                "arabic": sura_info["arabic"],
-                "ayahs": sura_ayahs,
-                "page_start": start_page,
-                "page_end": None, # Simplified to None
-                "total_pages": sura_pages
-            })
+        Returns:
+            dict: Contains result, total_ayahs, page ranges, direction, suras and division details
+        """
+        mushaf = get_layout(layout)
+        if mushaf is None:
+            return self._layout_error(layout)
+        
+        if unit not in DIVISION_NAMES:
+            return {
+                "success": False,
+                "error": f"'{unit}' is not a valid division unit",
+                "total_ayahs": 0,
+                "total_pages": 0
+            }
+        
+        for number in (first, second):
+            if not self.division_index.is_valid_number(unit, number):
+                return {
+                    "success": False,
+                    "error": f"'{number}' is not a valid {unit} number",
+                    "total_ayahs": 0,
+                    "total_pages": 0
+                }
+        
+        cache_key = (unit, first, second, mushaf.name)
+        result = self.cache.get(cache_key)
+        if result is None:
+            result = self.cache.put(cache_key, freeze(self._division_range(first, second, unit, mushaf)))
+        return result
+    
+    def _division_range(self, first, second, unit, mushaf):
+        """Build the result of calculate_ayahs_between_divisions for validated divisions"""
+        is_forward = first < second
+        start, end = sorted((first, second))
+        start_index, end_index = self.division_index.ayah_span(unit, start, end)
+        start_sura, start_ayah = self.ayah_index.to_position(start_index)
+        end_sura, end_ayah = self.ayah_index.to_position(end_index)
+        first_sura = self.ayah_index.sura_of[self.division_index.ayah_span(unit, first, first)[0]]
+        second_sura = self.ayah_index.sura_of[self.division_index.ayah_span(unit, second, second)[0]]
         
-        # Calculate actual page range for the entire range
-        page_range = self.calculate_page_range_between_suras(start_sura, end_sura)
+        start_page = mushaf.page_of[start_index]
+        end_page = mushaf.page_of[end_index]
+        total_pages = end_page - start_page + 1
+        included_suras = self._sura_summaries(mushaf)[start_sura:end_sura + 1]
         
-        # Create direction-aware description
+        unit_name = DIVISION_NAMES[unit]
         if is_forward:
-            direction_description = f"من السورة {sura1_num} إلى السورة {sura2_num} (ترتيب أمامي)"
+            direction_description = f"من {unit_name} {first} إلى {unit_name} {second} (ترتيب أمامي)"
         else:
-            direction_description = f"من السورة {sura1_num} إلى السورة {sura2_num} (ترتيب عكسي)"
+            direction_description = f"من {unit_name} {first} إلى {unit_name} {second} (ترتيب عكسي)"
         
         return {
             "success": True,
-            "total_ayahs": total_ayahs,
-            "total_pages": page_range["total_pages"],
-            "page_range": page_range,
-            "direction": direction,
+            "unit": unit,
+            "total_ayahs": end_index - start_index + 1,
+            "total_pages": total_pages,
+            "page_range": {
+                "start_page": start_page,
+                "end_page": end_page,
+                "total_pages": total_pages
+            },
+            "direction": "forward" if is_forward else "reverse",
             "is_forward": is_forward,
             "direction_description": direction_description,
             "original_order": {
-                "first_sura": sura1_num,
-                "second_sura": sura2_num
+                "first_sura": first_sura,
+                "second_sura": second_sura
             },
             "calculation_order": {
                 "start_sura": start_sura,
                 "end_sura": end_sura
             },
-            "start_sura": {
-                "number": start_sura,
-                "name": self.suras[start_sura]["name"],
-                "arabic": self.suras[start_sura]["arabic"],
-                "ayahs": self.suras[start_sura]["ayahs"],
-                "page_start": self.suras[start_sura]["page_start"],
-                "page_end": None # Simplified to None
-            },
-            "end_sura": {
-                "number": end_sura,
-                "name": self.suras[end_sura]["name"],
-                "arabic": self.suras[end_sura]["arabic"],
-                "ayahs": self.suras[end_sura]["ayahs"],
-                "page_start": self.suras[end_sura]["page_start"],
-                "page_end": None # Simplified to None
-            },
-            "first_selected_sura": {
-                "number": sura1_num,
-                "name": self.suras[sura1_num]["name"],
-                "arabic": self.suras[sura1_num]["arabic"],
-                "ayahs": self.suras[sura1_num]["ayahs"],
-                "page_start": self.suras[sura1_num]["page_start"],
-                "page_end": None # Simplified to None
-            },
-            "second_selected_sura": {
-                "number": sura2_num,
-                "name": self.suras[sura2_num]["name"],
-                "arabic": self.suras[sura2_num]["arabic"],
-                "ayahs": self.suras[sura2_num]["ayahs"],
-                "page_start": self.suras[sura2_num]["page_start"],
-                "page_end": None # Simplified to None
+            "division_range": {
+                "first": first,
+                "second": second,
+                "start": start,
+                "end": end
             },
+            "start_position": self._position_summary(start_sura, start_ayah, mushaf),
+            "end_position": self._position_summary(end_sura, end_ayah, mushaf),
+            "start_sura": self._sura_reference(start_sura, mushaf),
+            "end_sura": self._sura_reference(end_sura, mushaf),
+            "first_selected_sura": self._sura_reference(first_sura, mushaf),
+            "second_selected_sura": self._sura_reference(second_sura, mushaf),
             "included_suras": included_suras,
             "number_of_suras": len(included_suras),
             "page_info": {
-                "total_pages": page_range["total_pages"],
-                "start_page": page_range["start_page"],
-                "end_page": page_range["end_page"],
-                "total_quran_pages": self.TOTAL_PAGES,
-                "calculation_method": "الصفحات الأولى للسور من المصحف القياسي"
+                "total_pages": total_pages,
+                "start_page": start_page,
+                "end_page": end_page,
+                "total_quran_pages": mushaf.page_count,
+                "calculation_method": f"حدود {unit_name} في المصحف القياسي"
+            }
+        }
+    
+    @timed("calculator.find_division")
+    def find_division(self, position, unit="juz", layout=None):
+        """
+        Find the juz, hizb or quarter that contains an ayah position
+        
+        Args:
+            position: Ayah position as (sura, ayah), "sura:ayah" or "Sura-Name:ayah"
+            unit (str): "juz", "hizb" or "quarter"
+            layout (str): Mushaf layout name used for page numbers
+            
+        Returns:
+            dict: Division number and its first and last ayah
+        """
+        mushaf = get_layout(layout)
+        if mushaf is None:
+            return self._layout_error(layout)
+        
+        parsed = parse_position(position)
+        if parsed is None or unit not in DIVISION_NAMES:
+            return {
+                "success": False,
+                "error": f"'{position}' is not a valid ayah position" if parsed is None
+                         else f"'{unit}' is not a valid division unit"
+            }
+        
+        number = self.division_index.division_of(unit, self.ayah_index.to_global(*parsed))
+        start_index, end_index = self.division_index.ayah_span(unit, number, number)
+        return {
+            "success": True,
+            "unit": unit,
+            "number": number,
+            "start_position": self._position_summary(*self.ayah_index.to_position(start_index), mushaf),
+            "end_position": self._position_summary(*self.ayah_index.to_position(end_index), mushaf)
+        }
+    
+    @timed("calculator.next_division_boundary")
+    def next_division_boundary(self, position, unit="quarter", layout=None):
+        """
+        Find the next juz, hizb or quarter boundary after an ayah position
+        
+        Args:
+            position: Ayah position as (sura, ayah), "sura:ayah" or "Sura-Name:ayah"
+            unit (str): "juz", "hizb" or "quarter"
+            layout (str): Mushaf layout name used for page numbers
+            
+        Returns:
+            dict: Number and first ayah of the next division, or an error at the end of the Quran
+        """
+        mushaf = get_layout(layout)
+        if mushaf is None:
+            return self._layout_error(layout)
+        
+        parsed = parse_position(position)
+        if parsed is None or unit not in DIVISION_NAMES:
+            return {
+                "success": False,
+                "error": f"'{position}' is not a valid ayah position" if parsed is None
+                         else f"'{unit}' is not a valid division unit"
             }
+        
+        boundary = self.division_index.next_boundary(unit, self.ayah_index.to_global(*parsed))
+        if boundary is None:
+            return {
+                "success": False,
+                "error": f"No {unit} boundary after {parsed[0]}:{parsed[1]}"
+            }
+        
+        number, start_index = boundary
+        return {
+            "success": True,
+            "unit": unit,
+            "number": number,
+            "start_position": self._position_summary(*self.ayah_index.to_position(start_index), mushaf)
         }
+    
+    @timed("calculator.get_sura_info")
     def get_sura_info(self, sura_name):
         """Get detailed information about a sura including Arabic name and page info"""
         sura_num = get_sura_number_by_name(sura_name)
@@ -211,21 +671,30 @@ class QuranCalculator:
             }
         return None
     
-    def search_suras(self, query):
-        """Search for suras by name (for autocomplete) including Arabic names"""
-        query = query.lower()
-        matches = []
+    @timed("calculator.search_suras")
+    def search_suras(self, query, limit=None):
+        """
+        Search for suras by English or Arabic name (for autocomplete)
         
-        for num, sura in self.suras.items():
-            if query in sura["name"].lower():
-                matches.append({
+        Args:
+            query (str): Part of a sura name
+            limit (int): Maximum number of matches (None for all)
+            
+        Returns:
+            list: Match dicts, names starting with the query first, then by sura number
+        """
+        entries = self._search_entries
+        if entries is None:
+            entries = self._search_entries = [None] + [
+                freeze({
                     "number": num,
                     "name": sura["name"],
                     "arabic": sura["arabic"],
                     "ayahs": sura["ayahs"]
                 })
-        
-        return sorted(matches, key=lambda x: x["number"])
+                for num, sura in self.suras.items()
+            ]
+        return [entries[num] for num in search_sura_numbers(query, limit)]
 
 
 # Create a global calculator instance
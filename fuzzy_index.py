@@ -0,0 +1,157 @@
+"""
+Fuzzy Index Module
+Trigram index with bit-parallel edit distance for "did you mean" sura suggestions
+
+Every spelling in the sura name index (names, Arabic names, aliases and
+article-free forms) is indexed by its character trigrams. A query counts
+shared trigrams through the postings, keeps the MAX_CANDIDATES keys with the
+highest trigram overlap and ranks only those by exact Levenshtein distance
+(Myers' bit-vector algorithm, one pass over each candidate). Inputs are
+capped in length, so the cost of a junk string is bounded no matter how
+long it is. Matching works on characters, so Arabic-script input is
+handled the same way as transliterations.
+"""
+
+from collections import Counter
+from heapq import nsmallest
+
+from quran_data import SURAS, get_name_index, normalize_sura_name
+
+MAX_INPUT_LENGTH = 64  # Longer inputs get no suggestions
+MAX_CANDIDATES = 16  # Keys ranked by edit distance per query
+DEFAULT_CUTOFF = 0.6  # Minimum similarity, 1 - distance / longer length
+
+
+def trigrams(key):
+    """Set of character trigrams of a normalized key, padded so short keys and word edges count"""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def pattern_masks(pattern):
+    """Bit mask of the positions of each character in a pattern (for edit_distance)"""
+    masks = {}
+    for position, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def edit_distance(masks, length, text):
+    """
+    Levenshtein distance between a pattern and a text (Myers/Hyyrö bit-vector algorithm)
+
+    Args:
+        masks (dict): pattern_masks() of the pattern
+        length (int): Length of the pattern (at least 1)
+        text (str): Text to compare with
+
+    Returns:
+        int: Edit distance
+    """
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    positive, negative, score = full, 0, length
+    for char in text:
+        equal = masks.get(char, 0)
+        vertical = equal | negative
+        horizontal = (((equal & positive) + positive) ^ positive) | equal
+        horizontal_positive = negative | (~(horizontal | positive) & full)
+        horizontal_negative = positive & horizontal
+        if horizontal_positive & last:
+            score += 1
+        elif horizontal_negative & last:
+            score -= 1
+        horizontal_positive = ((horizontal_positive << 1) | 1) & full
+        horizontal_negative = (horizontal_negative << 1) & full
+        positive = horizontal_negative | (~(vertical | horizontal_positive) & full)
+        negative = horizontal_positive & vertical
+    return score
+
+
+class FuzzyIndex:
+    """Trigram postings over normalized sura spellings"""
+
+    def __init__(self, name_index=None):
+        """
+        Args:
+            name_index (dict): Normalized spelling -> sura number (default: quran_data's index)
+        """
+        name_index = get_name_index() if name_index is None else name_index
+        # Numbers are valid input but not useful suggestions
+        self.keys = [key for key in name_index if not key.isdigit()]
+        self.numbers = [name_index[key] for key in self.keys]
+        self.trigram_counts = [len(trigrams(key)) for key in self.keys]
+        self.max_key_length = max(len(key) for key in self.keys)
+
+        self.postings = {}  # trigram -> list of key ids
+        for key_id, key in enumerate(self.keys):
+            for gram in trigrams(key):
+                self.postings.setdefault(gram, []).append(key_id)
+
+    def search(self, name, limit=3, cutoff=DEFAULT_CUTOFF):
+        """
+        Find the suras whose spellings are closest to a misspelled name
+
+        Args:
+            name (str): User input
+            limit (int): Maximum number of suras
+            cutoff (float): Minimum similarity between 0 and 1
+
+        Returns:
+            list: (sura number, similarity) tuples, best first, one per sura
+        """
+        if len(name) > MAX_INPUT_LENGTH:
+            return []
+        query = normalize_sura_name(name)
+        # A key shorter than cutoff * len(query) cannot reach the cutoff
+        if not query or len(query) * cutoff > self.max_key_length:
+            return []
+
+        query_grams = trigrams(query)
+        shared = Counter()
+        for gram in query_grams:
+            shared.update(self.postings.get(gram, ()))
+
+        # Best trigram overlap (Dice coefficient) first
+        query_count = len(query_grams)
+        trigram_counts = self.trigram_counts
+        overlap = {key_id: count / (query_count + trigram_counts[key_id])
+                   for key_id, count in shared.items()}
+        candidates = nsmallest(MAX_CANDIDATES, overlap, key=lambda key_id: (-overlap[key_id], key_id))
+
+        masks = pattern_masks(query)
+        best = {}  # sura number -> (similarity, trigram overlap)
+        for key_id in candidates:
+            key = self.keys[key_id]
+            if len(query) < len(key) * cutoff or len(key) < len(query) * cutoff:
+                continue  # The length difference alone is below the cutoff
+            similarity = 1 - edit_distance(masks, len(query), key) / max(len(query), len(key))
+            if similarity < cutoff:
+                continue
+            score = (similarity, overlap[key_id])
+            number = self.numbers[key_id]
+            if number not in best or score > best[number]:
+                best[number] = score
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], -item[1][1], item[0]))
+        return [(number, round(score[0], 3)) for number, score in ranked[:limit]]
+
+    def suggest(self, name, limit=3, cutoff=DEFAULT_CUTOFF):
+        """
+        Suggested sura names for a misspelled name
+
+        Returns:
+            list: Canonical (English) sura names, best first
+        """
+        return [SURAS[number]["name"] for number, _ in self.search(name, limit, cutoff)]
+
+
+_fuzzy_index = None
+
+
+def get_fuzzy_index():
+    """Return the shared fuzzy index, building it on first use"""
+    global _fuzzy_index
+    if _fuzzy_index is None:
+        _fuzzy_index = FuzzyIndex()
+    return _fuzzy_index
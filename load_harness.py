@@ -0,0 +1,646 @@
+#!/usr/bin/env python3
+"""
+Load Test for the Quran Calculator Web App
+Starts the NiceGUI app locally and drives many simulated clients against it
+
+Each client keeps its own HTTP connection and loops over a weighted mix of
+operations until the time is up:
+    range     GET /api/range between two random suras
+    ayah      GET /api/ayah-range between two ayah positions
+    search    GET /api/search with a short name fragment
+    page      GET /api/pages for one page or a page range
+    ui        GET / (builds a client page), join its NiceGUI websocket, pick
+              two suras in the selects and click the calculate button over
+              the socket, then wait for the result update (calculate_ayahs,
+              display_result and the fragment cache run in the server)
+
+Throughput, p50/p95/p99 latency and error rate are reported per operation,
+with the server RSS sampled during the run. Results are written as JSON so
+runs can be compared before and after a change.
+
+Usage:
+    python load_harness.py
+    python load_harness.py --clients 200 --duration 60 --output after.json
+    python load_harness.py --url http://127.0.0.1:8080 --mix range=5,search=3,ui=1
+    python load_harness.py --api-only --no-websocket
+"""
+
+import argparse
+import base64
+import http.client
+import json
+import os
+import platform
+import random
+import re
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from urllib.parse import urlencode, urlsplit
+
+from quran_data import SURAS
+
+DEFAULT_MIX = {"range": 40, "ayah": 10, "search": 25, "page": 15, "ui": 10}
+SEARCH_TERMS = ("al", "baq", "an", "ya", "mul", "kah", "fat", "ra", "nas", "imr", "ma", "yu")
+WEBSOCKET_PATH = "/_nicegui_ws/socket.io/"
+SERVER_START_TIMEOUT = 30.0
+RESULT_MARKER = "result-total"  # CSS class of the result summary in the update message
+RSS_SAMPLE_INTERVAL = 0.5
+
+_CLIENT_ID_PATTERN = re.compile(
+    r'client_?id\W{1,8}([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})', re.IGNORECASE
+)
+_ELEMENTS_PATTERN = re.compile(r'parseElements\(\s*String\.raw`')
+_ELEMENTS_ENTITIES = (("&#36;", "$"), ("&#96;", "`"), ("&gt;", ">"), ("&lt;", "<"), ("&amp;", "&"))
+
+
+def parse_mix(text):
+    """
+    Parse an operation mix like "range=5,search=3,ui=1"
+
+    Returns:
+        dict: Operation name to relative weight
+    """
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"Unknown operation '{name}' (choose from {', '.join(DEFAULT_MIX)})")
+        mix[name] = float(weight) if weight else 1.0
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("The operation mix needs at least one positive weight")
+    return mix
+
+
+def make_request(operation, rng):
+    """
+    Pick the request path for one API operation
+
+    Returns:
+        str: Path with query string
+    """
+    if operation == "range":
+        first, second = rng.randint(1, 114), rng.randint(1, 114)
+        return "/api/range?" + urlencode({"first": SURAS[first]["name"], "second": second})
+    if operation == "ayah":
+        start_sura, end_sura = sorted((rng.randint(1, 114), rng.randint(1, 114)))
+        start = f"{start_sura}:{rng.randint(1, SURAS[start_sura]['ayahs'])}"
+        end = f"{end_sura}:{rng.randint(1, SURAS[end_sura]['ayahs'])}"
+        return "/api/ayah-range?" + urlencode({"start": start, "end": end})
+    if operation == "search":
+        return "/api/search?" + urlencode({"q": rng.choice(SEARCH_TERMS), "limit": 10})
+    if operation == "page":
+        start = rng.randint(1, 604)
+        if rng.random() < 0.5:
+            return f"/api/pages?start={start}"
+        return f"/api/pages?start={start}&end={min(604, start + rng.randint(1, 20))}"
+    raise ValueError(f"'{operation}' is not an API operation")
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, int(round(fraction * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies, errors, elapsed):
+    """
+    Reduce raw samples to throughput, latency percentiles and error rate
+
+    Args:
+        latencies (list): Seconds per successful request
+        errors (int): Failed requests
+        elapsed (float): Measured wall time in seconds
+
+    Returns:
+        dict: Requests, errors, rates and latencies in milliseconds
+    """
+    latencies = sorted(latencies)
+    requests = len(latencies) + errors
+
+    def ms(value):
+        return None if value is None else round(value * 1000, 3)
+
+    return {
+        "requests": requests,
+        "errors": errors,
+        "error_rate": round(errors / requests, 6) if requests else 0.0,
+        "throughput_rps": round(requests / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "mean": ms(sum(latencies) / len(latencies)) if latencies else None,
+            "p50": ms(percentile(latencies, 0.50)),
+            "p95": ms(percentile(latencies, 0.95)),
+            "p99": ms(percentile(latencies, 0.99)),
+            "max": ms(latencies[-1]) if latencies else None
+        }
+    }
+
+
+def read_rss(pid):
+    """Resident set size of a process in bytes, or None if it cannot be read"""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import psutil  # Optional, for platforms without /proc
+    except ImportError:
+        return None
+    try:
+        return psutil.Process(pid).memory_info().rss
+    except psutil.Error:
+        return None
+
+
+class RssSampler(threading.Thread):
+    """Samples the RSS of the server process in the background"""
+
+    def __init__(self, pid, interval=RSS_SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.is_set():
+            rss = read_rss(self.pid)
+            if rss is not None:
+                self.samples.append(rss)
+            self._stopped.wait(self.interval)
+
+    def stop(self):
+        """Stop sampling and return a summary in MB"""
+        self._stopped.set()
+        self.join()
+        if not self.samples:
+            return None
+        mb = 1024 * 1024
+        return {
+            "start_mb": round(self.samples[0] / mb, 1),
+            "peak_mb": round(max(self.samples) / mb, 1),
+            "end_mb": round(self.samples[-1] / mb, 1)
+        }
+
+
+class WebSocket:
+    """Minimal client side of RFC 6455, enough for NiceGUI's socket.io handshake and events"""
+
+    def __init__(self, host, port, path, timeout):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        key = base64.b64encode(os.urandom(16)).decode()
+        self.sock.sendall((
+            f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\n"
+            f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n"
+        ).encode())
+        response = b""
+        while b"\r\n\r\n" not in response:
+            chunk = self.sock.recv(4096)
+            if not chunk:
+                raise ConnectionError("Connection closed during websocket upgrade")
+            response += chunk
+        head, _, self._buffer = response.partition(b"\r\n\r\n")
+        if not head.startswith(b"HTTP/1.1 101"):
+            raise ConnectionError(f"Websocket upgrade refused: {head.splitlines()[0].decode(errors='replace')}")
+
+    def _read(self, size):
+        while len(self._buffer) < size:
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("Websocket closed by the server")
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def send(self, text, opcode=0x1):
+        """Send a masked text (or control) frame"""
+        payload = text.encode() if isinstance(text, str) else text
+        header = bytes([0x80 | opcode])
+        if len(payload) < 126:
+            header += bytes([0x80 | len(payload)])
+        elif len(payload) < 65536:
+            header += bytes([0x80 | 126]) + struct.pack("!H", len(payload))
+        else:
+            header += bytes([0x80 | 127]) + struct.pack("!Q", len(payload))
+        mask = os.urandom(4)
+        masked = bytes(byte ^ mask[i % 4] for i, byte in enumerate(payload))
+        self.sock.sendall(header + mask + masked)
+
+    def receive(self):
+        """Return the next text message, answering pings on the way"""
+        while True:
+            first, second = self._read(2)
+            opcode, length = first & 0x0F, second & 0x7F
+            if length == 126:
+                length = struct.unpack("!H", self._read(2))[0]
+            elif length == 127:
+                length = struct.unpack("!Q", self._read(8))[0]
+            payload = self._read(length)
+            if opcode == 0x8:
+                raise ConnectionError("Websocket closed by the server")
+            if opcode == 0x9:
+                self.send(payload, opcode=0xA)
+            elif opcode == 0x1:
+                return payload.decode()
+
+    def close(self):
+        try:
+            self.send(b"", opcode=0x8)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+def find_page_elements(html):
+    """
+    The element tree NiceGUI embeds in a page
+
+    The page boots with createApp(parseElements(String.raw`{...}`)), where the
+    JSON has $, `, >, < and & escaped as HTML entities.
+
+    Returns:
+        dict: Element id (a string key) to element dict (tag, props, events, ...),
+              or None if not found
+    """
+    match = _ELEMENTS_PATTERN.search(html)
+    if match is None:
+        return None
+    end = html.find("`", match.end())
+    if end < 0:
+        return None
+    raw = html[match.end():end]
+    for entity, char in _ELEMENTS_ENTITIES:
+        raw = raw.replace(entity, char)
+    try:
+        elements = json.loads(raw)
+    except ValueError:
+        return None
+    if isinstance(elements, dict) and all(isinstance(element, dict) for element in elements.values()):
+        return elements
+    return None
+
+
+def _listeners(elements, event_type):
+    """(element id, element, listener id) for an event type, in element (creation) order"""
+    found = []
+    for element_id in sorted(elements, key=int):
+        element = elements[element_id]
+        for listener in element.get("events") or ():
+            if listener.get("type") == event_type:
+                found.append((int(element_id), element, listener["listener_id"]))
+    return found
+
+
+def calculation_events(elements, client_id, rng):
+    """
+    Socket.io messages that calculate a random sura range on a calculator page
+
+    The first two selects get a random option each (different suras) and the
+    first button (the calculate button) is clicked, as a user would.
+
+    Returns:
+        list: Encoded socket.io event packets, in the order to send them
+    """
+    selects = [listener for listener in _listeners(elements, "update:modelValue")
+               if listener[1].get("props", {}).get("options")]
+    buttons = _listeners(elements, "click")
+    if len(selects) < 2 or not buttons:
+        raise ConnectionError("Sura selects or calculate button not found in the page")
+
+    packets = []
+    options = selects[0][1]["props"]["options"]
+    for (element_id, element, listener_id), index in zip(selects, rng.sample(range(len(options)), 2)):
+        option = element["props"]["options"][index]
+        packets.append(_event_packet(element_id, listener_id, client_id, [option]))
+    element_id, _, listener_id = buttons[0]
+    packets.append(_event_packet(element_id, listener_id, client_id, []))
+    return packets
+
+
+def _event_packet(element_id, listener_id, client_id, args):
+    """A socket.io "event" packet as sent by the NiceGUI browser client (each argument JSON-encoded)"""
+    message = {
+        "id": element_id,
+        "client_id": client_id,
+        "listener_id": listener_id,
+        "args": [json.dumps(arg, ensure_ascii=False) for arg in args]
+    }
+    return "42" + json.dumps(["event", message], ensure_ascii=False, separators=(",", ":"))
+
+
+def _handshake_packet(client_id):
+    """The socket.io "handshake" packet (with ack id 0) that attaches the socket to a client"""
+    message = {
+        "client_id": client_id,
+        "document_id": str(uuid.uuid4()),
+        "tab_id": str(uuid.uuid4()),
+        "old_tab_id": None,
+        "next_message_id": 0
+    }
+    return "420" + json.dumps(["handshake", message], separators=(",", ":"))
+
+
+def open_ui_session(host, port, connection, timeout, websocket=True, rng=None):
+    """
+    Load the calculator page, join its NiceGUI websocket and calculate once
+
+    The page request makes the server build a per-client page. After the
+    socket.io connect, the handshake attaches the socket to that client (the
+    server only accepts events afterwards). The two selects are then changed
+    and the calculate button clicked through socket.io events, and the
+    session ends when the update carrying the rendered result arrives.
+    """
+    connection.request("GET", "/")
+    response = connection.getresponse()
+    html = response.read().decode(errors="replace")
+    if response.status != 200:
+        raise ConnectionError(f"GET / returned {response.status}")
+    if not websocket:
+        return
+
+    match = _CLIENT_ID_PATTERN.search(html)
+    if match is None:
+        raise ConnectionError("No client id in the page")
+    client_id = match.group(1)
+    elements = find_page_elements(html)
+    if elements is None:
+        raise ConnectionError("No element tree in the page")
+    events = calculation_events(elements, client_id, rng or random.Random())
+    query = urlencode({"client_id": client_id, "EIO": 4, "transport": "websocket"})
+    ws = WebSocket(host, port, f"{WEBSOCKET_PATH}?{query}", timeout)
+    try:
+        if not ws.receive().startswith("0"):  # engine.io open packet
+            raise ConnectionError("Unexpected engine.io open packet")
+        ws.send("40")  # socket.io connect to the default namespace
+        connected = calculating = False
+        while True:
+            message = ws.receive()
+            if message == "2":  # engine.io ping
+                ws.send("3")
+            elif message.startswith("44"):
+                raise ConnectionError(f"Socket.io connect refused: {message[2:]}")
+            elif message.startswith("40") and not connected:
+                connected = True
+                ws.send(_handshake_packet(client_id))
+            elif message.startswith("430") and not calculating:  # handshake acknowledgement
+                if json.loads(message[3:]) != [True]:
+                    raise ConnectionError("NiceGUI handshake refused")
+                calculating = True
+                for event in events:
+                    ws.send(event)
+            elif calculating and message.startswith("42") and RESULT_MARKER in message:
+                return
+    finally:
+        ws.close()
+
+
+class LoadClient(threading.Thread):
+    """One simulated user looping over the operation mix"""
+
+    def __init__(self, index, base_url, mix, deadline, warmup_until, options):
+        super().__init__(daemon=True)
+        self.rng = random.Random(options.seed + index)
+        self.host = urlsplit(base_url).hostname
+        self.port = urlsplit(base_url).port or 80
+        self.operations = list(mix)
+        self.weights = [mix[name] for name in self.operations]
+        self.deadline = deadline
+        self.warmup_until = warmup_until
+        self.options = options
+        self.latencies = {name: [] for name in self.operations}
+        self.errors = {name: 0 for name in self.operations}
+        self.error_messages = {}
+
+    def _connection(self):
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.options.timeout)
+
+    def run(self):
+        connection = self._connection()
+        while time.perf_counter() < self.deadline:
+            operation = self.rng.choices(self.operations, self.weights)[0]
+            started = time.perf_counter()
+            try:
+                if operation == "ui":
+                    open_ui_session(self.host, self.port, connection, self.options.timeout,
+                                    websocket=not self.options.no_websocket, rng=self.rng)
+                else:
+                    connection.request("GET", make_request(operation, self.rng))
+                    response = connection.getresponse()
+                    response.read()
+                    if response.status >= 500:
+                        raise ConnectionError(f"HTTP {response.status}")
+                error = None
+            except (OSError, http.client.HTTPException) as e:
+                error = f"{type(e).__name__}: {e}"
+                connection.close()
+                connection = self._connection()
+            finished = time.perf_counter()
+
+            if started >= self.warmup_until and finished <= self.deadline:
+                if error is None:
+                    self.latencies[operation].append(finished - started)
+                else:
+                    self.errors[operation] += 1
+                    self.error_messages[error] = self.error_messages.get(error, 0) + 1
+            if self.options.think_time:
+                time.sleep(self.rng.uniform(0, 2 * self.options.think_time))
+        connection.close()
+
+
+def run_load(base_url, mix=None, clients=50, duration=30.0, warmup=0.0, server_pid=None, options=None):
+    """
+    Drive simulated clients against a running server
+
+    Args:
+        base_url (str): e.g. "http://127.0.0.1:8080"
+        mix (dict): Operation name to weight (default: DEFAULT_MIX)
+        clients (int): Concurrent simulated users
+        duration (float): Measured seconds (after the warm-up)
+        warmup (float): Seconds of load before measuring starts
+        server_pid (int): Server process to sample RSS from, if known
+        options: Namespace with timeout, think_time, seed and no_websocket
+
+    Returns:
+        dict: Machine-readable report
+    """
+    mix = {name: weight for name, weight in (mix or DEFAULT_MIX).items() if weight > 0}
+    options = options or argparse.Namespace(timeout=10.0, think_time=0.0, seed=0, no_websocket=False)
+
+    sampler = RssSampler(server_pid) if server_pid else None
+    if sampler:
+        sampler.start()
+    started = time.perf_counter()
+    warmup_until = started + warmup
+    deadline = warmup_until + duration
+    workers = [LoadClient(i, base_url, mix, deadline, warmup_until, options) for i in range(clients)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = min(time.perf_counter(), deadline) - warmup_until
+
+    operations = {}
+    all_latencies, all_errors, error_messages = [], 0, {}
+    for name in mix:
+        latencies = [value for worker in workers for value in worker.latencies[name]]
+        errors = sum(worker.errors[name] for worker in workers)
+        operations[name] = summarize(latencies, errors, elapsed)
+        all_latencies.extend(latencies)
+        all_errors += errors
+    for worker in workers:
+        for message, count in worker.error_messages.items():
+            error_messages[message] = error_messages.get(message, 0) + count
+
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "target": base_url,
+        "config": {
+            "clients": clients,
+            "duration_s": duration,
+            "warmup_s": warmup,
+            "mix": mix,
+            "think_time_s": options.think_time,
+            "websocket": not options.no_websocket,
+            "seed": options.seed
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count()
+        },
+        "total": summarize(all_latencies, all_errors, elapsed),
+        "operations": operations,
+        "errors": error_messages,
+        "server_rss": sampler.stop() if sampler else None
+    }
+
+
+def wait_until_ready(base_url, process=None, timeout=SERVER_START_TIMEOUT):
+    """Poll the API until the server answers; raise if it exits or times out"""
+    parts = urlsplit(base_url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=1)
+            connection.request("GET", "/api/sura/1")
+            connection.getresponse().read()
+            connection.close()
+            return
+        except (OSError, http.client.HTTPException):
+            time.sleep(0.2)
+    raise RuntimeError(f"Server did not answer within {timeout:.0f} s")
+
+
+def start_server(port, api_only=False):
+    """Start main_nicegui.py on localhost and return the process"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    command = [sys.executable, os.path.join(base_dir, "main_nicegui.py"),
+               "--port", str(port), "--host", "127.0.0.1", "--no-browser"]
+    if api_only:
+        command.append("--api-only")
+    return subprocess.Popen(command, cwd=base_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def print_report(report):
+    """Print a human-readable summary of a report"""
+    config = report["config"]
+    print(f"{config['clients']} clients, {config['duration_s']:.0f} s against {report['target']}")
+    print(f"{'operation':<10} {'requests':>9} {'rps':>9} {'errors':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+
+    def row(name, stats):
+        latency = stats["latency_ms"]
+        values = [("-" if latency[key] is None else f"{latency[key]:.2f}") for key in ("p50", "p95", "p99")]
+        print(f"{name:<10} {stats['requests']:>9} {stats['throughput_rps']:>9.1f} "
+              f"{stats['errors']:>7} {values[0]:>9} {values[1]:>9} {values[2]:>9}")
+
+    for name, stats in report["operations"].items():
+        row(name, stats)
+    row("total", report["total"])
+
+    for message, count in sorted(report["errors"].items(), key=lambda item: -item[1])[:5]:
+        print(f"❌ {count} x {message}")
+    rss = report["server_rss"]
+    if rss:
+        print(f"Server RSS: {rss['start_mb']} MB at start, {rss['peak_mb']} MB peak, {rss['end_mb']} MB at end")
+
+
+def main():
+    """Main function to run the load test"""
+    parser = argparse.ArgumentParser(description='Quran Calculator - local load test')
+    parser.add_argument('--url', default=None,
+                       help='Target a running server instead of starting one (e.g. http://127.0.0.1:8080)')
+    parser.add_argument('--port', '-p', type=int, default=8765,
+                       help='Port for the locally started server (default: 8765)')
+    parser.add_argument('--api-only', action='store_true',
+                       help='Start the server with --api-only (implies no ui operations)')
+    parser.add_argument('--clients', '-c', type=int, default=50,
+                       help='Concurrent simulated clients (default: 50)')
+    parser.add_argument('--duration', '-d', type=float, default=30.0,
+                       help='Measured seconds (default: 30)')
+    parser.add_argument('--warmup', type=float, default=3.0,
+                       help='Seconds of unmeasured load first (default: 3)')
+    parser.add_argument('--mix', default=None,
+                       help='Operation weights, e.g. "range=40,search=25,ui=10" (default: '
+                            + ",".join(f"{k}={v}" for k, v in DEFAULT_MIX.items()) + ')')
+    parser.add_argument('--think-time', type=float, default=0.0,
+                       help='Mean pause between a client\'s requests in seconds (default: 0)')
+    parser.add_argument('--timeout', type=float, default=10.0,
+                       help='Per-request timeout in seconds (default: 10)')
+    parser.add_argument('--no-websocket', action='store_true',
+                       help='ui operations only load the page (no websocket, no calculation)')
+    parser.add_argument('--seed', type=int, default=0,
+                       help='Random seed for the request mix (default: 0)')
+    parser.add_argument('--output', '-o', default='load_results.json',
+                       help='JSON report file (default: load_results.json)')
+
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix) if args.mix else dict(DEFAULT_MIX)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.api_only:
+        mix.pop("ui", None)
+
+    process = None
+    base_url = args.url.rstrip('/') if args.url else f"http://127.0.0.1:{args.port}"
+    try:
+        if args.url is None:
+            print(f"🚀 Starting server on port {args.port}...")
+            process = start_server(args.port, args.api_only)
+        wait_until_ready(base_url, process)
+        report = run_load(base_url, mix, args.clients, args.duration, args.warmup,
+                          process.pid if process else None, args)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    print_report(report)
+    with open(args.output, 'w', encoding='utf-8') as output:
+        json.dump(report, output, ensure_ascii=False, indent=2)
+    print(f"✓ Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
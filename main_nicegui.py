@@ -26,234 +26,388 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 # Add static file route for the local font
 app.add_static_files('/fonts', os.path.dirname(os.path.abspath(__file__)))
 
-from quran_data import SURAS, get_sura_names, get_sura_by_name
+from quran_data import SURAS, get_sura_by_name
 from calculator import calculator
+from api import create_api_app, install_metrics, router as api_router
+from metrics import registry, timed
+from result_cache import LRUCache, freeze
+
+# JSON API endpoints (/api/...) served alongside the interactive page
+app.include_router(api_router)
+# Prometheus metrics on /metrics
+install_metrics(app)
+
+# Most requested sura ranges, rendered when the server starts
+POPULAR_RANGES = [
+    (1, 2), (1, 114), (2, 3), (1, 7), (18, 18), (36, 67),
+    (67, 114), (78, 114), (87, 114), (93, 114), (103, 114), (112, 114)
+]
+FRAGMENT_CACHE_SIZE = 512
+SURA_TABLE_HEIGHT = '400px'  # The table scrolls (virtually) beyond this height
+
+# Columns of the detailed sura table; each row is a compact dict with these fields
+SURA_TABLE_COLUMNS = [
+    {"name": "number", "label": "#", "field": "number", "align": "left"},
+    {"name": "name", "label": "السورة", "field": "name", "align": "left"},
+    {"name": "arabic", "label": "الاسم", "field": "arabic", "align": "right", "classes": "sura-item-arabic"},
+    {"name": "ayahs", "label": "الآيات", "field": "ayahs", "align": "center"},
+    {"name": "page", "label": "الصفحة", "field": "page", "align": "center"},
+]
+
+# Rendered (summary_html, sura_rows) per query key; bounded so memory stays flat
+fragment_cache = LRUCache(maxsize=FRAGMENT_CACHE_SIZE)
+registry.register_cache("fragments", fragment_cache)
+
+
+def render_result_fragments(result_data):
+    """
+    Render the HTML and table rows shown for a successful result
+    
+    Args:
+        result_data (dict): Successful calculator result
+        
+    Returns:
+        tuple: (summary_html, sura_rows) - totals, range and page info, and the
+               read-only rows of the detailed sura table (see SURA_TABLE_COLUMNS)
+    """
+    parts = []
+    
+    # Display total ayahs (main result)
+    parts.append(f'<div class="result-total">إجمالي الآيات: {result_data["total_ayahs"]}</div>')
+    
+    # Display actual pages instead of estimated
+    total_pages = result_data.get("total_pages", 0)
+    page_range = result_data.get("page_range", {})
+    
+    if total_pages > 0 and page_range:
+        parts.append(f'''
+        <div style="text-align: center; color: #2E8B57; font-size: 20px; font-weight: bold; margin: 10px 0;">
+            نطاق الصفحات: {total_pages} صفحة (من صفحة {page_range.get("start_page", 0)} إلى صفحة {page_range.get("end_page", 0)})
+        </div>
+        ''')
+    
+    # Display range information with Arabic names
+    start_sura = result_data["start_sura"]
+    end_sura = result_data["end_sura"]
+    
+    parts.append(f'''
+    <div style="text-align: center; font-size: 16px; margin: 20px 0;">
+        <div style="margin-bottom: 10px;">
+            <strong>من السورة {start_sura["number"]}:</strong> {start_sura["name"]}
+            <div class="sura-name-arabic">{start_sura["arabic"]}</div>
+            <small>(صفحة {start_sura["page_start"]})</small>
+        </div>
+        <div style="margin-top: 15px;">
+            <strong>إلى السورة {end_sura["number"]}:</strong> {end_sura["name"]}
+            <div class="sura-name-arabic">{end_sura["arabic"]}</div>
+            <small>(صفحة {end_sura["page_start"]})</small>
+        </div>
+    </div>
+    ''')
+    
+    # Display number of suras
+    parts.append(f'''
+    <div style="text-align: center; font-size: 18px; font-weight: bold; margin: 20px 0;">
+        عدد السور: {result_data["number_of_suras"]}
+    </div>
+    ''')
+    
+    # Display page calculation info with actual page data
+    if "page_info" in result_data:
+        page_info = result_data["page_info"]
+        parts.append(f'''
+        <div class="page-range-info">
+            <strong>📄 معلومات الصفحات:</strong><br>
+            • إجمالي الصفحات المقدرة: {page_info["total_pages"]}<br>
+            • من الصفحة الأولى للسورة الأولى: {page_info["start_page"]}<br>
+            • إلى الصفحة الأولى للسورة الأخيرة: {page_info["end_page"]}<br>
+            • طريقة الحساب: {page_info["calculation_method"]}<br>
+            • إجمالي صفحات القرآن: {page_info["total_quran_pages"]}
+        </div>
+        ''')
+    
+    sura_rows = [
+        {
+            "number": sura["number"],
+            "name": sura["name"],
+            "arabic": sura["arabic"],
+            "ayahs": sura["ayahs"],
+            "page": sura.get("page_start") or "غير محددة"
+        }
+        for sura in result_data['included_suras']
+    ]
+    
+    return "".join(parts), freeze(sura_rows)
+
+
+def result_cache_key(result_data):
+    """Fragment cache key of a successful result: its sura numbers in the order selected"""
+    order = result_data["original_order"]
+    return (order["first_sura"], order["second_sura"])
+
+
+def get_result_fragments(result_data, cache_key=None):
+    """Rendered fragments for a result, from the fragment cache when cache_key is given"""
+    if cache_key is None:
+        return render_result_fragments(result_data)
+    fragments = fragment_cache.get(cache_key)
+    if fragments is None:
+        fragments = fragment_cache.put(cache_key, render_result_fragments(result_data))
+    return fragments
+
+
+def warm_fragment_cache(ranges=POPULAR_RANGES):
+    """Render the fragments of popular sura ranges ahead of the first request"""
+    for first_sura, second_sura in ranges:
+        result = calculator.calculate_ayahs_between_suras(first_sura, second_sura)
+        if result.get("success"):
+            get_result_fragments(result, result_cache_key(result))
+
+
+def prepare_sura_options():
+    """
+    Build the select options and the option-to-name map for Arabic display
+    
+    Returns:
+        tuple: (options, option_names) - option texts like "1. الفاتحة" in sura
+               order, and a dict from option text to English sura name
+    """
+    options = []
+    option_names = {}
+    for num, sura in SURAS.items():
+        # Format: "1. الفاتحة" (Arabic only)
+        display_name = f"{num}. {sura['arabic']}"
+        options.append(display_name)
+        option_names[display_name] = sura['name']
+    return options, option_names
+
+
+# Built once at import and shared read-only by every client page; each select
+# holds a reference to SURA_OPTIONS rather than its own copy, so never mutate it
+SURA_OPTIONS, OPTION_SURA_NAMES = prepare_sura_options()
+
+PAGE_TITLE = 'حاسبة آيات القرآن الكريم'
+
+# Custom CSS for modern styling with Arabic support (same string for every client)
+PAGE_HEAD_HTML = '''
+<style>
+    @import url('https://fonts.googleapis.com/css2?family=Amiri:wght@400;700&display=swap');
+    
+    @font-face {
+        font-family: 'RobotoLocal';
+        src: url('/fonts/roboto_font.ttf') format('truetype');
+        font-weight: normal;
+        font-style: normal;
+    }
+    .rtl {
+        direction: rtl;
+    }
+    
+    .main-container {
+        max-width: 1000px;
+        margin: 0 auto;
+        padding: 20px;
+        font-family: 'RobotoLocal', sans-serif;
+        direction: rtl;
+    }
+    .arabic-text {
+        font-family: 'Amiri', serif;
+        font-size: 1.2em;
+        direction: rtl;
+        text-align: right;
+        color: #2E8B57;
+        font-weight: 500;
+    }
+    .sura-name-arabic {
+        font-family: 'Amiri', serif;
+        font-size: 1.1em;
+        color: #2E8B57;
+        margin: 5px 0;
+    }
+    .header-title {
+        color: #2E8B57;
+        text-align: center;
+        margin-bottom: 10px;
+    }
+    .header-subtitle {
+        color: #666666;
+        text-align: center;
+        margin-bottom: 30px;
+    }
+    .input-section {
+        background: white;
+        border-radius: 10px;
+        padding: 30px;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        margin-bottom: 20px;
+    }
+    .result-section {
+        background: white;
+        border-radius: 10px;
+        padding: 30px;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        min-height: 300px;
+    }
+    .sura-input-row {
+        display: flex;
+        align-items: center;
+        margin-bottom: 20px;
+        gap: 20px;
+        
+    }
+    .sura-label {
+        width: 120px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    .calculate-btn {
+        background: #2E8B57 !important;
+        color: white !important;
+        font-weight: bold !important;
+        font-size: 16px !important;
+        padding: 15px 30px !important;
+        border-radius: 8px !important;
+        margin: 20px 10px !important;
+    }
+    .clear-btn {
+        background: #808080 !important;
+        color: white !important;
+        font-weight: bold !important;
+        font-size: 14px !important;
+        padding: 10px 20px !important;
+        border-radius: 8px !important;
+        margin: 10px !important;
+    }
+
+    .result-title {
+        color: #2E8B57;
+        font-size: 24px;
+        font-weight: bold;
+        text-align: center;
+        margin-bottom: 20px;
+    }
+    .result-total {
+        color: #2E8B57;
+        font-size: 28px;
+        font-weight: bold;
+        text-align: center;
+        margin: 20px 0;
+    }
+    .result-details {
+        margin-top: 20px;
+        padding: 20px;
+        background: #f8f9fa;
+        border-radius: 8px;
+    }
+    .sura-table {
+        width: 100%;
+        background: transparent;
+    }
+    .sura-item-arabic {
+        font-family: 'Amiri', serif;
+        color: #2E8B57;
+        font-size: 1.1em;
+        margin-left: 10px;
+    }
+    .page-range-info {
+        background: #e8f5e8;
+        padding: 15px;
+        border-radius: 8px;
+        margin: 15px 0;
+        border-left: 4px solid #2E8B57;
+    }
+    .welcome-message {
+        text-align: center;
+        color: #2E8B57;
+        font-size: 20px;
+        font-weight: bold;
+        margin-bottom: 20px;
+    }
+    .instruction-list {
+        list-style: none;
+        padding: 0;
+        margin: 20px 0;
+    }
+    .instruction-list li {
+        padding: 8px 0;
+        font-size: 14px;
+        color: #333;
+    }
+    .stats-info {
+        text-align: center;
+        color: #666;
+        font-size: 12px;
+        margin-top: 20px;
+    }
+    /* Select dropdown styling for Arabic text */
+    .q-field--filled .q-field__control {
+        font-family: 'RobotoLocal', sans-serif;
+        direction: rtl;
+        text-align: right;
+    }
+    .q-item__label {
+        font-family: 'RobotoLocal', sans-serif;
+        direction: rtl;
+        text-align: right;
+    }
+    .q-field__label {
+        direction: rtl;
+        text-align: right;
+        font-family: 'RobotoLocal', sans-serif;
+    }
+    .q-field__input {
+        direction: rtl;
+        text-align: right;
+        font-family: 'RobotoLocal', sans-serif;
+    }
+    .q-select .q-field__input {
+        direction: rtl;
+        text-align: right;
+    }
+    .q-menu .q-item {
+        direction: rtl;
+        text-align: right;
+    }
+</style>
+'''
 
 
 class QuranCalculatorNiceGUI:
-    """Main application class for Quran Calculator using NiceGUI with Arabic support"""
+    """
+    Main application class for Quran Calculator using NiceGUI with Arabic support
+    
+    One instance is created per client connection by index(), so every browser
+    tab has its own selects and result container. The instance only holds its
+    widgets: sura options, CSS and rendered result HTML are module-level and
+    shared by reference.
+    
+    Per-client memory cost: about 20 elements (two selects, two buttons, the
+    result container and static html blocks) plus NiceGUI's per-client
+    bookkeeping, in the order of tens of KB per connection; nothing grows with
+    the number of suras. A shown result adds two elements, the summary HTML
+    and a closed expansion, whose content comes from fragment_cache. The
+    detailed sura table is created only when its expansion is first opened,
+    as one virtual-scroll table element fed with compact row dicts, so a
+    calculation sends no per-sura markup unless the user asks for it.
+    """
     
     def __init__(self):
-        self.sura_names = get_sura_names()
-        self.language_mode = "arabic"  # Set to Arabic only
-        self.sura_options = self.prepare_sura_options()
+        self.sura_options = SURA_OPTIONS
         self.setup_ui()
-        
-    def prepare_sura_options(self):
-        """Prepare sura options for Arabic display"""
-        options = []
-        for num, sura in SURAS.items():
-            # Format: "1. الفاتحة" (Arabic only)
-            display_name = f"{num}. {sura['arabic']}"
-            options.append(display_name)
-        return options
     
     def get_sura_name_from_option(self, option_text):
         """Extract the English sura name from the selected option"""
         if not option_text:
             return None
-        
-        # Extract the sura number from the option text
-        try:
-            sura_num = int(option_text.split('.')[0])
-            return SURAS[sura_num]['name']
-        except (ValueError, IndexError, KeyError):
-            return None
+        return OPTION_SURA_NAMES.get(option_text)
 
-        
     def setup_ui(self):
         """Setup the user interface with Arabic support"""
         # Set page configuration
-        ui.page_title('حاسبة آيات القرآن الكريم')
+        ui.page_title(PAGE_TITLE)
         
         # Custom CSS for modern styling with Arabic support
-        ui.add_head_html('''
-        <style>
-            @import url('https://fonts.googleapis.com/css2?family=Amiri:wght@400;700&display=swap');
-            
-            @font-face {
-                font-family: 'RobotoLocal';
-                src: url('/fonts/roboto_font.ttf') format('truetype');
-                font-weight: normal;
-                font-style: normal;
-            }
-            .rtl {
-                direction: rtl;
-            }
-            
-            .main-container {
-                max-width: 1000px;
-                margin: 0 auto;
-                padding: 20px;
-                font-family: 'RobotoLocal', sans-serif;
-                direction: rtl;
-            }
-            .arabic-text {
-                font-family: 'Amiri', serif;
-                font-size: 1.2em;
-                direction: rtl;
-                text-align: right;
-                color: #2E8B57;
-                font-weight: 500;
-            }
-            .sura-name-arabic {
-                font-family: 'Amiri', serif;
-                font-size: 1.1em;
-                color: #2E8B57;
-                margin: 5px 0;
-            }
-            .header-title {
-                color: #2E8B57;
-                text-align: center;
-                margin-bottom: 10px;
-            }
-            .header-subtitle {
-                color: #666666;
-                text-align: center;
-                margin-bottom: 30px;
-            }
-            .input-section {
-                background: white;
-                border-radius: 10px;
-                padding: 30px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                margin-bottom: 20px;
-            }
-            .result-section {
-                background: white;
-                border-radius: 10px;
-                padding: 30px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                min-height: 300px;
-            }
-            .sura-input-row {
-                display: flex;
-                align-items: center;
-                margin-bottom: 20px;
-                gap: 20px;
-                
-            }
-            .sura-label {
-                width: 120px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            .calculate-btn {
-                background: #2E8B57 !important;
-                color: white !important;
-                font-weight: bold !important;
-                font-size: 16px !important;
-                padding: 15px 30px !important;
-                border-radius: 8px !important;
-                margin: 20px 10px !important;
-            }
-            .clear-btn {
-                background: #808080 !important;
-                color: white !important;
-                font-weight: bold !important;
-                font-size: 14px !important;
-                padding: 10px 20px !important;
-                border-radius: 8px !important;
-                margin: 10px !important;
-            }
-
-            .result-title {
-                color: #2E8B57;
-                font-size: 24px;
-                font-weight: bold;
-                text-align: center;
-                margin-bottom: 20px;
-            }
-            .result-total {
-                color: #2E8B57;
-                font-size: 28px;
-                font-weight: bold;
-                text-align: center;
-                margin: 20px 0;
-            }
-            .result-details {
-                margin-top: 20px;
-                padding: 20px;
-                background: #f8f9fa;
-                border-radius: 8px;
-            }
-            .sura-item {
-                padding: 8px 0;
-                border-bottom: 1px solid #eee;
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-            }
-            .sura-item-english {
-                flex: 1;
-            }
-            .sura-item-arabic {
-                font-family: 'Amiri', serif;
-                color: #2E8B57;
-                font-size: 1.1em;
-                margin-left: 10px;
-            }
-            .page-range-info {
-                background: #e8f5e8;
-                padding: 15px;
-                border-radius: 8px;
-                margin: 15px 0;
-                border-left: 4px solid #2E8B57;
-            }
-            .welcome-message {
-                text-align: center;
-                color: #2E8B57;
-                font-size: 20px;
-                font-weight: bold;
-                margin-bottom: 20px;
-            }
-            .instruction-list {
-                list-style: none;
-                padding: 0;
-                margin: 20px 0;
-            }
-            .instruction-list li {
-                padding: 8px 0;
-                font-size: 14px;
-                color: #333;
-            }
-            .stats-info {
-                text-align: center;
-                color: #666;
-                font-size: 12px;
-                margin-top: 20px;
-            }
-            /* Select dropdown styling for Arabic text */
-            .q-field--filled .q-field__control {
-                font-family: 'RobotoLocal', sans-serif;
-                direction: rtl;
-                text-align: right;
-            }
-            .q-item__label {
-                font-family: 'RobotoLocal', sans-serif;
-                direction: rtl;
-                text-align: right;
-            }
-            .q-field__label {
-                direction: rtl;
-                text-align: right;
-                font-family: 'RobotoLocal', sans-serif;
-            }
-            .q-field__input {
-                direction: rtl;
-                text-align: right;
-                font-family: 'RobotoLocal', sans-serif;
-            }
-            .q-select .q-field__input {
-                direction: rtl;
-                text-align: right;
-            }
-            .q-menu .q-item {
-                direction: rtl;
-                text-align: right;
-            }
-        </style>
-        ''')
+        ui.add_head_html(PAGE_HEAD_HTML)
         
         with ui.column().classes('main-container'):
             # Header
@@ -365,8 +519,9 @@ class QuranCalculatorNiceGUI:
         # Perform calculation
         result = calculator.calculate_ayahs_between_suras(sura1_name, sura2_name)
         
-        # Display result
-        self.display_result(result)
+        # Display result (the rendered HTML is cached per sura pair)
+        cache_key = result_cache_key(result) if result.get("success") else None
+        self.display_result(result, cache_key=cache_key)
         
     def show_error(self, message: str):
         """Show error message"""
@@ -379,8 +534,15 @@ class QuranCalculatorNiceGUI:
             </div>
             ''')
             
-    def display_result(self, result_data: dict):
-        """Display calculation result with Arabic support and actual page information"""
+    @timed("ui.display_result")
+    def display_result(self, result_data: dict, cache_key=None):
+        """Display calculation result with Arabic support and actual page information
+        
+        Args:
+            result_data (dict): Calculator result
+            cache_key: Key of the query (e.g. the sura numbers); when given,
+                       the rendered HTML is reused from the fragment cache
+        """
         self.result_container.clear()
         
         with self.result_container:
@@ -392,76 +554,31 @@ class QuranCalculatorNiceGUI:
                 </div>
                 ''')
                 return
-                
-            # Display total ayahs (main result)
-            ui.html(f'<div class="result-total">إجمالي الآيات: {result_data["total_ayahs"]}</div>')
-            
-            # Display actual pages instead of estimated
-            total_pages = result_data.get("total_pages", 0)
-            page_range = result_data.get("page_range", {})
-            
-            if total_pages > 0 and page_range:
-                ui.html(f'''
-                <div style="text-align: center; color: #2E8B57; font-size: 20px; font-weight: bold; margin: 10px 0;">
-                    نطاق الصفحات: {total_pages} صفحة (من صفحة {page_range.get("start_page", 0)} إلى صفحة {page_range.get("end_page", 0)})
-                </div>
-                ''')
-            
-            # Display range information with Arabic names
-            start_sura = result_data["start_sura"]
-            end_sura = result_data["end_sura"]
             
-            range_text = f'''
-            <div style="text-align: center; font-size: 16px; margin: 20px 0;">
-                <div style="margin-bottom: 10px;">
-                    <strong>من السورة {start_sura["number"]}:</strong> {start_sura["name"]}
-                    <div class="sura-name-arabic">{start_sura["arabic"]}</div>
-                    <small>(صفحة {start_sura["page_start"]})</small>
-                </div>
-                <div style="margin-top: 15px;">
-                    <strong>إلى السورة {end_sura["number"]}:</strong> {end_sura["name"]}
-                    <div class="sura-name-arabic">{end_sura["arabic"]}</div>
-                    <small>(صفحة {end_sura["page_start"]})</small>
-                </div>
-            </div>
-            '''
-            ui.html(range_text)
+            summary_html, sura_rows = get_result_fragments(result_data, cache_key)
+            ui.html(summary_html)
             
-            # Display number of suras
-            ui.html(f'''
-            <div style="text-align: center; font-size: 18px; font-weight: bold; margin: 20px 0;">
-                عدد السور: {result_data["number_of_suras"]}
-            </div>
-            ''')
+            # Detailed sura list, built when the expansion is first opened
+            details = ui.expansion(
+                "إظهار قائمة السور التفصيلية",
+                icon='list',
+                on_value_change=lambda event: self.show_sura_table(details, sura_rows) if event.value else None
+            ).classes('result-details')
             
-            # Display page calculation info with actual page data
-            if "page_info" in result_data:
-                page_info = result_data["page_info"]
-                ui.html(f'''
-                <div class="page-range-info">
-                    <strong>📄 معلومات الصفحات:</strong><br>
-                    • إجمالي الصفحات المقدرة: {page_info["total_pages"]}<br>
-                    • من الصفحة الأولى للسورة الأولى: {page_info["start_page"]}<br>
-                    • إلى الصفحة الأولى للسورة الأخيرة: {page_info["end_page"]}<br>
-                    • طريقة الحساب: {page_info["calculation_method"]}<br>
-                    • إجمالي صفحات القرآن: {page_info["total_quran_pages"]}
-                </div>
-                ''')
-            
-            # Display detailed sura list with Arabic names and page info
-            with ui.expansion("إظهار قائمة السور التفصيلية", icon='list').classes('result-details'):
-                for sura in result_data['included_suras']:
-                    page_info = f"صفحة {sura['page_start']}" if sura.get('page_start') else "صفحة غير محددة"
-                    
-                    ui.html(f'''
-                    <div class="sura-item">
-                        <div class="sura-item-english">
-                            <strong>{sura["number"]}. {sura["name"]}</strong><br>
-                            <small>{sura["ayahs"]} آية، {page_info}</small>
-                        </div>
-                        <div class="sura-item-arabic">{sura["arabic"]}</div>
-                    </div>
-                    ''')
+    def show_sura_table(self, details, sura_rows):
+        """Fill an expansion with the detailed sura table (once)"""
+        if details.default_slot.children:
+            return
+        with details:
+            # One element for all suras; virtual scroll renders only the visible rows
+            ui.table(
+                columns=SURA_TABLE_COLUMNS,
+                rows=list(sura_rows),
+                row_key='number',
+                pagination=0  # All rows in one virtually scrolled page
+            ).props('virtual-scroll flat dense hide-bottom').classes('sura-table').style(
+                f'max-height: {SURA_TABLE_HEIGHT}'
+            )
                     
     def clear_inputs(self):
         """Clear input fields and reset results"""
@@ -470,6 +587,12 @@ class QuranCalculatorNiceGUI:
         self.show_welcome_message()
 
 
+@ui.page('/')
+def index():
+    """Build a separate calculator page for each connecting client"""
+    QuranCalculatorNiceGUI()
+
+
 def main():
     """Main function to start the application"""
     import argparse
@@ -481,6 +604,10 @@ def main():
                        help='Port number to run the web server (default: 8080)')
     parser.add_argument('--no-browser', action='store_true',
                        help='Don\'t automatically open browser')
+    parser.add_argument('--api-only', action='store_true',
+                       help='Serve only the JSON API under /api, without building the UI')
+    parser.add_argument('--host', default=None,
+                       help='Host interface to bind (default: NiceGUI/uvicorn default)')
     
     args = parser.parse_args()
     
@@ -488,19 +615,33 @@ def main():
     print("=" * 50)
     print(f"📡 Server will run on port: {args.port}")
     
+    if args.api_only:
+        import uvicorn
+        
+        print("✓ API-only mode: serving /api without the UI")
+        try:
+            uvicorn.run(create_api_app(), host=args.host or '127.0.0.1', port=args.port,
+                        log_level='warning')
+        except KeyboardInterrupt:
+            print("\n👋 Application stopped by user")
+        return
+    
     try:
-        # Create the application
-        app_instance = QuranCalculatorNiceGUI()
+        calculator.precompute_pairs()
+        warm_fragment_cache()
+        # Pages are built per client by index(); shared state is ready at import
         print("✓ Application initialized")
         print("✓ Starting web server...")
         
         # Run the application
+        run_options = {'host': args.host} if args.host else {}
         ui.run(
             title='Quran Ayah Calculator',
             port=args.port,
             show=not args.no_browser,
             reload=False,
-            dark=False
+            dark=False,
+            **run_options
         )
         
     except KeyboardInterrupt:
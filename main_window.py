@@ -10,6 +10,22 @@ from ui_components import (
 )
 from calculator import calculator
 from quran_data import get_sura_names
+from task_scheduler import TaskScheduler
+
+
+def calculate_result(sura1_name, sura2_name):
+    """
+    Calculate a sura range on the scheduler's worker thread
+    
+    RangeResult builds its descriptive fields (included_suras, page_info, ...)
+    on first access, so they are built here rather than when the result card
+    reads them on the Tk main thread.
+    
+    Returns:
+        dict: Plain result dict (or the error dict)
+    """
+    result = calculator.calculate_ayahs_between_suras(sura1_name, sura2_name)
+    return result.to_dict() if hasattr(result, "to_dict") else result
 
 
 class QuranCalculatorApp:
@@ -29,6 +45,9 @@ class QuranCalculatorApp:
         # Center the window
         self.center_window()
         
+        # Filtering and calculations run off the main thread
+        self.scheduler = TaskScheduler(self.root)
+        
         # Initialize components
         self.setup_ui()
         
@@ -134,7 +153,8 @@ class QuranCalculatorApp:
             fields_frame,
             placeholder_text="Select or search first sura...",
             width=300,
-            values=[]
+            values=[],
+            scheduler=self.scheduler
         )
         self.sura1_entry.grid(row=0, column=1, padx=10, pady=10)
         
@@ -146,7 +166,8 @@ class QuranCalculatorApp:
             fields_frame,
             placeholder_text="Select or search second sura...",
             width=300,
-            values=[]
+            values=[],
+            scheduler=self.scheduler
         )
         self.sura2_entry.grid(row=1, column=1, padx=10, pady=10)
         
@@ -198,22 +219,18 @@ class QuranCalculatorApp:
         
     def show_welcome_message(self):
         """Show welcome message in results area"""
-        welcome_data = {
-            "success": True,
-            "total_ayahs": 6236,  # Total ayahs in Quran
-            "start_sura": {"number": 1, "name": "Al-Fatiha", "ayahs": 7},
-            "end_sura": {"number": 114, "name": "An-Nas", "ayahs": 6},
-            "included_suras": [],
-            "number_of_suras": 114
-        }
+        welcome_frame = self.result_card.welcome_frame
         
-        # Clear existing content
-        for widget in self.result_card.content_frame.winfo_children():
-            widget.destroy()
-            
+        # The welcome content is built once and kept by the result card
+        if not welcome_frame.winfo_children():
+            self.build_welcome_message(welcome_frame)
+        self.result_card.show_welcome()
+        
+    def build_welcome_message(self, welcome_frame):
+        """Create the welcome message widgets"""
         # Welcome message
         welcome_label = ModernLabel(
-            self.result_card.content_frame,
+            welcome_frame,
             text="Welcome to Quran Ayah Calculator!",
             font_size=20,
             font_weight="bold",
@@ -233,7 +250,7 @@ class QuranCalculatorApp:
         
         for instruction in instructions:
             inst_label = ModernLabel(
-                self.result_card.content_frame,
+                welcome_frame,
                 text=instruction,
                 font_size=14
             )
@@ -241,7 +258,7 @@ class QuranCalculatorApp:
             
         # Quick stats
         stats_label = ModernLabel(
-            self.result_card.content_frame,
+            welcome_frame,
             text=f"\nQuran Statistics:\n• Total Suras: 114\n• Total Ayahs: 6,236\n• Total Pages: 604 (Standard Mushaf)",
             font_size=12,
             text_color="#666666"
@@ -262,10 +279,18 @@ class QuranCalculatorApp:
             self.show_error("Please enter two different suras")
             return
             
-        # Perform calculation
-        result = calculator.calculate_ayahs_between_suras(sura1_name, sura2_name)
+        # Perform calculation in the background; a newer click supersedes it
+        self.scheduler.schedule(
+            "calculate",
+            calculate_result,
+            (sura1_name, sura2_name),
+            callback=self.show_result,
+            error_callback=lambda error: self.show_error(f"Calculation failed: {error}"),
+            delay_ms=0
+        )
         
-        # Display result
+    def show_result(self, result):
+        """Display a finished calculation"""
         self.result_card.display_result(result)
         
         # Add animation effect
@@ -273,6 +298,7 @@ class QuranCalculatorApp:
         
     def show_error(self, message):
         """Show error message"""
+        self.scheduler.cancel("calculate")
         error_result = {
             "success": False,
             "error": message,
@@ -282,6 +308,7 @@ class QuranCalculatorApp:
         
     def clear_inputs(self):
         """Clear input fields and reset results"""
+        self.scheduler.cancel("calculate")
         self.sura1_entry.clear()
         self.sura2_entry.clear()
         self.show_welcome_message()
@@ -0,0 +1,272 @@
+"""
+Metrics Module
+Call counts and latency histograms for the hot paths, exported in the
+Prometheus text format
+
+Calculator and validator methods, display_result and the HTTP handlers
+record into one process-wide registry. Each observation is a bisect over
+fixed bucket bounds and a few additions into histograms owned by the
+calling thread, so the hot path takes no lock; the per-thread histograms
+are merged when the metrics are rendered.
+
+Collection is off by default: even lock-free, timing a call costs two
+perf_counter() calls and a wrapper, which doubles sub-microsecond lookups
+such as sura_info. Set QURAN_METRICS=1 before starting the app to turn it
+on; otherwise timed() returns functions unchanged and the HTTP middleware is
+not installed, so disabled metrics cost nothing. At runtime,
+registry.enabled = False pauses recording.
+"""
+
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+
+ENABLED = os.environ.get("QURAN_METRICS", "0").strip().lower() in ("1", "true", "yes", "on")
+
+# Upper bounds in seconds: table lookups take microseconds, page renders milliseconds
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025,
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5
+)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (not thread-safe; each has a single writer)"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds=DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def merge(self, other):
+        """Add another histogram's observations (with the same bounds) to this one"""
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.sum += other.sum
+        self.count += other.count
+
+    def cumulative(self):
+        """(le, cumulative count) pairs including +Inf"""
+        total = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            yield bound, total
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """Process-wide operation and HTTP metrics"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.enabled = ENABLED
+        self.buckets = buckets
+        self._local = threading.local()  # .shard: this thread's (operations, errors)
+        self._shards = []  # (operation -> Histogram, operation -> exceptions raised) per thread
+        self._http_requests = {}  # (method, route, status) -> count
+        self._http_latency = {}  # (method, route) -> Histogram
+        self._caches = {}  # label -> object with stats()
+        self._lock = threading.Lock()
+
+    def _shard(self):
+        """The calling thread's (operations, errors) dicts, created on its first observation"""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = ({}, {})
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def observe(self, operation, seconds, error=False):
+        """Record one call of an operation (lock-free: only this thread writes its shard)"""
+        operations, errors = self._shard()
+        histogram = operations.get(operation)
+        if histogram is None:
+            histogram = operations[operation] = Histogram(self.buckets)
+        histogram.observe(seconds)
+        if error:
+            errors[operation] = errors.get(operation, 0) + 1
+
+    def _merged_operations(self):
+        """Operation histograms and error counts summed over all threads"""
+        operations = {}
+        errors = {}
+        with self._lock:
+            shards = list(self._shards)
+        for shard_operations, shard_errors in shards:
+            for operation, histogram in list(shard_operations.items()):
+                merged = operations.get(operation)
+                if merged is None:
+                    merged = operations[operation] = Histogram(self.buckets)
+                merged.merge(histogram)
+            for operation, count in list(shard_errors.items()):
+                errors[operation] = errors.get(operation, 0) + count
+        return operations, errors
+
+    def observe_http(self, method, route, status, seconds):
+        """Record one HTTP request"""
+        with self._lock:
+            key = (method, route, status)
+            self._http_requests[key] = self._http_requests.get(key, 0) + 1
+            histogram = self._http_latency.get((method, route))
+            if histogram is None:
+                histogram = self._http_latency[(method, route)] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def register_cache(self, name, cache):
+        """
+        Export a cache's counters and size at render time
+
+        Args:
+            name (str): Value of the cache label
+            cache: An object with a stats() method (see result_cache.LRUCache)
+        """
+        self._caches[name] = cache
+
+    def count(self, operation):
+        """Number of recorded calls of an operation"""
+        with self._lock:
+            shards = list(self._shards)
+        return sum(getattr(shard[0].get(operation), "count", 0) for shard in shards)
+
+    def reset(self):
+        """Drop all recorded values"""
+        with self._lock:
+            for operations, errors in self._shards:
+                operations.clear()
+                errors.clear()
+            self._http_requests.clear()
+            self._http_latency.clear()
+
+    def render(self):
+        """
+        Export everything in the Prometheus text exposition format
+
+        Returns:
+            str: Exposition text, ending with a newline
+        """
+        lines = []
+        operations, errors = self._merged_operations()
+        with self._lock:
+            lines.append("# HELP quran_operation_duration_seconds Latency of calculator, validation and render calls")
+            lines.append("# TYPE quran_operation_duration_seconds histogram")
+            for operation, histogram in sorted(operations.items()):
+                _histogram_lines(lines, "quran_operation_duration_seconds", f'operation="{_escape(operation)}"', histogram)
+
+            lines.append("# HELP quran_operation_errors_total Calls that raised an exception")
+            lines.append("# TYPE quran_operation_errors_total counter")
+            for operation, count in sorted(errors.items()):
+                lines.append(f'quran_operation_errors_total{{operation="{_escape(operation)}"}} {count}')
+
+            lines.append("# HELP quran_http_requests_total HTTP requests by route and status")
+            lines.append("# TYPE quran_http_requests_total counter")
+            for (method, route, status), count in sorted(self._http_requests.items()):
+                lines.append(f'quran_http_requests_total{{method="{method}",route="{_escape(route)}",'
+                             f'status="{status}"}} {count}')
+
+            lines.append("# HELP quran_http_request_duration_seconds HTTP request latency by route")
+            lines.append("# TYPE quran_http_request_duration_seconds histogram")
+            for (method, route), histogram in sorted(self._http_latency.items()):
+                _histogram_lines(lines, "quran_http_request_duration_seconds",
+                                 f'method="{method}",route="{_escape(route)}"', histogram)
+
+        caches = [(name, cache.stats()) for name, cache in sorted(self._caches.items())]
+        for key in ("hits", "misses", "evictions", "expirations"):
+            lines.append(f"# TYPE quran_cache_{key}_total counter")
+            for name, stats in caches:
+                lines.append(f'quran_cache_{key}_total{{cache="{_escape(name)}"}} {stats[key]}')
+        lines.append("# TYPE quran_cache_entries gauge")
+        for name, stats in caches:
+            lines.append(f'quran_cache_entries{{cache="{_escape(name)}"}} {stats["size"]}')
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(lines, name, labels, histogram):
+    for bound, total in histogram.cumulative():
+        lines.append(f'{name}_bucket{{{labels},le="{_format_value(bound)}"}} {total}')
+    lines.append(f"{name}_sum{{{labels}}} {_format_value(histogram.sum)}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+# Global registry
+registry = MetricsRegistry()
+
+
+def timed(operation):
+    """
+    Decorator recording the latency (and exceptions) of each call under an operation name
+
+    Returns the function itself when metrics are disabled at startup.
+    """
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                registry.observe(operation, time.perf_counter() - started, error=True)
+                raise
+            registry.observe(operation, time.perf_counter() - started)
+            return result
+        return wrapper
+    return decorate
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording every HTTP request
+
+    Requests are labelled with the route template (e.g. "/api/sura/{name}"),
+    so path parameters do not create new series; requests that match no
+    route (static files, websocket polling) share the "other" label.
+    """
+
+    def __init__(self, app, registry=registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.registry.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = getattr(scope.get("route"), "path", None) or "other"
+            self.registry.observe_http(scope["method"], route, status, time.perf_counter() - started)
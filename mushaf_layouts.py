@@ -0,0 +1,221 @@
+"""
+Mushaf Layouts Module
+Registry of Mushaf page layouts backed by compact, memory-mapped data files
+"""
+
+import mmap
+import os
+import struct
+import sys
+import weakref
+from array import array
+
+from quran_index import PageIndex, get_tables
+
+# Layout file format: header followed by one little-endian uint16 page per ayah
+LAYOUT_MAGIC = b"QLAY"
+LAYOUT_FORMAT_VERSION = 1
+LAYOUT_HEADER = struct.Struct("<4sHHI")  # magic, format version, page count, ayah count
+LAYOUT_EXTENSION = ".qlay"
+
+DEFAULT_LAYOUT = "madani"
+LAYOUTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "layouts")
+
+
+class MushafLayout:
+    """Page numbers of every ayah for one printed Mushaf"""
+    
+    def __init__(self, name, page_of, page_count, description=""):
+        self.name = name
+        self.page_of = page_of
+        self.page_count = page_count
+        self.description = description
+        self.tables = get_tables()
+        self.page_index = PageIndex(self.tables.ayah_index, page_of)
+        
+    def sura_page_start(self, sura_num):
+        """First page of a sura"""
+        return self.page_of[self.tables.ayah_index.to_global(sura_num, 1)]
+        
+    def sura_page_end(self, sura_num):
+        """Last page of a sura"""
+        ayah_index = self.tables.ayah_index
+        return self.page_of[ayah_index.to_global(sura_num, ayah_index.table.ayahs[sura_num])]
+        
+    def pages_between(self, start_sura, end_sura):
+        """
+        Page span from the first page of start_sura to the last page of end_sura
+        
+        Returns:
+            tuple: (start_page, end_page, total_pages)
+        """
+        start_page = self.sura_page_start(start_sura)
+        end_page = self.sura_page_end(end_sura)
+        return start_page, end_page, abs(end_page - start_page) + 1
+
+
+class BuiltinLayout(MushafLayout):
+    """The standard 604-page Madani Mushaf described by quran_data"""
+    
+    def __init__(self):
+        tables = get_tables()
+        super().__init__(DEFAULT_LAYOUT, tables.ayah_index.page_of, 604,
+                         "Standard 604-page Madani Mushaf")
+        self.page_index = tables.page_index
+        self.sura_table = tables.sura_table
+        
+    def sura_page_start(self, sura_num):
+        """First page of a sura as recorded in quran_data"""
+        return self.sura_table.page_start[sura_num]
+        
+    def sura_page_end(self, sura_num):
+        """Last page of a sura as recorded in quran_data"""
+        return self.sura_table.page_end[sura_num]
+        
+    def pages_between(self, start_sura, end_sura):
+        """Page span using the page_start/page_end values from quran_data"""
+        return self.sura_table.pages_between(start_sura, end_sura)
+
+
+class MappedLayout(MushafLayout):
+    """Layout read from a .qlay data file through a read-only memory map"""
+    
+    def __init__(self, name, path, description=""):
+        with open(path, "rb") as layout_file:
+            self._mmap = mmap.mmap(layout_file.fileno(), 0, access=mmap.ACCESS_READ)
+            
+        magic, version, page_count, ayah_count = LAYOUT_HEADER.unpack_from(self._mmap)
+        if magic != LAYOUT_MAGIC or version != LAYOUT_FORMAT_VERSION:
+            raise ValueError(f"'{path}' is not a version {LAYOUT_FORMAT_VERSION} layout file")
+        total_ayahs = get_tables().ayah_index.total_ayahs
+        if ayah_count != total_ayahs:
+            raise ValueError(f"'{path}' has {ayah_count} ayahs, expected {total_ayahs}")
+            
+        self._data = memoryview(self._mmap)[LAYOUT_HEADER.size:LAYOUT_HEADER.size + 2 * ayah_count]
+        if sys.byteorder == "little":
+            page_of = self._data.cast("H")
+        else:
+            page_of = array("H", self._data)
+            page_of.byteswap()
+            
+        super().__init__(name, page_of, page_count, description)
+        self.path = path
+        
+    def close(self):
+        """Release the memory map; the layout cannot be used afterwards"""
+        if isinstance(self.page_of, memoryview):
+            self.page_of.release()
+        self._data.release()
+        self._mmap.close()
+
+
+def write_layout_file(path, pages, page_count=None):
+    """
+    Write a .qlay layout file
+    
+    Args:
+        path (str): Destination file
+        pages (sequence): Page number of every ayah, in Mushaf order
+        page_count (int): Number of pages in the Mushaf (defaults to the last page)
+    """
+    pages = array("H", pages)
+    total_ayahs = get_tables().ayah_index.total_ayahs
+    if len(pages) != total_ayahs:
+        raise ValueError(f"Expected {total_ayahs} pages, got {len(pages)}")
+    if any(pages[i] > pages[i + 1] for i in range(len(pages) - 1)):
+        raise ValueError("Pages must be in non-decreasing Mushaf order")
+    if sys.byteorder != "little":
+        pages.byteswap()
+        
+    with open(path, "wb") as layout_file:
+        layout_file.write(LAYOUT_HEADER.pack(
+            LAYOUT_MAGIC, LAYOUT_FORMAT_VERSION, page_count or max(pages), len(pages)
+        ))
+        layout_file.write(pages.tobytes())
+
+
+# Registered layouts: name -> (path, description); files are only opened on first use
+_registry = {DEFAULT_LAYOUT: (None, "Standard 604-page Madani Mushaf")}
+_loaded = {}
+_scanned = False
+# Weak references to callbacks told the name of a layout that is replaced or unloaded
+_discard_callbacks = []
+
+
+def on_layout_discarded(callback):
+    """
+    Call callback(name) whenever a layout name is re-registered or unloaded
+    
+    Anything derived from the old layout (cached results, summaries) must be
+    dropped then: it may describe other pages, or read a closed memory map.
+    Only a weak reference is kept, so a bound method does not keep its
+    object alive.
+    """
+    ref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else weakref.ref(callback)
+    _discard_callbacks.append(ref)
+
+
+def _layout_discarded(name):
+    """Notify the live discard callbacks (dropping dead references)"""
+    for ref in list(_discard_callbacks):
+        callback = ref()
+        if callback is None:
+            _discard_callbacks.remove(ref)
+        else:
+            callback(name)
+
+
+def register_layout(name, path, description=""):
+    """Register a layout data file under a name (replacing any layout with that name)"""
+    _registry[name] = (path, description)
+    unload_layout(name)
+
+
+def unload_layout(name):
+    """Close a loaded layout file so its memory map is released"""
+    layout = _loaded.pop(name, None)
+    _layout_discarded(name)
+    if isinstance(layout, MappedLayout):
+        layout.close()
+
+
+def _scan_layouts_dir():
+    """Register every .qlay file in the layouts directory (names only, no reads)"""
+    global _scanned
+    _scanned = True
+    if not os.path.isdir(LAYOUTS_DIR):
+        return
+    for file_name in sorted(os.listdir(LAYOUTS_DIR)):
+        name, extension = os.path.splitext(file_name)
+        if extension == LAYOUT_EXTENSION and name not in _registry:
+            _registry[name] = (os.path.join(LAYOUTS_DIR, file_name), "")
+
+
+def get_layout_names():
+    """Return the names of all available layouts"""
+    if not _scanned:
+        _scan_layouts_dir()
+    return list(_registry)
+
+
+def get_layout(name=None):
+    """
+    Get a layout by name, loading its data file on first use
+    
+    Returns:
+        MushafLayout: The layout, or None if no layout has that name
+    """
+    name = name or DEFAULT_LAYOUT
+    layout = _loaded.get(name)
+    if layout is not None:
+        return layout
+        
+    if name not in _registry and not _scanned:
+        _scan_layouts_dir()
+    if name not in _registry:
+        return None
+        
+    path, description = _registry[name]
+    layout = BuiltinLayout() if path is None else MappedLayout(name, path, description)
+    _loaded[name] = layout
+    return layout
@@ -0,0 +1,123 @@
+"""
+Pair Matrix Module
+Precomputed results for every ordered pair of suras, cached on disk
+
+Only 114 x 114 sura pairs exist, so their totals are computed once,
+stored in a small versioned file next to the data and answered with a
+single array lookup afterwards.
+"""
+
+import os
+import struct
+import sys
+from array import array
+
+from quran_index import get_tables
+
+PAIRS_MAGIC = b"QPAR"
+PAIRS_FORMAT_VERSION = 1
+PAIRS_HEADER = struct.Struct("<4sHH40s")  # magic, format version, sura count, source fingerprint
+PAIRS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "quran_pairs.bin")
+
+
+class PairMatrix:
+    """Ayah totals, page spans and sura counts for every (first, second) sura pair"""
+
+    def __init__(self, count, total_ayahs, start_pages, end_pages):
+        self.count = count
+        # Row-major by (first - 1) * count + (second - 1)
+        self.total_ayahs = total_ayahs
+        self.start_pages = start_pages
+        self.end_pages = end_pages
+
+    @classmethod
+    def build(cls, mushaf):
+        """Compute the matrix from the prefix-sum table and a layout"""
+        table = get_tables().sura_table
+        count = table.count
+        total_ayahs = array("I")
+        start_pages = array("H")
+        end_pages = array("H")
+        for first in range(1, count + 1):
+            for second in range(1, count + 1):
+                start, end = min(first, second), max(first, second)
+                start_page, end_page, _ = mushaf.pages_between(start, end)
+                total_ayahs.append(table.ayahs_between(start, end))
+                start_pages.append(start_page)
+                end_pages.append(end_page)
+        return cls(count, total_ayahs, start_pages, end_pages)
+
+    def _index(self, first, second):
+        return (first - 1) * self.count + (second - 1)
+
+    def lookup(self, first, second):
+        """
+        Totals for a sura pair with a single table lookup
+
+        Returns:
+            tuple: (total_ayahs, start_page, end_page, total_pages, number_of_suras)
+        """
+        index = self._index(first, second)
+        start_page, end_page = self.start_pages[index], self.end_pages[index]
+        return (self.total_ayahs[index], start_page, end_page,
+                abs(end_page - start_page) + 1, abs(second - first) + 1)
+
+    def save(self, path=PAIRS_PATH):
+        """Write the matrix to a versioned binary file"""
+        from quran_snapshot import source_fingerprint  # hashlib is only needed when saving or loading
+        fingerprint = (source_fingerprint() or "").encode()
+        columns = [array(column.typecode, column) for column in
+                   (self.total_ayahs, self.start_pages, self.end_pages)]
+        if sys.byteorder != "little":
+            for column in columns:
+                column.byteswap()
+        with open(path, "wb") as pairs_file:
+            pairs_file.write(PAIRS_HEADER.pack(PAIRS_MAGIC, PAIRS_FORMAT_VERSION, self.count, fingerprint))
+            for column in columns:
+                pairs_file.write(column.tobytes())
+
+    @classmethod
+    def load(cls, path=PAIRS_PATH):
+        """
+        Read a matrix file
+
+        Returns:
+            PairMatrix: The matrix, or None if the file is missing, stale or from another version
+        """
+        try:
+            with open(path, "rb") as pairs_file:
+                data = pairs_file.read()
+            magic, version, count, fingerprint = PAIRS_HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return None
+
+        from quran_snapshot import source_fingerprint
+        expected = (source_fingerprint() or "").encode()
+        if magic != PAIRS_MAGIC or version != PAIRS_FORMAT_VERSION or fingerprint.rstrip(b"\0") != expected:
+            return None
+
+        columns = []
+        offset = PAIRS_HEADER.size
+        for typecode in ("I", "H", "H"):
+            column = array(typecode)
+            size = column.itemsize * count * count
+            column.frombytes(data[offset:offset + size])
+            if sys.byteorder != "little":
+                column.byteswap()
+            columns.append(column)
+            offset += size
+        if len(columns[-1]) != count * count:
+            return None
+        return cls(count, *columns)
+
+    @classmethod
+    def load_or_build(cls, mushaf, path=PAIRS_PATH):
+        """Load the cached matrix, or build and cache it when missing or stale"""
+        matrix = cls.load(path)
+        if matrix is None:
+            matrix = cls.build(mushaf)
+            try:
+                matrix.save(path)
+            except OSError:
+                pass  # Read-only install: keep the in-memory matrix
+        return matrix
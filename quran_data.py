@@ -128,26 +128,240 @@ SURAS = {
     114: {"name": "An-Nas", "ayahs": 6, "arabic": "الناس", "page_start": 604, "page_end": 604}
 }
 
+# First ayah of each juz as (sura, ayah, page in the standard 604-page Mushaf)
+JUZ_STARTS = [
+    (1, 1, 1), (2, 142, 22), (2, 253, 42), (3, 93, 62), (4, 24, 82),
+    (4, 148, 102), (5, 82, 121), (6, 111, 142), (7, 88, 162), (8, 41, 182),
+    (9, 93, 201), (11, 6, 222), (12, 53, 242), (15, 1, 262), (17, 1, 282),
+    (18, 75, 302), (21, 1, 322), (23, 1, 342), (25, 21, 362), (27, 56, 382),
+    (29, 46, 402), (33, 31, 422), (36, 28, 442), (39, 32, 462), (41, 47, 482),
+    (46, 1, 502), (51, 31, 522), (58, 1, 542), (67, 1, 562), (78, 1, 582)
+]
+
+# First ayah of each rub' al-hizb (quarter) as (sura, ayah); every 4th starts
+# a hizb and every 8th starts a juz
+HIZB_QUARTER_STARTS = [
+    (1, 1), (2, 26), (2, 44), (2, 60), (2, 75), (2, 92), (2, 106), (2, 124),
+    (2, 142), (2, 158), (2, 177), (2, 189), (2, 203), (2, 219), (2, 233), (2, 243),
+    (2, 253), (2, 263), (2, 272), (2, 283), (3, 15), (3, 33), (3, 52), (3, 75),
+    (3, 93), (3, 113), (3, 133), (3, 153), (3, 171), (3, 186), (4, 1), (4, 12),
+    (4, 24), (4, 36), (4, 58), (4, 74), (4, 88), (4, 100), (4, 114), (4, 135),
+    (4, 148), (4, 163), (5, 1), (5, 12), (5, 27), (5, 41), (5, 51), (5, 67),
+    (5, 82), (5, 97), (5, 109), (6, 13), (6, 36), (6, 59), (6, 74), (6, 95),
+    (6, 111), (6, 127), (6, 141), (6, 151), (7, 1), (7, 31), (7, 47), (7, 65),
+    (7, 88), (7, 117), (7, 142), (7, 156), (7, 171), (7, 189), (8, 1), (8, 22),
+    (8, 41), (8, 61), (9, 1), (9, 19), (9, 34), (9, 46), (9, 60), (9, 75),
+    (9, 93), (9, 111), (9, 122), (10, 11), (10, 26), (10, 53), (10, 71), (10, 90),
+    (11, 6), (11, 24), (11, 41), (11, 61), (11, 84), (11, 108), (12, 7), (12, 30),
+    (12, 53), (12, 77), (12, 101), (13, 5), (13, 19), (13, 35), (14, 10), (14, 28),
+    (15, 1), (15, 50), (16, 1), (16, 30), (16, 51), (16, 75), (16, 90), (16, 111),
+    (17, 1), (17, 23), (17, 50), (17, 70), (17, 99), (18, 17), (18, 32), (18, 51),
+    (18, 75), (18, 99), (19, 22), (19, 59), (20, 1), (20, 55), (20, 83), (20, 111),
+    (21, 1), (21, 29), (21, 51), (21, 83), (22, 1), (22, 19), (22, 38), (22, 60),
+    (23, 1), (23, 36), (23, 75), (24, 1), (24, 21), (24, 35), (24, 53), (25, 1),
+    (25, 21), (25, 53), (26, 1), (26, 52), (26, 111), (26, 181), (27, 1), (27, 27),
+    (27, 56), (27, 82), (28, 12), (28, 29), (28, 51), (28, 76), (29, 1), (29, 26),
+    (29, 46), (30, 1), (30, 31), (30, 54), (31, 22), (32, 11), (33, 1), (33, 18),
+    (33, 31), (33, 51), (33, 60), (34, 10), (34, 24), (34, 46), (35, 15), (35, 41),
+    (36, 28), (36, 60), (37, 22), (37, 83), (37, 145), (38, 21), (38, 52), (39, 8),
+    (39, 32), (39, 53), (40, 1), (40, 21), (40, 41), (40, 66), (41, 9), (41, 25),
+    (41, 47), (42, 13), (42, 27), (42, 51), (43, 24), (43, 57), (44, 17), (45, 12),
+    (46, 1), (46, 21), (47, 10), (47, 33), (48, 18), (49, 1), (49, 14), (50, 27),
+    (51, 31), (52, 24), (53, 26), (54, 9), (55, 1), (56, 1), (56, 75), (57, 16),
+    (58, 1), (58, 14), (59, 11), (60, 7), (62, 1), (63, 4), (65, 1), (66, 1),
+    (67, 1), (68, 1), (69, 1), (70, 19), (72, 1), (73, 20), (75, 1), (76, 19),
+    (78, 1), (80, 1), (82, 1), (84, 1), (87, 1), (90, 1), (94, 1), (100, 9)
+]
+
+# Common transliteration variants for sura names (in addition to the names above)
+SURA_ALIASES = {
+    1: ["Fatihah", "Al-Fatihah", "The Opening"],
+    2: ["Al Baqara", "Baqara", "Al-Baqara"],
+    3: ["Al-Imran", "Ali Imran", "Al Imran", "Aal Imran"],
+    4: ["An-Nisaa", "Nisaa"],
+    5: ["Al-Maida", "Al-Maaidah", "Maida"],
+    6: ["Al-Anaam", "Al-An'am"],
+    7: ["Al-A'raf", "Al-Aaraf"],
+    9: ["At-Tauba", "Taubah", "Tawba", "Bara'ah"],
+    13: ["Ar-Ra'd"],
+    14: ["Ibraheem"],
+    17: ["Al-Israa", "Bani Israil", "Bani Isra'il"],
+    18: ["Kahaf"],
+    19: ["Mariam", "Maryem"],
+    20: ["Ta-Ha", "Ta Ha"],
+    23: ["Al-Muminoon", "Al-Mu'minun"],
+    26: ["Ash-Shu'ara", "Shuara"],
+    29: ["Al-Ankaboot"],
+    30: ["Ar-Room"],
+    32: ["As-Sajda", "Sajda"],
+    34: ["Saba'"],
+    36: ["Yaseen", "Yasin", "Ya Sin", "Yasiin"],
+    37: ["As-Saaffat"],
+    38: ["Saad", "Suad"],
+    40: ["Al-Mumin", "Al-Mu'min"],
+    41: ["Ha-Mim As-Sajdah"],
+    42: ["Ash-Shura", "Shura"],
+    45: ["Al-Jathiya", "Jasiya"],
+    47: ["Al-Qital"],
+    50: ["Qaaf"],
+    51: ["Adh-Dhariyaat", "Az-Zariyat"],
+    52: ["At-Toor"],
+    55: ["Ar-Rahmaan", "Rehman"],
+    56: ["Al-Waqia", "Al-Waqi'ah", "Waqiah"],
+    57: ["Al-Hadeed"],
+    58: ["Al-Mujadalah", "Al-Mujadilah"],
+    60: ["Al-Mumtahina"],
+    62: ["Al-Jumu'ah", "Jumah", "Al-Jumua"],
+    63: ["Al-Munafiqoon"],
+    66: ["At-Tahreem"],
+    67: ["Mulk", "Tabarak"],
+    69: ["Al-Haaqqa", "Al-Haqqa"],
+    70: ["Al-Ma'arij"],
+    71: ["Nooh"],
+    73: ["Al-Muzzamil"],
+    74: ["Al-Muddathir", "Al-Mudathir"],
+    75: ["Al-Qiyama"],
+    76: ["Ad-Dahr", "Al-Insaan"],
+    78: ["An-Nabaa", "Amma"],
+    79: ["An-Nazi'at"],
+    81: ["At-Takweer"],
+    83: ["Al-Mutaffifeen"],
+    84: ["Al-Inshiqaaq"],
+    85: ["Al-Burooj"],
+    87: ["Al-A'la", "Al-Aala"],
+    88: ["Al-Ghashiya"],
+    92: ["Al-Lail"],
+    93: ["Ad-Duha"],
+    94: ["Al-Inshirah", "Alam Nashrah"],
+    95: ["At-Teen"],
+    96: ["Iqra"],
+    98: ["Al-Bayyina"],
+    99: ["Az-Zilzal", "Zilzal"],
+    100: ["Al-Aadiyat", "Al-'Adiyat"],
+    101: ["Al-Qari'ah", "Al-Qaria"],
+    103: ["Asr"],
+    104: ["Al-Humaza"],
+    106: ["Quraish", "Qureysh"],
+    107: ["Al-Ma'un"],
+    108: ["Al-Kauthar", "Kausar"],
+    109: ["Al-Kafiroon"],
+    111: ["Al-Lahab", "Lahab", "Tabbat"],
+    112: ["Al-Ikhlaas", "At-Tawhid"],
+    114: ["An-Naas"]
+}
+
+# Leading articles that may be omitted when typing a transliterated name
+_ARTICLES = ("al", "an", "ar", "as", "at", "ash", "az", "ad", "adh", "aal e")
+_ARABIC_ARTICLE = "ال"
+
+# Arabic spelling variants: diacritics, Quranic marks and tatweel are dropped,
+# alef, yaa, taa marbuta and hamza-seat variants map to one letter
+_ARABIC_DROPPED = (
+    [chr(code) for code in range(0x064B, 0x0660)]  # Tashkeel (fatha, damma, kasra, shadda, sukun, ...)
+    + ["\u0670", "\u0640"]  # Superscript alef, tatweel
+    + [chr(code) for code in range(0x06D6, 0x06EE) if code not in (0x06DD, 0x06DE, 0x06E9)]  # Quranic marks
+)
+_ARABIC_VARIANTS = {
+    "أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا",
+    "ى": "ي", "ی": "ي", "ئ": "ي",
+    "ة": "ه",
+    "ؤ": "و",
+    "ک": "ك"
+}
+_ARABIC_TRANSLATION = str.maketrans({**_ARABIC_VARIANTS, **dict.fromkeys(_ARABIC_DROPPED)})
+# Name keys additionally drop separators, all in one translate pass
+_NAME_TRANSLATION = str.maketrans({
+    **_ARABIC_VARIANTS, **dict.fromkeys(_ARABIC_DROPPED), **dict.fromkeys(" -_'`’‘")
+})
+
+
+def normalize_arabic(text):
+    """Fold Arabic spelling variants: strip diacritics and tatweel, unify alef, yaa and taa marbuta"""
+    return str(text).translate(_ARABIC_TRANSLATION)
+
+
+def normalize_search_text(text):
+    """Case-fold text and fold Arabic variants, keeping separators (for substring search)"""
+    return str(text).casefold().translate(_ARABIC_TRANSLATION)
+
+
+def normalize_sura_name(name):
+    """Case-fold a sura name, fold Arabic variants and drop separators so spelling variants share one key"""
+    return str(name).strip().casefold().translate(_NAME_TRANSLATION)
+
+
+def build_name_index():
+    """Build the lookup table from every accepted spelling to its sura number"""
+    index = {}
+    article_free = {}
+    
+    for num, sura in SURAS.items():
+        names = [sura["name"], sura["arabic"], str(num)] + SURA_ALIASES.get(num, [])
+        for name in names:
+            index.setdefault(normalize_sura_name(name), num)
+            
+        # Also accept the name without its leading article, e.g. "Baqarah"
+        for name in [sura["name"]] + SURA_ALIASES.get(num, []):
+            words = name.casefold().replace("-", " ").split()
+            for article in _ARTICLES:
+                article_words = article.split()
+                if len(words) > len(article_words) and words[:len(article_words)] == article_words:
+                    key = normalize_sura_name("".join(words[len(article_words):]))
+                    article_free.setdefault(key, set()).add(num)
+                    
+        # And the Arabic name without "ال", e.g. "بقرة"
+        arabic_key = normalize_sura_name(sura["arabic"])
+        if arabic_key.startswith(_ARABIC_ARTICLE) and len(arabic_key) > len(_ARABIC_ARTICLE) + 1:
+            article_free.setdefault(arabic_key[len(_ARABIC_ARTICLE):], set()).add(num)
+                    
+    # Article-free forms only count when they are unambiguous
+    for key, numbers in article_free.items():
+        if len(numbers) == 1 and key not in index:
+            index[key] = numbers.pop()
+            
+    return index
+
+
+# Normalized name/alias/number -> sura number, loaded on first lookup
+_name_index = None
+
+
+def get_name_index():
+    """Return the name index, loading it from the snapshot (or building it) on first use"""
+    global _name_index
+    if _name_index is None:
+        from quran_snapshot import load_snapshot
+        snapshot = load_snapshot()
+        _name_index = snapshot["name_index"] if snapshot else build_name_index()
+    return _name_index
+
+
+def __getattr__(name):
+    """Expose SURA_NAME_INDEX lazily"""
+    if name == "SURA_NAME_INDEX":
+        return get_name_index()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_sura_names():
     """Return a list of all sura names for autocomplete"""
     return [sura["name"] for sura in SURAS.values()]
 
 def get_sura_by_name(name):
-    """Find sura by name (case-insensitive)"""
-    for num, sura in SURAS.items():
-        if sura["name"].lower() == name.lower():
-            return num, sura
-    return None, None
+    """Find sura by name, Arabic name, number or common alias (case-insensitive)"""
+    sura_num = get_name_index().get(normalize_sura_name(name))
+    if sura_num is None:
+        return None, None
+    return sura_num, SURAS[sura_num]
 
 def get_sura_number_by_name(name):
     """Get sura number by name"""
-    sura_num, _ = get_sura_by_name(name)
-    return sura_num
+    return get_name_index().get(normalize_sura_name(name))
 
 def is_valid_sura_name(name):
     """Check if a sura name is valid"""
-    return any(sura["name"].lower() == name.lower() for sura in SURAS.values())
+    return normalize_sura_name(name) in get_name_index()
 
 def get_total_ayahs():
     """Get total number of ayahs in the Quran"""
-    return sum(sura["ayahs"] for sura in SURAS.values()) 
\ No newline at end of file
+    return sum(sura["ayahs"] for sura in SURAS.values())
@@ -0,0 +1,399 @@
+"""
+Quran Index Module
+Compact, array-backed lookup tables derived from quran_data
+
+The shared tables are created on first use, from the precompiled
+snapshot when it is available (see quran_snapshot.py).
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from quran_data import HIZB_QUARTER_STARTS, JUZ_STARTS, SURAS, get_sura_number_by_name
+
+
+class SuraTable:
+    """Columnar sura table with prefix sums for O(1) range totals
+
+    All columns are 1-based (index 0 is padding) so a sura number can be
+    used directly as an index.
+    """
+
+    def __init__(self, suras=SURAS):
+        numbers = sorted(suras)
+        self.count = len(numbers)
+
+        self.ayahs = array("H", [0])
+        self.page_start = array("H", [0])
+        self.page_end = array("H", [0])
+        # ayah_prefix[n] holds the total ayahs of suras 1..n
+        self.ayah_prefix = array("I", [0])
+
+        running_total = 0
+        for sura_num in numbers:
+            sura = suras[sura_num]
+            running_total += sura["ayahs"]
+            self.ayahs.append(sura["ayahs"])
+            self.page_start.append(sura["page_start"])
+            self.page_end.append(sura["page_end"])
+            self.ayah_prefix.append(running_total)
+
+        self.total_ayahs = running_total
+
+    def to_snapshot(self):
+        """Plain data for the binary snapshot"""
+        return {
+            "ayahs": _pack(self.ayahs),
+            "page_start": _pack(self.page_start),
+            "page_end": _pack(self.page_end),
+            "ayah_prefix": _pack(self.ayah_prefix)
+        }
+
+    @classmethod
+    def from_snapshot(cls, data):
+        """Rebuild the table from snapshot data without touching SURAS"""
+        table = cls.__new__(cls)
+        table.ayahs = _unpack(data["ayahs"])
+        table.page_start = _unpack(data["page_start"])
+        table.page_end = _unpack(data["page_end"])
+        table.ayah_prefix = _unpack(data["ayah_prefix"])
+        table.count = len(table.ayahs) - 1
+        table.total_ayahs = table.ayah_prefix[-1]
+        return table
+
+    def is_valid_number(self, sura_num):
+        """Check if a sura number is inside the table"""
+        return isinstance(sura_num, int) and 1 <= sura_num <= self.count
+
+    def ayahs_between(self, start_sura, end_sura):
+        """Total ayahs from start_sura to end_sura (inclusive, start <= end)"""
+        return self.ayah_prefix[end_sura] - self.ayah_prefix[start_sura - 1]
+
+    def pages_between(self, start_sura, end_sura):
+        """
+        Page span from the first page of start_sura to the last page of end_sura
+
+        Returns:
+            tuple: (start_page, end_page, total_pages)
+        """
+        start_page = self.page_start[start_sura]
+        end_page = self.page_end[end_sura]
+        return start_page, end_page, abs(end_page - start_page) + 1
+
+    def range_totals(self, start_sura, end_sura):
+        """
+        Totals for an inclusive sura range in constant time
+
+        Returns:
+            tuple: (total_ayahs, total_pages, number_of_suras)
+        """
+        _, _, total_pages = self.pages_between(start_sura, end_sura)
+        return (
+            self.ayahs_between(start_sura, end_sura),
+            total_pages,
+            end_sura - start_sura + 1
+        )
+
+
+class AyahIndex:
+    """Ayah-level coordinate table for all ayahs of the Quran
+
+    Every ayah has a 0-based global index. Conversions between global
+    indexes and (sura, ayah) positions, and page/juz lookups, are O(1)
+    array reads.
+
+    Pages are exact at sura and juz boundaries and interpolated linearly
+    between them, since quran_data only records pages per sura and juz.
+    """
+
+    def __init__(self, table, juz_starts=JUZ_STARTS):
+        self.table = table
+        self.total_ayahs = table.total_ayahs
+
+        # Sura number of every ayah (one byte each)
+        self.sura_of = array("B")
+        for sura_num in range(1, table.count + 1):
+            self.sura_of.extend([sura_num] * table.ayahs[sura_num])
+
+        self.juz_start_index = array("H", [
+            self.to_global(sura_num, ayah_num) for sura_num, ayah_num, _ in juz_starts
+        ])
+        self.juz_of = array("B")
+        for juz_num, start in enumerate(self.juz_start_index, start=1):
+            end = (self.juz_start_index[juz_num]
+                   if juz_num < len(self.juz_start_index) else self.total_ayahs)
+            self.juz_of.extend([juz_num] * (end - start))
+
+        self.page_of = self._build_pages(juz_starts)
+
+    def to_snapshot(self):
+        """Plain data for the binary snapshot"""
+        return {
+            "sura_of": _pack(self.sura_of),
+            "juz_start_index": _pack(self.juz_start_index),
+            "juz_of": _pack(self.juz_of),
+            "page_of": _pack(self.page_of)
+        }
+
+    @classmethod
+    def from_snapshot(cls, table, data):
+        """Rebuild the index from snapshot data"""
+        index = cls.__new__(cls)
+        index.table = table
+        index.total_ayahs = table.total_ayahs
+        index.sura_of = _unpack(data["sura_of"])
+        index.juz_start_index = _unpack(data["juz_start_index"])
+        index.juz_of = _unpack(data["juz_of"])
+        index.page_of = _unpack(data["page_of"])
+        return index
+
+    def _build_pages(self, juz_starts):
+        """Estimate the page of every ayah from sura and juz page anchors"""
+        anchors = {}
+        for sura_num in range(1, self.table.count + 1):
+            first = self.to_global(sura_num, 1)
+            last = first + self.table.ayahs[sura_num] - 1
+            page_start = self.table.page_start[sura_num]
+            anchors[first] = page_start
+            anchors[last] = max(page_start, self.table.page_end[sura_num])
+        # Juz pages are exact, so they win over interpolated sura values
+        for sura_num, ayah_num, page in juz_starts:
+            anchors[self.to_global(sura_num, ayah_num)] = page
+
+        pages = array("H", [0]) * self.total_ayahs
+        points = sorted(anchors.items())
+        previous_page = 0
+        for (g0, p0), (g1, p1) in zip(points, points[1:] + points[-1:]):
+            # Keep pages non-decreasing even if the source data overlaps
+            p0 = max(p0, previous_page)
+            p1 = max(p1, p0)
+            span = g1 - g0
+            for g in range(g0, g1 + 1):
+                pages[g] = p0 + ((g - g0) * (p1 - p0) // span if span else 0)
+            previous_page = p1
+        return pages
+
+    def to_global(self, sura_num, ayah_num):
+        """Convert a (sura, ayah) position to its 0-based global index"""
+        return self.table.ayah_prefix[sura_num - 1] + ayah_num - 1
+
+    def to_position(self, index):
+        """Convert a 0-based global index back to (sura, ayah)"""
+        sura_num = self.sura_of[index]
+        return sura_num, index - self.table.ayah_prefix[sura_num - 1] + 1
+
+    def is_valid_position(self, sura_num, ayah_num):
+        """Check that a (sura, ayah) pair exists"""
+        return (self.table.is_valid_number(sura_num)
+                and isinstance(ayah_num, int)
+                and 1 <= ayah_num <= self.table.ayahs[sura_num])
+
+    def page(self, sura_num, ayah_num):
+        """Page of an ayah in the standard Mushaf"""
+        return self.page_of[self.to_global(sura_num, ayah_num)]
+
+    def juz(self, sura_num, ayah_num):
+        """Juz number (1-30) containing an ayah"""
+        return self.juz_of[self.to_global(sura_num, ayah_num)]
+
+
+class PageIndex:
+    """Reverse lookup from Mushaf pages to the ayahs printed on them
+
+    The per-ayah page column is sorted, so the first and last ayah of any
+    page are found with a binary search instead of a scan.
+    """
+
+    def __init__(self, ayah_index, page_of=None):
+        self.ayah_index = ayah_index
+        # Any sorted per-ayah page sequence works, e.g. a memory-mapped layout
+        self.page_of = ayah_index.page_of if page_of is None else page_of
+        self.first_page = self.page_of[0]
+        self.last_page = self.page_of[-1]
+
+    def is_valid_page(self, page):
+        """Check if a page number exists in the Mushaf"""
+        return isinstance(page, int) and self.first_page <= page <= self.last_page
+
+    def ayah_span(self, start_page, end_page=None):
+        """
+        Global indexes of the first and last ayah on a page or page range
+
+        Returns:
+            tuple: (first_index, last_index), or None if no ayah starts there
+        """
+        if end_page is None:
+            end_page = start_page
+        first_index = bisect_left(self.page_of, start_page)
+        last_index = bisect_right(self.page_of, end_page) - 1
+        if first_index > last_index:
+            return None
+        return first_index, last_index
+
+    def sura_span(self, start_page, end_page=None):
+        """
+        First and last sura touched by a page or page range
+
+        Returns:
+            tuple: (first_sura, last_sura), or None if the pages hold no ayahs
+        """
+        span = self.ayah_span(start_page, end_page)
+        if span is None:
+            return None
+        return self.ayah_index.sura_of[span[0]], self.ayah_index.sura_of[span[1]]
+
+
+# Number of quarters (rub' al-hizb) in each division unit
+DIVISION_UNITS = {"juz": 8, "hizb": 4, "quarter": 1}
+
+
+class DivisionIndex:
+    """Juz, hizb and quarter boundaries as sorted global ayah indexes
+
+    Finding the division that contains an ayah, or the next boundary after
+    it, is a binary search over at most 240 entries.
+    """
+
+    def __init__(self, ayah_index, quarter_starts=HIZB_QUARTER_STARTS):
+        self.ayah_index = ayah_index
+        quarters = array("H", [ayah_index.to_global(*start) for start in quarter_starts])
+        self.starts = {
+            unit: quarters[::step] for unit, step in DIVISION_UNITS.items()
+        }
+
+    def to_snapshot(self):
+        """Plain data for the binary snapshot"""
+        return {unit: _pack(starts) for unit, starts in self.starts.items()}
+
+    @classmethod
+    def from_snapshot(cls, ayah_index, data):
+        """Rebuild the index from snapshot data"""
+        index = cls.__new__(cls)
+        index.ayah_index = ayah_index
+        index.starts = {unit: _unpack(starts) for unit, starts in data.items()}
+        return index
+
+    def count(self, unit):
+        """Number of divisions of a unit (30 juz, 60 hizb, 240 quarters)"""
+        return len(self.starts[unit])
+
+    def is_valid_number(self, unit, number):
+        """Check if a division number exists for a unit"""
+        return (unit in self.starts and isinstance(number, int)
+                and 1 <= number <= len(self.starts[unit]))
+
+    def division_of(self, unit, index):
+        """Division number (1-based) containing a global ayah index"""
+        return bisect_right(self.starts[unit], index)
+
+    def ayah_span(self, unit, first, last):
+        """
+        Global indexes of the first and last ayah of divisions first..last
+
+        Returns:
+            tuple: (start_index, end_index)
+        """
+        starts = self.starts[unit]
+        end_index = starts[last] - 1 if last < len(starts) else self.ayah_index.total_ayahs - 1
+        return starts[first - 1], end_index
+
+    def next_boundary(self, unit, index):
+        """
+        First division that starts after a global ayah index
+
+        Returns:
+            tuple: (division_number, start_index), or None after the last boundary
+        """
+        following = bisect_right(self.starts[unit], index)
+        if following >= len(self.starts[unit]):
+            return None
+        return following + 1, self.starts[unit][following]
+
+
+def parse_position(value):
+    """
+    Parse an ayah position such as (2, 142), "2:142" or "Al-Baqarah:142"
+
+    Returns:
+        tuple: (sura_num, ayah_num), or None if the value cannot be parsed
+    """
+    if isinstance(value, (tuple, list)) and len(value) == 2:
+        sura_part, ayah_part = value
+    elif isinstance(value, str) and ":" in value:
+        sura_part, _, ayah_part = value.strip().rpartition(":")
+    else:
+        return None
+
+    sura_num = sura_part if isinstance(sura_part, int) else get_sura_number_by_name(sura_part)
+    try:
+        ayah_num = int(ayah_part)
+    except (TypeError, ValueError):
+        return None
+    if sura_num is None or not get_tables().ayah_index.is_valid_position(sura_num, ayah_num):
+        return None
+    return sura_num, ayah_num
+
+
+def _pack(values):
+    """Turn an array into marshal-friendly (typecode, bytes)"""
+    return values.typecode, values.tobytes()
+
+
+def _unpack(packed):
+    """Inverse of _pack"""
+    typecode, data = packed
+    values = array(typecode)
+    values.frombytes(data)
+    return values
+
+
+class QuranTables:
+    """The shared set of indexes used by the calculator"""
+
+    def __init__(self, sura_table, ayah_index, division_index):
+        self.sura_table = sura_table
+        self.ayah_index = ayah_index
+        self.page_index = PageIndex(ayah_index)
+        self.division_index = division_index
+
+    def to_snapshot(self):
+        """Plain data for the binary snapshot"""
+        return {
+            "sura_table": self.sura_table.to_snapshot(),
+            "ayah_index": self.ayah_index.to_snapshot(),
+            "division_index": self.division_index.to_snapshot()
+        }
+
+    @classmethod
+    def from_snapshot(cls, data):
+        """Rebuild every table from snapshot data"""
+        table = SuraTable.from_snapshot(data["sura_table"])
+        ayahs = AyahIndex.from_snapshot(table, data["ayah_index"])
+        return cls(table, ayahs, DivisionIndex.from_snapshot(ayahs, data["division_index"]))
+
+
+def build_tables():
+    """Build every table from quran_data"""
+    table = SuraTable()
+    ayahs = AyahIndex(table)
+    return QuranTables(table, ayahs, DivisionIndex(ayahs))
+
+
+_tables = None
+
+
+def get_tables():
+    """Return the shared tables, loading them on first use"""
+    global _tables
+    if _tables is None:
+        from quran_snapshot import load_snapshot
+        snapshot = load_snapshot()
+        _tables = QuranTables.from_snapshot(snapshot["tables"]) if snapshot else build_tables()
+    return _tables
+
+
+def __getattr__(name):
+    """Expose the shared sura_table, ayah_index, page_index and division_index lazily"""
+    if name in ("sura_table", "ayah_index", "page_index", "division_index"):
+        return getattr(get_tables(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Quran Snapshot Module
+Precompiled binary snapshot of quran_data and every derived index
+
+The snapshot is a marshal file written by the build step below and read
+lazily on first use, so importing the calculator does not rebuild any
+tables. It is ignored (and the tables are rebuilt from source) when it is
+missing or was built from different source files.
+
+Usage:
+    python quran_snapshot.py
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "quran_snapshot.bin")
+
+# Source files the snapshot is derived from; any change makes it stale
+SOURCE_FILES = ("quran_data.py", "quran_index.py")
+
+_cache = {}
+
+
+def source_fingerprint():
+    """
+    Hash the snapshot source files
+
+    Returns:
+        str: Hex digest, or None when the sources are not available (frozen builds)
+    """
+    digest = hashlib.sha1(str(SNAPSHOT_VERSION).encode())
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    for file_name in SOURCE_FILES:
+        try:
+            with open(os.path.join(base_dir, file_name), "rb") as source_file:
+                digest.update(source_file.read())
+        except OSError:
+            return None
+    return digest.hexdigest()
+
+
+def load_snapshot(path=SNAPSHOT_PATH):
+    """
+    Load the snapshot once per process
+
+    Returns:
+        dict: Snapshot contents, or None if it is missing or stale
+    """
+    if path in _cache:
+        return _cache[path]
+
+    snapshot = None
+    try:
+        with open(path, "rb") as snapshot_file:
+            data = marshal.loads(snapshot_file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        data = None
+
+    if (isinstance(data, dict)
+            and data.get("version") == SNAPSHOT_VERSION
+            and data.get("byteorder") == sys.byteorder):
+        fingerprint = source_fingerprint()
+        if fingerprint is None or fingerprint == data.get("fingerprint"):
+            snapshot = data
+
+    _cache[path] = snapshot
+    return snapshot
+
+
+def build_snapshot():
+    """Build snapshot contents from quran_data and freshly built indexes"""
+    from quran_data import build_name_index
+    from quran_index import build_tables
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "byteorder": sys.byteorder,
+        "fingerprint": source_fingerprint(),
+        "name_index": build_name_index(),
+        "tables": build_tables().to_snapshot()
+    }
+
+
+def write_snapshot(path=SNAPSHOT_PATH):
+    """Build the snapshot and write it to disk"""
+    with open(path, "wb") as snapshot_file:
+        snapshot_file.write(marshal.dumps(build_snapshot()))
+    _cache.pop(path, None)
+    return path
+
+
+def main():
+    """Main function to rebuild the snapshot file"""
+    path = write_snapshot()
+    print(f"✓ Wrote {path} ({os.path.getsize(path)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Range Result Module
+Lightweight, dict-compatible result object for sura range calculations
+"""
+
+from collections.abc import Mapping
+
+from result_cache import freeze
+
+
+class RangeResult(Mapping):
+    """Result of QuranCalculator.calculate_ayahs_between_suras
+
+    Totals are computed eagerly. The descriptive sub-objects (sura
+    summaries, included_suras, page_info, ...) are only built the first
+    time they are read, so callers that only need the totals pay for a
+    single small object. Behaves like a read-only dict for existing callers.
+
+    Results are shared through the calculator's cache, so they are
+    immutable: attributes cannot be reassigned and built values are frozen
+    (FrozenDict and tuples).
+    """
+
+    __slots__ = (
+        "total_ayahs", "total_pages", "start_page", "end_page", "direction",
+        "is_forward", "number_of_suras", "first_sura", "second_sura",
+        "start_sura", "end_sura", "_calculator", "_mushaf", "_built"
+    )
+
+    success = True
+
+    # Keys in the same order as the dict this object replaces
+    KEYS = (
+        "success", "total_ayahs", "total_pages", "page_range", "direction",
+        "is_forward", "direction_description", "original_order",
+        "calculation_order", "start_sura", "end_sura", "first_selected_sura",
+        "second_selected_sura", "included_suras", "number_of_suras", "page_info"
+    )
+    EAGER_KEYS = frozenset((
+        "success", "total_ayahs", "total_pages", "direction", "is_forward", "number_of_suras"
+    ))
+
+    def __init__(self, calculator, mushaf, first_sura, second_sura, totals=None):
+        is_forward = first_sura < second_sura
+        # For calculation purposes, always use the correct chronological order
+        start_sura = min(first_sura, second_sura)
+        end_sura = max(first_sura, second_sura)
+
+        if totals is not None:
+            # Precomputed (total_ayahs, start_page, end_page, total_pages) from the pair matrix
+            total_ayahs, start_page, end_page, total_pages = totals
+        else:
+            # Totals come from the prefix-sum table, so cost does not grow with range width
+            total_ayahs = calculator.table.ayahs_between(start_sura, end_sura)
+            start_page, end_page, total_pages = mushaf.pages_between(start_sura, end_sura)
+
+        # Slots are assigned through object.__setattr__ because __setattr__ is blocked
+        set_slot = object.__setattr__
+        set_slot(self, "_calculator", calculator)
+        set_slot(self, "_mushaf", mushaf)
+        set_slot(self, "_built", None)
+        set_slot(self, "first_sura", first_sura)
+        set_slot(self, "second_sura", second_sura)
+        set_slot(self, "is_forward", is_forward)
+        set_slot(self, "direction", "forward" if is_forward else "reverse")
+        set_slot(self, "start_sura", start_sura)
+        set_slot(self, "end_sura", end_sura)
+        set_slot(self, "number_of_suras", end_sura - start_sura + 1)
+        set_slot(self, "total_ayahs", total_ayahs)
+        set_slot(self, "start_page", start_page)
+        set_slot(self, "end_page", end_page)
+        set_slot(self, "total_pages", total_pages)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RangeResult is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("RangeResult is read-only")
+
+    def _build(self, key):
+        """Build one of the lazily materialized values"""
+        calculator, mushaf = self._calculator, self._mushaf
+
+        if key == "page_range":
+            return {
+                "start_page": self.start_page,
+                "end_page": self.end_page,
+                "total_pages": self.total_pages
+            }
+        if key == "direction_description":
+            order = "ترتيب أمامي" if self.is_forward else "ترتيب عكسي"
+            return f"من السورة {self.first_sura} إلى السورة {self.second_sura} ({order})"
+        if key == "original_order":
+            return {"first_sura": self.first_sura, "second_sura": self.second_sura}
+        if key == "calculation_order":
+            return {"start_sura": self.start_sura, "end_sura": self.end_sura}
+        if key == "start_sura":
+            return calculator._sura_reference(self.start_sura, mushaf)
+        if key == "end_sura":
+            return calculator._sura_reference(self.end_sura, mushaf)
+        if key == "first_selected_sura":
+            return calculator._sura_reference(self.first_sura, mushaf)
+        if key == "second_selected_sura":
+            return calculator._sura_reference(self.second_sura, mushaf)
+        if key == "included_suras":
+            # Shared per-sura summaries (already frozen)
+            return calculator._sura_summaries(mushaf)[self.start_sura:self.end_sura + 1]
+        if key == "page_info":
+            return {
+                "total_pages": self.total_pages,
+                "start_page": self.start_page,
+                "end_page": self.end_page,
+                "total_quran_pages": mushaf.page_count,
+                "calculation_method": "الصفحات الأولى للسور من المصحف القياسي"
+            }
+        raise KeyError(key)
+
+    def __getitem__(self, key):
+        if key in self.EAGER_KEYS:
+            return getattr(self, key)
+        built = self._built
+        if built is None:
+            # Concurrent first reads may each build the value; they are equal, so either may win
+            built = {}
+            object.__setattr__(self, "_built", built)
+        elif key in built:
+            return built[key]
+        value = built[key] = freeze(self._build(key))
+        return value
+
+    def __contains__(self, key):
+        # Checked against the key list so membership tests build nothing
+        return key in self.KEYS
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __repr__(self):
+        return (f"RangeResult({self.first_sura} -> {self.second_sura}, "
+                f"total_ayahs={self.total_ayahs}, total_pages={self.total_pages})")
+
+    def to_dict(self, fields=None):
+        """
+        Plain dict of the result, e.g. for JSON serialization
+
+        Args:
+            fields (iterable): Only include these keys (all keys when None);
+                "success" is always included
+
+        Returns:
+            dict: The requested fields in their standard order
+        """
+        if fields is None:
+            return {key: self[key] for key in self.KEYS}
+        fields = set(fields)
+        unknown = fields - set(self.KEYS)
+        if unknown:
+            raise KeyError(f"Unknown result fields: {', '.join(sorted(unknown))}")
+        fields.add("success")
+        return {key: self[key] for key in self.KEYS if key in fields}
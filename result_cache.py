@@ -0,0 +1,167 @@
+"""
+Result Cache Module
+Bounded, thread-safe LRU cache for calculator results
+
+Most traffic repeats a small set of queries, so results are kept in a
+size-bounded LRU keyed on the normalized query (sura numbers or global
+ayah indexes, in the order given, plus the layout name). Cached values are
+shared between callers, so they are frozen first: dicts become FrozenDict
+and lists become tuples.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+class FrozenDict(dict):
+    """Read-only dict; still a dict, so JSON serializers and dict checks accept it"""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Cached calculator results are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value):
+    """
+    Recursively make a result read-only
+
+    Args:
+        value: A result value (dicts, lists and scalars)
+
+    Returns:
+        The same data as FrozenDicts and tuples; frozen values are returned as is
+    """
+    value_type = type(value)
+    if value_type is FrozenDict:
+        return value
+    if value_type is dict:
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if value_type is list or value_type is tuple:
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class LRUCache:
+    """Size-bounded least-recently-used cache with optional TTL and hit/miss counters
+
+    All operations take a single lock for O(1) work and never await, so one
+    cache can be shared by threads and by asyncio handlers on the event loop.
+    Set enabled to False to bypass it (get always misses, put stores nothing).
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE, ttl=None):
+        """
+        Args:
+            maxsize (int): Maximum number of entries (0 disables storing)
+            ttl (float): Seconds an entry stays valid (None keeps entries until evicted)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries = OrderedDict()  # key -> (value, expires_at)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Return the cached value for key (marking it recently used), or default"""
+        if not self.enabled:
+            return default
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entries beyond maxsize
+
+        Returns:
+            The value, so results can be cached inline
+        """
+        if not self.enabled or self.maxsize <= 0:
+            return value
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def resize(self, maxsize):
+        """Change the size bound, evicting entries if it shrinks"""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, predicate):
+        """Drop the entries whose key satisfies predicate(key) (counters are kept)"""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self):
+        """Zero the hit, miss, eviction and expiration counters"""
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self):
+        """
+        Current counters
+
+        Returns:
+            dict: size, maxsize, ttl, enabled, hits, misses, evictions, expirations and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
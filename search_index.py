@@ -0,0 +1,201 @@
+"""
+Search Index Module
+Shared prefix/infix index behind autocomplete, sura search and the Tk filters
+
+Each value (e.g. a sura name) has one or more search keys, case-folded and
+with Arabic spelling variants folded (normalize_search_text) once at build
+time; each query is normalized once the same way. The index keeps two
+flattened tries in dicts:
+    prefixes    every prefix of every key -> ids of the values it starts
+    substrings  every substring of up to SUBSTRING_LENGTH characters -> ids
+so a prefix query, and an infix query of up to SUBSTRING_LENGTH characters,
+is one dict lookup. Longer infix queries verify the ids of their rarest
+indexed substring.
+
+Results are ranked the same way everywhere: values with a key starting with
+the query first, then values containing it, each group in value order
+(sura number for the sura index).
+
+IncrementalSearch adds narrowing for typing: when the new text extends the
+previous one, only the previous matches are checked again.
+"""
+
+from quran_data import SURAS, normalize_search_text
+from result_cache import LRUCache
+
+SUBSTRING_LENGTH = 3  # Longest substring with its own postings
+VALUE_INDEX_CACHE_SIZE = 16  # Indexes kept for lists of values other than the sura names
+
+
+class SearchIndex:
+    """Prefix and substring postings over a fixed list of values"""
+
+    def __init__(self, values, extra_keys=None):
+        """
+        Args:
+            values (list): Values returned by searches, e.g. sura names
+            extra_keys (list): Optional list of additional keys per value (e.g. Arabic names)
+        """
+        self.values = list(values)
+        self.keys = []  # value id -> tuple of normalized keys
+        for value_id, value in enumerate(self.values):
+            keys = [normalize_search_text(value)]
+            if extra_keys is not None:
+                keys.extend(normalize_search_text(key) for key in extra_keys[value_id])
+            self.keys.append(tuple(dict.fromkeys(keys)))
+
+        prefixes = {}
+        substrings = {}
+        for value_id, keys in enumerate(self.keys):
+            for key in keys:
+                for end in range(len(key) + 1):
+                    prefixes.setdefault(key[:end], set()).add(value_id)
+                for start in range(len(key)):
+                    for end in range(start + 1, min(start + SUBSTRING_LENGTH, len(key)) + 1):
+                        substrings.setdefault(key[start:end], set()).add(value_id)
+        if not self.values:
+            prefixes[""] = set()
+        self.prefixes = {prefix: tuple(sorted(ids)) for prefix, ids in prefixes.items()}
+        self.substrings = {part: tuple(sorted(ids)) for part, ids in substrings.items()}
+
+    def __len__(self):
+        return len(self.values)
+
+    def starts_with(self, value_id, query):
+        """True if any key of a value starts with the (normalized) query"""
+        return any(key.startswith(query) for key in self.keys[value_id])
+
+    def contains(self, value_id, query):
+        """True if any key of a value contains the (normalized) query"""
+        return any(query in key for key in self.keys[value_id])
+
+    def _containing(self, query):
+        """Ids of the values containing a normalized query, in value order"""
+        if len(query) <= SUBSTRING_LENGTH:
+            return self.substrings.get(query, ())
+        # Verify the postings of the query's rarest indexed substring
+        rarest = min(
+            (self.substrings.get(query[start:start + SUBSTRING_LENGTH], ())
+             for start in range(len(query) - SUBSTRING_LENGTH + 1)),
+            key=len
+        )
+        return tuple(value_id for value_id in rarest if self.contains(value_id, query))
+
+    def match_ids(self, query):
+        """
+        Ids of the matching values
+
+        Returns:
+            tuple: (prefix_ids, infix_ids) - values with a key starting with the
+                   query, and the other values containing it, each in value order
+        """
+        return self._match_normalized(normalize_search_text(query))
+
+    def _match_normalized(self, query):
+        prefix_ids = self.prefixes.get(query, ())
+        if not query:
+            return prefix_ids, ()
+        prefix_set = set(prefix_ids)
+        infix_ids = tuple(value_id for value_id in self._containing(query) if value_id not in prefix_set)
+        return prefix_ids, infix_ids
+
+    def search_ids(self, query, limit=None):
+        """Ranked ids of the matching values (prefix matches first)"""
+        prefix_ids, infix_ids = self.match_ids(query)
+        ranked = prefix_ids + infix_ids
+        return ranked if limit is None else ranked[:limit]
+
+    def search(self, query, limit=None):
+        """Ranked matching values (prefix matches first)"""
+        return [self.values[value_id] for value_id in self.search_ids(query, limit)]
+
+
+class IncrementalSearch:
+    """
+    Search state for one text field
+
+    Each update() that extends the previous text narrows the previous
+    matches instead of searching the whole index again.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.query = None
+        self.prefix_ids = ()
+        self.infix_ids = ()
+
+    def reset(self):
+        """Forget the previous text"""
+        self.query = None
+
+    def update(self, text, limit=None):
+        """
+        Matches for the current text of the field
+
+        Args:
+            text (str): Current text
+            limit (int): Maximum number of values (None for all)
+
+        Returns:
+            list: Ranked matching values
+        """
+        query = normalize_search_text(text)
+        if self.query and query.startswith(self.query):
+            # Prefix matches that no longer start with the query may still contain it
+            still_prefix, demoted = [], []
+            for value_id in self.prefix_ids:
+                if self.index.starts_with(value_id, query):
+                    still_prefix.append(value_id)
+                elif self.index.contains(value_id, query):
+                    demoted.append(value_id)
+            infix = [value_id for value_id in self.infix_ids if self.index.contains(value_id, query)]
+            self.prefix_ids = tuple(still_prefix)
+            self.infix_ids = tuple(sorted(infix + demoted)) if demoted else tuple(infix)
+        else:
+            self.prefix_ids, self.infix_ids = self.index._match_normalized(query)
+        self.query = query
+
+        ranked = self.prefix_ids + self.infix_ids
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [self.index.values[value_id] for value_id in ranked]
+
+
+_sura_index = None
+_value_indexes = LRUCache(VALUE_INDEX_CACHE_SIZE)  # values tuple -> SearchIndex
+
+
+def get_search_index(values=None):
+    """
+    Return a shared search index
+
+    Args:
+        values (list): Values to index; None (or the list of sura names) gives
+                       the sura index, keyed on English and Arabic names, whose
+                       value ids are sura numbers minus one
+
+    Returns:
+        SearchIndex: Shared per distinct list of values; the
+                     VALUE_INDEX_CACHE_SIZE most recently used are kept
+    """
+    global _sura_index
+    if _sura_index is None:
+        _sura_index = SearchIndex(
+            [sura["name"] for sura in SURAS.values()],
+            [[sura["arabic"]] for sura in SURAS.values()]
+        )
+    if values is None:
+        return _sura_index
+
+    values = tuple(values)
+    if values == tuple(_sura_index.values):
+        return _sura_index
+    index = _value_indexes.get(values)
+    if index is None:
+        index = _value_indexes.put(values, SearchIndex(values))
+    return index
+
+
+def search_sura_numbers(query, limit=None):
+    """Ranked numbers of the suras whose English or Arabic name matches a query"""
+    return [value_id + 1 for value_id in get_search_index().search_ids(query, limit)]
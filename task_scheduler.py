@@ -0,0 +1,129 @@
+"""
+Task Scheduler Module
+Debounced background work for the Tk desktop app
+
+Tk widgets may only be touched from the main thread, but filtering and
+calculating on it freezes the window while a fast typist is entering a name
+or a large range is being calculated. TaskScheduler moves that work to one
+background worker thread:
+
+    schedule()  called on the main thread; waits delay_ms (restarting the
+                wait on every call for the same key, so a burst of
+                keystrokes runs once) and then queues the work
+    worker      runs queued work in order, skipping work that has already
+                been superseded by a newer call for the same key
+    poll        an after() callback on the main thread that hands results
+                to their callbacks, dropping stale ones
+
+Each key (e.g. "sura1.filter" or "calculate") has a generation number that
+every schedule() and cancel() bumps; only a result whose generation is still
+current reaches its callback. The poll only runs while work is outstanding.
+
+The scheduler needs nothing from Tk except after() and after_cancel(), so any
+widget (or the root window) can drive it.
+"""
+
+import queue
+import threading
+
+DEFAULT_DELAY_MS = 150  # Pause in typing before filtering runs
+POLL_MS = 15  # How often finished work is checked for while any is outstanding
+
+
+class TaskScheduler:
+    """Coalescing, single-worker scheduler whose callbacks run on the Tk main thread"""
+
+    def __init__(self, widget, poll_ms=POLL_MS):
+        """
+        Args:
+            widget: Tk widget (or any object with after/after_cancel) owning the main loop
+            poll_ms (int): Interval for checking finished work
+        """
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self._generations = {}  # key -> generation of the latest schedule/cancel
+        self._timers = {}  # key -> after() id of a debounce wait
+        self._outstanding = 0  # Work queued or running whose result is not yet handled
+        self._poll_id = None
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._worker = None
+
+    def schedule(self, key, func, args=(), callback=None, error_callback=None, delay_ms=DEFAULT_DELAY_MS):
+        """
+        Run func(*args) on the worker thread after a quiet period
+
+        Calling again with the same key before the result is delivered
+        supersedes the earlier call: its wait is restarted or its result is
+        dropped.
+
+        Args:
+            key (str): Identifies the kind of work whose newer calls replace older ones
+            func (callable): Work to run off the main thread
+            args (tuple): Arguments for func
+            callback (callable): Called on the main thread with func's result
+            error_callback (callable): Called on the main thread with an exception raised by func
+            delay_ms (int): Debounce delay (0 queues the work right away)
+        """
+        generation = self._bump(key)
+        job = (key, generation, func, args, callback, error_callback)
+        if delay_ms > 0:
+            self._timers[key] = self.widget.after(delay_ms, lambda: self._submit(job))
+        else:
+            self._submit(job)
+
+    def cancel(self, key):
+        """Drop pending and running work for a key (its result will not be delivered)"""
+        self._bump(key)
+
+    def is_current(self, key, generation):
+        """True if no newer schedule()/cancel() has been made for a key"""
+        return self._generations.get(key) == generation
+
+    def _bump(self, key):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            self.widget.after_cancel(timer)
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        return generation
+
+    def _submit(self, job):
+        self._timers.pop(job[0], None)
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._work, name="ui-worker", daemon=True)
+            self._worker.start()
+        self._outstanding += 1
+        self._jobs.put(job)
+        if self._poll_id is None:
+            self._poll_id = self.widget.after(self.poll_ms, self._poll)
+
+    def _work(self):
+        """Worker thread: run jobs in order, skipping superseded ones"""
+        while True:
+            key, generation, func, args, callback, error_callback = self._jobs.get()
+            if not self.is_current(key, generation):
+                self._results.put(None)
+                continue
+            try:
+                outcome = (callback, func(*args))
+            except Exception as error:
+                outcome = (error_callback, error)
+            self._results.put((key, generation) + outcome)
+
+    def _poll(self):
+        """Main thread: deliver finished results that are still current"""
+        self._poll_id = None
+        while True:
+            try:
+                finished = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            if finished is None:
+                continue
+            key, generation, callback, value = finished
+            if callback is not None and self.is_current(key, generation):
+                callback(value)
+        if self._outstanding:
+            self._poll_id = self.widget.after(self.poll_ms, self._poll)
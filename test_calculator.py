@@ -5,7 +5,8 @@ Tests the core calculation functionality
 """
 
 from calculator import calculator
-from quran_data import SURAS, get_total_ayahs
+from quran_data import SURAS, get_sura_number_by_name, get_total_ayahs
+from quran_index import sura_table
 
 
 def test_basic_calculation():
@@ -88,6 +89,849 @@ def test_reverse_order():
     print()
 
 
+def test_prefix_sum_ranges():
+    """Test that prefix-sum range totals match a direct sum over every range"""
+    print("Testing: Prefix-sum totals for all sura pairs")
+    for start in range(1, 115):
+        expected = 0
+        for end in range(start, 115):
+            expected += SURAS[end]["ayahs"]
+            total_ayahs, _, number_of_suras = sura_table.range_totals(start, end)
+            assert total_ayahs == expected
+            assert number_of_suras == end - start + 1
+    print("✓ Prefix-sum totals match for all 6,555 ranges")
+    print()
+
+
+def test_name_aliases():
+    """Test that names resolve case-insensitively through numbers, Arabic and aliases"""
+    print("Testing: Sura name index and aliases")
+    for name in ["Ya-Sin", "ya-sin", "Yaseen", "Yasin", "Ya Sin", "36", "يس"]:
+        assert get_sura_number_by_name(name) == 36, name
+    assert get_sura_number_by_name("Al Baqara") == 2
+    assert get_sura_number_by_name("Baqarah") == 2
+    assert get_sura_number_by_name("Invalid-Sura") is None
+    
+    result = calculator.calculate_ayahs_between_suras("Al Baqara", "yaseen")
+    assert result["success"]
+    assert result["first_selected_sura"]["number"] == 2
+    assert result["second_selected_sura"]["number"] == 36
+    print("✓ Names, numbers, Arabic names and aliases resolve correctly")
+    print()
+
+
+def test_ayah_positions():
+    """Test ayah-level ranges between arbitrary positions"""
+    print("Testing: 2:142 to 3:92 (ayah positions)")
+    result = calculator.calculate_ayahs_between_positions("2:142", "3:92")
+    assert result["success"]
+    assert result["total_ayahs"] == (286 - 142 + 1) + 92
+    assert result["juz_range"] == {"start_juz": 2, "end_juz": 3}
+    assert result["page_range"]["start_page"] == 22
+    
+    reverse = calculator.calculate_ayahs_between_positions((3, 92), "Al-Baqarah:142")
+    assert reverse["total_ayahs"] == result["total_ayahs"]
+    assert reverse["direction"] == "reverse"
+    
+    full = calculator.calculate_ayahs_between_positions("1:1", "114:6")
+    assert full["total_ayahs"] == get_total_ayahs()
+    assert full["total_pages"] == 604
+    
+    assert not calculator.calculate_ayahs_between_positions("1:8", "2:1")["success"]
+    print(f"✓ Total ayahs: {result['total_ayahs']}")
+    print()
+
+
+def test_page_lookup():
+    """Test page to ayah reverse lookups"""
+    print("Testing: Page 22 and pages 582-604")
+    page = calculator.get_page_contents(22)
+    assert page["success"]
+    assert page["first_ayah"]["reference"] == "2:142"
+    
+    last_juz = calculator.get_suras_in_pages(604, 582)
+    assert last_juz["first_ayah"]["reference"] == "78:1"
+    assert last_juz["last_ayah"]["reference"] == "114:6"
+    assert last_juz["number_of_suras"] == 37
+    
+    assert not calculator.get_page_contents(605)["success"]
+    print(f"✓ Page 22 starts at {page['first_ayah']['reference']}")
+    print()
+
+
+def test_divisions():
+    """Test juz, hizb and quarter navigation"""
+    print("Testing: Juz 30 and quarter boundaries")
+    juz_30 = calculator.calculate_ayahs_between_divisions(30, 30)
+    expected = calculator.calculate_ayahs_between_suras("An-Naba", "An-Nas")
+    assert juz_30["total_ayahs"] == expected["total_ayahs"]
+    assert juz_30["number_of_suras"] == 37
+    
+    whole = calculator.calculate_ayahs_between_divisions(240, 1, unit="quarter")
+    assert whole["total_ayahs"] == get_total_ayahs()
+    assert whole["direction"] == "reverse"
+    
+    assert calculator.find_division("2:142")["number"] == 2
+    assert calculator.find_division("2:141", unit="hizb")["number"] == 2
+    assert calculator.next_division_boundary("18:74")["start_position"]["reference"] == "18:75"
+    assert not calculator.next_division_boundary("114:6")["success"]
+    assert not calculator.calculate_ayahs_between_divisions(1, 31)["success"]
+    print(f"✓ Juz 30 has {juz_30['total_ayahs']} ayahs")
+    print()
+
+
+def test_mapped_layout():
+    """Test calculations against a layout loaded from a data file"""
+    import os
+    import tempfile
+    from mushaf_layouts import get_layout, register_layout, unload_layout, write_layout_file
+    
+    print("Testing: Memory-mapped layout file")
+    # A synthetic 610-page layout: the standard pages shifted by six
+    pages = [page + 6 for page in get_layout().page_of]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "shifted.qlay")
+        write_layout_file(path, pages, 610)
+        register_layout("shifted", path)
+        
+        result = calculator.calculate_ayahs_between_suras("Al-Mulk", "An-Nas", layout="shifted")
+        standard = calculator.calculate_ayahs_between_suras("Al-Mulk", "An-Nas")
+        assert result["total_ayahs"] == standard["total_ayahs"]
+        assert result["page_range"]["start_page"] == 568
+        assert result["page_info"]["total_quran_pages"] == 610
+        assert calculator.get_page_contents(610, layout="shifted")["last_ayah"]["reference"] == "114:6"
+        
+        # Re-registering a name or unloading it drops results derived from the old file
+        moved = os.path.join(temp_dir, "moved.qlay")
+        write_layout_file(moved, [page + 20 for page in get_layout().page_of], 624)
+        register_layout("shifted", moved)
+        result = calculator.calculate_ayahs_between_suras("Al-Mulk", "An-Nas", layout="shifted")
+        assert result["page_range"]["start_page"] == 582
+        assert result["included_suras"][0]["page_start"] == 582
+        unload_layout("shifted")
+        result = calculator.calculate_ayahs_between_suras("Al-Mulk", "An-Nas", layout="shifted")
+        assert result["page_range"]["end_page"] == 624
+        unload_layout("shifted")
+        
+    assert not calculator.calculate_ayahs_between_suras("Al-Mulk", "An-Nas", layout="missing")["success"]
+    assert not calculator.calculate_page_range_between_suras(67, 114, layout="missing")["success"]
+    print("✓ Layout file results match the standard layout")
+    print()
+
+
+def test_snapshot():
+    """Test that the binary snapshot is current and matches freshly built tables"""
+    from quran_data import build_name_index
+    from quran_index import QuranTables, build_tables
+    from quran_snapshot import build_snapshot, load_snapshot
+    
+    print("Testing: Precompiled snapshot")
+    snapshot = load_snapshot()
+    assert snapshot is not None, "quran_snapshot.bin is missing or stale; run python quran_snapshot.py"
+    assert snapshot == build_snapshot()
+    assert snapshot["name_index"] == build_name_index()
+    
+    loaded = QuranTables.from_snapshot(snapshot["tables"])
+    built = build_tables()
+    assert loaded.ayah_index.page_of == built.ayah_index.page_of
+    assert loaded.sura_table.ayah_prefix == built.sura_table.ayah_prefix
+    assert loaded.division_index.starts == built.division_index.starts
+    print("✓ Snapshot matches the source data")
+    print()
+
+
+def test_lazy_result():
+    """Test the lazy range result and field projection"""
+    import json
+    
+    print("Testing: Lazy range result and field projection")
+    result = calculator.calculate_ayahs_between_suras("Al-Baqarah", "Al-Fatiha")
+    assert result["total_ayahs"] == 293
+    assert "included_suras" in result
+    assert result._built is None  # Nothing descriptive built yet
+    
+    assert result["start_sura"]["number"] == 1
+    assert result.get("page_info")["total_quran_pages"] == 604
+    assert [sura["number"] for sura in result["included_suras"]] == [1, 2]
+    assert list(result) == list(result.to_dict())
+    json.dumps(result.to_dict())
+    
+    projected = calculator.calculate_ayahs_between_suras("Al-Baqarah", "Al-Fatiha", fields="total_ayahs,direction")
+    assert projected == {"success": True, "total_ayahs": 293, "direction": "reverse"}
+    assert not calculator.calculate_ayahs_between_suras("Al-Baqarah", "Al-Fatiha", fields=["nope"])["success"]
+    print("✓ Lazy result matches the full result")
+    print()
+
+
+def test_calculate_many():
+    """Test the batch API against single calculations, with and without NumPy"""
+    import batch
+    
+    print("Testing: Batch calculation")
+    starts = ["Al-Fatiha", "An-Nas", "Invalid-Sura", 36, "Al-Mulk"]
+    ends = ["An-Nas", "Al-Fatiha", "Al-Baqarah", "Ya-Sin", 78]
+    numpy_module = batch.np
+    try:
+        for np_module in {numpy_module, None}:
+            batch.np = np_module
+            result = calculator.calculate_many(starts, ends)
+            assert list(result["valid"]) == [True, True, False, True, True]
+            for i, (start, end) in enumerate(zip(starts, ends)):
+                if not result["valid"][i]:
+                    assert result["total_ayahs"][i] == 0
+                    continue
+                single = calculator.calculate_ayahs_between_suras(start, end)
+                assert result["total_ayahs"][i] == single["total_ayahs"]
+                assert result["total_pages"][i] == single["total_pages"]
+                assert result["number_of_suras"][i] == single["number_of_suras"]
+                assert bool(result["is_forward"][i]) == single["is_forward"]
+            
+            unhashable = calculator.calculate_many([["Al-Fatiha"], {"sura": 1}, 1.5, "Al-Fatiha"], [1, 2, 3, 114])
+            assert list(unhashable["valid"]) == [False, False, False, True]
+            
+            positions = calculator.calculate_many(["2:142", (3, 92), "1:8"], ["3:92", "2:142", "2:1"], unit="ayah")
+            assert list(positions["valid"]) == [True, True, False]
+            assert list(positions["total_ayahs"][:2]) == [237, 237]
+    finally:
+        batch.np = numpy_module
+    print("✓ Batch results match single calculations")
+    print()
+
+
+def test_pair_matrix():
+    """Test the precomputed all-pairs matrix and its on-disk cache"""
+    import json
+    import os
+    import tempfile
+    from mushaf_layouts import get_layout
+    from pair_matrix import PairMatrix
+    
+    print("Testing: All-pairs sura matrix")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "pairs.bin")
+        built = PairMatrix.load_or_build(get_layout(), path)
+        loaded = PairMatrix.load(path)
+        assert loaded is not None
+        assert loaded.total_ayahs == built.total_ayahs
+        assert loaded.end_pages == built.end_pages
+        
+    for first, second in [(1, 114), (114, 1), (36, 36), (2, 67)]:
+        expected = calculator.calculate_ayahs_between_suras(first, second)
+        total_ayahs, start_page, end_page, total_pages, number_of_suras = loaded.lookup(first, second)
+        assert total_ayahs == expected["total_ayahs"]
+        assert total_pages == expected["total_pages"]
+        assert number_of_suras == expected["number_of_suras"]
+        payload = json.loads(calculator.get_pair_payload(first, second))
+        assert payload == json.loads(json.dumps(expected.to_dict()))
+    print("✓ Matrix lookups match direct calculations")
+    print()
+
+
+def test_batch_cli():
+    """Test the streaming batch CLI readers and the ordered worker pool"""
+    import io
+    from batch_cli import calculate_queries, read_csv_queries, read_jsonl_queries, write_jsonl
+    
+    print("Testing: Streaming batch CLI")
+    csv_input = io.StringIO("start,end\nAl-Fatiha,An-Nas\n36,36\nInvalid,1\n,\nYa-Sin\n")
+    queries = list(read_csv_queries(csv_input))
+    assert queries == [("Al-Fatiha", "An-Nas"), ("36", "36"), ("Invalid", "1"), ("Ya-Sin", None)]
+    assert list(read_csv_queries(io.StringIO("\n,\nfrom,to\n1,2\n"))) == [("1", "2")]
+    
+    records = list(calculate_queries(iter(queries)))
+    assert records[0]["total_ayahs"] == calculator.calculate_ayahs_between_suras(1, 114)["total_ayahs"]
+    assert records[1]["number_of_suras"] == 1
+    assert records[2]["success"] is False
+    assert records[3]["success"] is False and records[3]["start"] == "Ya-Sin"
+    print("✓ CSV queries streamed to results")
+    
+    jsonl_input = io.StringIO('{"start": "2:1", "end": "2:286"}\n["1:1", "1:7"]\nnot json\n')
+    records = list(calculate_queries(read_jsonl_queries(jsonl_input), unit="ayah"))
+    assert [r["total_ayahs"] for r in records] == [286, 7, 0]
+    output = io.StringIO()
+    write_jsonl(records, output)
+    assert len(output.getvalue().splitlines()) == 3
+    print("✓ JSONL ayah queries streamed to results")
+    
+    queries = [(str(a), str(b)) for a in range(1, 115, 7) for b in range(114, 0, -9)]
+    serial = list(calculate_queries(iter(queries)))
+    pooled = list(calculate_queries(iter(queries), workers=2, chunk_size=16))
+    assert pooled == serial
+    print("✓ Worker pool preserves output order")
+    
+    consumed = []
+    
+    def counted_queries():
+        for number in range(1, 10001):
+            consumed.append(number)
+            yield "1", str(number % 114 + 1)
+    
+    records = calculate_queries(counted_queries(), workers=2, chunk_size=10)
+    assert next(records)["success"]
+    assert len(consumed) <= (2 * 2 + 1) * 10
+    records.close()
+    print("✓ Worker pool reads the input lazily")
+    print()
+
+
+def test_json_api():
+    """Test the JSON API endpoints"""
+    try:
+        from fastapi.testclient import TestClient
+    except ImportError:
+        print("Skipping: JSON API (fastapi not installed)")
+        print()
+        return
+    from api import create_api_app
+    from range_result import RangeResult
+    
+    print("Testing: JSON API")
+    client = TestClient(create_api_app())
+    
+    response = client.get("/api/range", params={"first": "Al-Fatiha", "second": "An-Nas"})
+    assert response.status_code == 200
+    assert response.json()["total_ayahs"] == 6236
+    response = client.get("/api/range", params={"first": "Ya-Sin", "second": "Al-Mulk", "fields": "total_ayahs"})
+    assert response.json() == {"success": True, "total_ayahs": 1566}
+    fast = client.get("/api/range", params={"first": "Ya-Sin", "second": "Al-Mulk"}).json()
+    slow = client.get("/api/range", params={"first": "Ya-Sin", "second": "Al-Mulk",
+                                            "fields": ",".join(RangeResult.KEYS)}).json()
+    assert list(fast) == list(slow) and fast == slow
+    assert client.get("/api/range", params={"first": "Invalid", "second": "1"}).status_code == 400
+    assert client.get("/api/range", params={"first": "1"}).status_code == 422
+    print("✓ Sura range endpoint works")
+    
+    assert client.get("/api/ayah-range", params={"start": "2:1", "end": "2:286"}).json()["total_ayahs"] == 286
+    assert client.get("/api/pages", params={"start": 1}).json()["last_ayah"]["ayah"] == 7
+    assert client.get("/api/pages", params={"start": 0}).status_code == 422
+    assert client.get("/api/sura/36").json()["name"] == "Ya-Sin"
+    assert client.get("/api/sura/Nothing").status_code == 404
+    results = client.get("/api/search", params={"q": "al", "limit": 3}).json()["results"]
+    assert len(results) == 3
+    print("✓ Ayah range, page, sura info and search endpoints work")
+    print()
+
+
+def test_result_cache():
+    """Test the LRU result cache and immutability of cached results"""
+    import time
+    from calculator import QuranCalculator
+    from result_cache import LRUCache
+    
+    print("Testing: LRU result cache")
+    cached_calculator = QuranCalculator(cache_size=2)
+    first = cached_calculator.calculate_ayahs_between_suras("Al-Fatiha", "Al-Baqarah")
+    assert cached_calculator.calculate_ayahs_between_suras("1", "2") is first
+    cached_calculator.calculate_ayahs_between_divisions(30, 30)
+    cached_calculator.calculate_ayahs_between_positions("2:1", "2:5")
+    stats = cached_calculator.cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (1, 3, 1, 2)
+    assert cached_calculator.calculate_ayahs_between_suras(2, 1) is not first  # Direction is part of the key
+    print("✓ Hits, misses and evictions are counted")
+    
+    for result in (first, cached_calculator.calculate_ayahs_between_divisions(1, 2)):
+        for mutate in (lambda: result.__setitem__("total_ayahs", 0),
+                       lambda: result["page_range"].update(start_page=0),
+                       lambda: result["included_suras"][0].pop("name")):
+            try:
+                mutate()
+                assert False, "cached result was mutated"
+            except (TypeError, AttributeError):
+                pass
+    try:
+        first.total_ayahs = 0
+        assert False, "RangeResult attribute was reassigned"
+    except AttributeError:
+        pass
+    print("✓ Cached results are read-only")
+    
+    cached_calculator.cache.enabled = False
+    assert cached_calculator.calculate_ayahs_between_suras(1, 2) is not first
+    cache = LRUCache(maxsize=4, ttl=0.01)
+    cache.put("key", 1)
+    time.sleep(0.02)
+    assert cache.get("key") is None and cache.expirations == 1
+    print("✓ Bypass switch and TTL expiry work")
+    print()
+
+
+def test_fragment_cache():
+    """Test the rendered HTML fragment cache of the NiceGUI app"""
+    try:
+        import main_nicegui
+    except ImportError:
+        print("Skipping: Fragment cache (nicegui not installed)")
+        print()
+        return
+    
+    print("Testing: Rendered fragment cache")
+    main_nicegui.fragment_cache.clear()
+    main_nicegui.warm_fragment_cache([(1, 2)])
+    assert len(main_nicegui.fragment_cache) == 1
+    
+    result = calculator.calculate_ayahs_between_suras("Al-Fatiha", "Al-Baqarah")
+    hits = main_nicegui.fragment_cache.hits
+    summary_html, sura_rows = main_nicegui.get_result_fragments(result, (1, 2))
+    assert main_nicegui.fragment_cache.hits == hits + 1
+    assert (summary_html, sura_rows) == main_nicegui.render_result_fragments(result)
+    assert "إجمالي الآيات: 293" in summary_html
+    assert [row["number"] for row in sura_rows] == [1, 2]
+    assert set(sura_rows[0]) == {column["field"] for column in main_nicegui.SURA_TABLE_COLUMNS}
+    print("✓ Pre-warmed fragments are reused")
+    
+    # Calculations from the page are keyed on their own sura numbers
+    from types import SimpleNamespace
+    page = main_nicegui.QuranCalculatorNiceGUI.__new__(main_nicegui.QuranCalculatorNiceGUI)
+    shown = []
+    page.display_result = lambda result, cache_key=None: shown.append(
+        main_nicegui.get_result_fragments(result, cache_key))
+    for first, second in [(1, 2), (36, 67), (1, 2)]:
+        page.sura1_select = SimpleNamespace(value=main_nicegui.SURA_OPTIONS[first - 1])
+        page.sura2_select = SimpleNamespace(value=main_nicegui.SURA_OPTIONS[second - 1])
+        page.calculate_ayahs()
+    assert [len(rows) for _, rows in shown] == [2, 32, 2]
+    assert "إجمالي الآيات: 293" in shown[0][0] and shown[0] == shown[2] != shown[1]
+    assert len(main_nicegui.fragment_cache) == 2
+    print("✓ Different ranges from the page get their own fragments")
+    print()
+
+
+def test_shared_page_state():
+    """Test the sura options shared by all NiceGUI client pages"""
+    try:
+        import main_nicegui
+    except ImportError:
+        print("Skipping: Shared page state (nicegui not installed)")
+        print()
+        return
+    
+    print("Testing: Shared sura options")
+    assert len(main_nicegui.SURA_OPTIONS) == 114
+    assert main_nicegui.SURA_OPTIONS[0] == f"1. {SURAS[1]['arabic']}"
+    assert main_nicegui.OPTION_SURA_NAMES[main_nicegui.SURA_OPTIONS[35]] == "Ya-Sin"
+    assert main_nicegui.prepare_sura_options() == (main_nicegui.SURA_OPTIONS, main_nicegui.OPTION_SURA_NAMES)
+    print("✓ Options and option names are built once at import")
+    print()
+
+
+def test_load_harness():
+    """Test the load harness against a stub HTTP server"""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    import json
+    import os
+    import random
+    from load_harness import calculation_events, find_page_elements, make_request, parse_mix, percentile, run_load
+    
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def do_GET(self):
+            status = 500 if self.path.startswith("/api/search") else 200
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+        
+        def log_message(self, *args):
+            pass
+    
+    print("Testing: Load harness")
+    assert percentile([1, 2, 3, 4], 0.5) == 2 and percentile([1, 2, 3, 4], 0.99) == 4
+    assert parse_mix("range=2,search") == {"range": 2.0, "search": 1.0}
+    assert make_request("page", random.Random(1)).startswith("/api/pages?start=")
+    
+    # Calculator page as served by the pinned NiceGUI (2.20.0)
+    page = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "nicegui_2.20_page.html")
+    with open(page, encoding="utf-8") as f:
+        html = f.read()
+    elements = find_page_elements(html)
+    assert elements is not None and all(element_id.isdigit() for element_id in elements)
+    options = elements["11"]["props"]["options"]
+    assert len(options) == 114 and options == elements["14"]["props"]["options"]
+    packets = calculation_events(elements, "client-1", random.Random(3))
+    messages = [json.loads(packet[2:]) for packet in packets]
+    assert [packet[:2] for packet in packets] == ["42", "42", "42"]
+    assert all(name == "event" for name, _ in messages)
+    messages = [message for _, message in messages]
+    assert [m["id"] for m in messages] == [11, 14, 16]
+    for message in messages[:2]:
+        listener = next(listener for listener in elements[str(message["id"])]["events"]
+                        if listener["listener_id"] == message["listener_id"])
+        assert listener["type"] == "update:modelValue"
+    assert messages[2]["args"] == []
+    first, second = (json.loads(m["args"][0]) for m in messages[:2])
+    assert first in options and second in options and first != second
+    print("✓ UI sessions select two suras and click calculate over the socket")
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        report = run_load(f"http://127.0.0.1:{server.server_address[1]}",
+                          {"range": 1, "search": 1}, clients=2, duration=0.3)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert report["operations"]["range"]["requests"] > 0
+    assert report["operations"]["range"]["errors"] == 0
+    assert report["operations"]["search"]["error_rate"] == 1.0
+    assert report["total"]["latency_ms"]["p99"] is not None
+    print(f"✓ {report['total']['requests']} stub requests measured")
+    print()
+
+
+def test_benchmark_suite():
+    """Test the microbenchmark runner and regression check"""
+    from benchmark import compare_results, run_suite, summarize_samples
+    
+    print("Testing: Benchmark suite")
+    results = run_suite(["sura_info", "validate.valid"], repeats=3, min_time=0.001,
+                        import_runs=0, report=lambda line: None)
+    assert list(results["benchmarks"]) == ["sura_info", "validate.valid"]
+    assert len(results["benchmarks"]["sura_info"]["samples"]) == 3
+    assert results["benchmarks"]["sura_info"]["median"] > 0
+    
+    def case(*samples):
+        return {"samples": list(samples), **summarize_samples(list(samples))}
+    
+    baseline = {"benchmarks": {"a": case(1.0, 1.0, 1.1), "b": case(1.0, 1.2, 1.4), "c": case(1.0, 1.0, 1.0)}}
+    current = {"benchmarks": {"a": case(1.5, 1.6, 1.6), "b": case(1.1, 1.3, 1.5), "d": case(1.0)}}
+    statuses = {row[0]: row[4] for row in compare_results(baseline, current, threshold=0.1)}
+    assert statuses == {"a": "regression", "b": "unchanged", "c": "missing", "d": "new"}
+    print("✓ Regressions beyond the threshold and the noise are flagged")
+    print()
+
+
+def test_metrics():
+    """Test operation timing and the Prometheus export"""
+    import threading
+    from metrics import ENABLED, MetricsRegistry, registry
+    from result_cache import LRUCache
+    
+    print("Testing: Metrics")
+    if ENABLED:
+        calls = registry.count("calculator.calculate_ayahs_between_suras")
+        calculator.calculate_ayahs_between_suras("Al-Mulk", "An-Nas")
+        assert registry.count("calculator.calculate_ayahs_between_suras") == calls + 1
+    
+    local = MetricsRegistry(buckets=(0.001, 0.01))
+    local.observe("op", 0.001)
+    # Other threads record into their own histograms, merged on render
+    worker = threading.Thread(target=local.observe, args=("op", 0.5), kwargs={"error": True})
+    worker.start()
+    worker.join()
+    assert local.count("op") == 2
+    local.observe_http("GET", "/api/sura/{name}", 200, 0.002)
+    local.register_cache("results", LRUCache(4))
+    text = local.render()
+    assert 'quran_operation_duration_seconds_bucket{operation="op",le="0.001"} 1' in text
+    assert 'quran_operation_duration_seconds_bucket{operation="op",le="+Inf"} 2' in text
+    assert 'quran_operation_duration_seconds_count{operation="op"} 2' in text
+    assert 'quran_operation_errors_total{operation="op"} 1' in text
+    assert 'quran_http_requests_total{method="GET",route="/api/sura/{name}",status="200"} 1' in text
+    assert 'quran_cache_hits_total{cache="results"} 0' in text
+    print("✓ Calls are timed and exported in the Prometheus text format")
+    
+    try:
+        from fastapi.testclient import TestClient
+    except ImportError:
+        print()
+        return
+    if not ENABLED:
+        print()
+        return
+    from api import create_api_app
+    client = TestClient(create_api_app())
+    client.get("/api/sura/36")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert 'route="/api/sura/{name}"' in response.text
+    print("✓ /metrics endpoint works")
+    print()
+
+
+def test_fuzzy_suggestions():
+    """Test the trigram suggestion index behind validate_sura_name"""
+    import random
+    from fuzzy_index import MAX_INPUT_LENGTH, edit_distance, get_fuzzy_index, pattern_masks
+    from validation import validator
+    
+    print("Testing: Fuzzy suggestions")
+    
+    def reference_distance(first, second):
+        previous = list(range(len(second) + 1))
+        for i, first_char in enumerate(first, 1):
+            current = [i]
+            for j, second_char in enumerate(second, 1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1,
+                                   previous[j - 1] + (first_char != second_char)))
+            previous = current
+        return previous[-1]
+    
+    rng = random.Random(7)
+    for _ in range(500):
+        first = "".join(rng.choice("abq") for _ in range(rng.randint(1, 12)))
+        second = "".join(rng.choice("abq") for _ in range(rng.randint(0, 12)))
+        assert edit_distance(pattern_masks(first), len(first), second) == reference_distance(first, second)
+    print("✓ Bit-vector edit distance matches the reference")
+    
+    assert validator.validate_sura_name("Al-Bakarah")["suggestions"][0] == "Al-Baqarah"
+    assert validator.validate_sura_name("Maryum")["suggestions"] == ["Maryam", "Ar-Rum"]
+    assert validator.validate_sura_name("البقرت")["suggestions"] == ["Al-Baqarah"]
+    assert validator.validate_sura_name("xq7" * 40)["suggestions"] == []
+    assert get_fuzzy_index().search("a" * (MAX_INPUT_LENGTH + 1)) == []
+    print("✓ Typos, Arabic input and junk get ranked or no suggestions")
+    print()
+
+
+def test_search_index():
+    """Test the shared prefix/infix search index"""
+    from search_index import VALUE_INDEX_CACHE_SIZE, IncrementalSearch, SearchIndex, _value_indexes, get_search_index
+    from validation import validator
+    
+    print("Testing: Search index")
+    index = SearchIndex(["Al-Baqarah", "Saba", "Al-Anbiya", "Abasa"], [["b1"], [], [], []])
+    assert index.search("ab") == ["Abasa", "Saba"]
+    assert index.search("a", limit=2) == ["Al-Baqarah", "Al-Anbiya"]
+    assert index.search("baqa") == ["Al-Baqarah"]
+    assert index.search("B1") == ["Al-Baqarah"]
+    assert index.search("") == ["Al-Baqarah", "Saba", "Al-Anbiya", "Abasa"]
+    assert index.search("xyz") == []
+    print("✓ Prefix matches rank before infix matches, in value order")
+    
+    sura_index = get_search_index()
+    for word in ("al-baqarah", "an-nas", "yusuf", "abasa"):
+        search = IncrementalSearch(sura_index)
+        for end in range(len(word) + 1):
+            assert search.update(word[:end]) == sura_index.search(word[:end])
+    assert get_search_index(validator.sura_names) is sura_index
+    assert get_search_index(["alpha", "beta"]) is get_search_index(("alpha", "beta"))
+    for count in range(VALUE_INDEX_CACHE_SIZE + 5):
+        get_search_index([f"value {count}"])
+    assert len(_value_indexes) == VALUE_INDEX_CACHE_SIZE
+    print("✓ Incremental narrowing matches a full search")
+    
+    assert [m["number"] for m in calculator.search_suras("an", limit=3)] == [4, 16, 24]
+    assert calculator.search_suras("البقرة")[0]["name"] == "Al-Baqarah"
+    assert validator.get_autocomplete_suggestions("rah") == ["Al-Baqarah", "Ibrahim", "Ar-Rahman"]
+    print("✓ search_suras and autocomplete share the index")
+    print()
+
+
+def test_arabic_normalization():
+    """Test Arabic spelling variants in lookups and search"""
+    from quran_data import normalize_arabic, normalize_sura_name
+    
+    print("Testing: Arabic normalization")
+    assert normalize_arabic("الإِسْرَاء") == normalize_arabic("الاسراء") == "الاسراء"
+    assert normalize_arabic("إبراهيـــم") == "ابراهيم"
+    assert normalize_arabic("الضحى") == "الضحي"
+    assert normalize_arabic("البقرة") == "البقره"
+    assert normalize_sura_name("آل عمران") == "العمران"
+    
+    for name, number in [("الاسراء", 17), ("الإسراء", 17), ("ابراهيم", 14), ("إبراهيم", 14),
+                         ("البقره", 2), ("الْبَقَرَةُ", 2), ("بقرة", 2), ("المومنون", 23), ("سبا", 34)]:
+        assert get_sura_number_by_name(name) == number, name
+    print("✓ Diacritics, tatweel and alef/yaa/taa marbuta variants resolve")
+    
+    assert [m["number"] for m in calculator.search_suras("الاسر")] == [17]
+    assert [m["number"] for m in calculator.search_suras("ابراهيم")] == [14]
+    result = calculator.calculate_ayahs_between_suras("ابراهيم", "الاسراء")
+    assert result["success"] and result["number_of_suras"] == 4
+    print("✓ Search and calculations accept unnormalized Arabic input")
+    print()
+
+
+def test_task_scheduler():
+    """Test debounced background work for the desktop app"""
+    import threading
+    import time
+    from task_scheduler import TaskScheduler
+    
+    class ManualLoop:
+        """Stands in for the Tk main loop: after() callbacks run when drained"""
+        def __init__(self):
+            self.pending = {}
+            self.next_id = 0
+        
+        def after(self, delay_ms, func):
+            self.next_id += 1
+            self.pending[self.next_id] = func
+            return self.next_id
+        
+        def after_cancel(self, timer):
+            self.pending.pop(timer, None)
+        
+        def drain(self, timeout=5):
+            deadline = time.time() + timeout
+            while self.pending and time.time() < deadline:
+                timer = min(self.pending)
+                self.pending.pop(timer)()
+                time.sleep(0.001)
+    
+    print("Testing: Task scheduler")
+    loop = ManualLoop()
+    scheduler = TaskScheduler(loop)
+    calls, delivered = [], []
+    
+    def work(text):
+        calls.append(text)
+        return text.upper()
+    
+    for text in ("b", "ba", "baq"):
+        scheduler.schedule("filter", work, (text,), callback=delivered.append)
+    loop.drain()
+    assert calls == ["baq"] and delivered == ["BAQ"]
+    print("✓ A burst of keystrokes runs the work once")
+    
+    release = threading.Event()
+    delivered.clear()
+    scheduler.schedule("calculate", lambda: release.wait(5) and "old", callback=delivered.append, delay_ms=0)
+    scheduler.schedule("calculate", lambda: "new", callback=delivered.append, delay_ms=0)
+    release.set()
+    loop.drain()
+    assert delivered == ["new"]
+    
+    scheduler.schedule("calculate", lambda: "cancelled", callback=delivered.append, delay_ms=0)
+    scheduler.cancel("calculate")
+    loop.drain()
+    assert delivered == ["new"] and not loop.pending
+    print("✓ Superseded and cancelled results are dropped")
+    
+    errors = []
+    scheduler.schedule("calculate", lambda: 1 / 0, callback=delivered.append,
+                       error_callback=errors.append, delay_ms=0)
+    loop.drain()
+    assert isinstance(errors[0], ZeroDivisionError) and delivered == ["new"]
+    print("✓ Exceptions reach the error callback on the main loop")
+    print()
+
+
+def test_virtual_list():
+    """Test the desktop app's pooled list and searchable combobox dropdown"""
+    import sys
+    import types
+    
+    class FakeWidget:
+        """Stands in for every customtkinter widget: records options, grid state and text"""
+        def __init__(self, master=None, **options):
+            self.master = master
+            self.options = options
+            self.configured = []
+            self.visible = False
+            self.text = ""
+            self.view = None
+        
+        def configure(self, **options):
+            self.configured.append(options)
+            self.options.update(options)
+        
+        def grid(self, **options):
+            self.visible = True
+        
+        def grid_remove(self):
+            self.visible = False
+        
+        def set(self, first, last):
+            self.view = (first, last)
+        
+        def insert(self, index, text):
+            self.text = text
+        
+        def delete(self, first, last=None):
+            self.text = ""
+        
+        def get(self):
+            return self.text
+        
+        def grid_columnconfigure(self, *args, **kwargs):
+            pass
+        
+        def bind(self, *args, **kwargs):
+            pass
+    
+    # Import ui_components against the fake toolkit, so no display is needed
+    fake_ctk = types.ModuleType("customtkinter")
+    fake_ctk.__getattr__ = lambda name: FakeWidget
+    saved = {name: sys.modules.pop(name, None) for name in ("customtkinter", "ui_components")}
+    sys.modules["customtkinter"] = fake_ctk
+    try:
+        from ui_components import SearchableComboBox, VirtualList
+    finally:
+        for name, module in saved.items():
+            sys.modules.pop(name, None)
+            if module is not None:
+                sys.modules[name] = module
+    
+    print("Testing: Virtual list")
+    formatted = []
+    
+    def format_item(item):
+        formatted.append(item)
+        return f"item {item}"
+    
+    rows = []
+    
+    def create_row(parent, row):
+        rows.append(FakeWidget(parent))
+        return rows[-1]
+    
+    virtual_list = VirtualList(None, rows=4, create_row=create_row, format_item=format_item)
+    items = list(range(10))
+    virtual_list.set_items(items)
+    assert len(rows) == len(virtual_list.row_widgets) == 4
+    assert [row.options["text"] for row in rows] == ["item 0", "item 1", "item 2", "item 3"]
+    assert sorted(formatted) == [0, 1, 2, 3] and virtual_list.scrollbar.view == (0.0, 0.4)
+    
+    # Only rows whose text changed are reconfigured
+    for row in rows:
+        row.configured.clear()
+    virtual_list.set_items([0, 1, 7, 3, 4])
+    assert [len(row.configured) for row in rows] == [0, 0, 1, 0]
+    virtual_list.set_items(items)
+    
+    # first_row is clamped to the items
+    virtual_list.scroll_to(100)
+    assert virtual_list.first_row == 6 and rows[3].options["text"] == "item 9"
+    virtual_list.scroll_to(-5)
+    assert virtual_list.first_row == 0
+    
+    # Scrollbar commands arrive as strings from Tk
+    virtual_list.on_scroll("moveto", "0.5")
+    assert virtual_list.first_row == 5
+    virtual_list.on_scroll("scroll", "1", "units")
+    assert virtual_list.first_row == 6
+    virtual_list.on_scroll("scroll", "-1", "pages")
+    assert virtual_list.first_row == 2
+    virtual_list.on_scroll("scroll", "2", "pages")
+    assert virtual_list.first_row == 6 and virtual_list.item_at(3) == 9
+    print("✓ Scrolling rebinds a fixed pool of rows")
+    
+    # Fewer items than rows: the rest of the pool is hidden
+    virtual_list.set_items(["a", "b"])
+    assert virtual_list.first_row == 0 and virtual_list.item_at(1) == "b"
+    assert virtual_list.item_at(2) is None and virtual_list.item_at(3) is None
+    assert [row.visible for row in rows] == [True, True, False, False]
+    assert len(rows) == 4 and not virtual_list.scrollbar.visible
+    
+    values = [f"{number}. {SURAS[number]['name']}" for number in range(1, 115)]
+    combo = SearchableComboBox(None, values=values)
+    combo.build_dropdown()
+    buttons = combo.dropdown_frame.row_widgets
+    assert len(buttons) == SearchableComboBox.DROPDOWN_ROWS
+    combo.filtered_values = values[10:20]
+    combo.update_dropdown()
+    combo.dropdown_frame.on_scroll("scroll", "1", "units")
+    buttons[2].options["command"]()
+    assert combo.get() == values[13] and combo.selected_value == values[13]
+    combo.filtered_values = values[:1]
+    combo.update_dropdown()
+    buttons[5].options["command"]()
+    assert combo.get() == values[13]
+    print("✓ Dropdown rows select the value they show")
+    print()
+
+
 def main():
     """Run all tests"""
     print("🧪 Testing Quran Calculator Core Functions")
@@ -98,6 +942,29 @@ def main():
     test_same_sura()
     test_large_range()
     test_reverse_order()
+    test_prefix_sum_ranges()
+    test_name_aliases()
+    test_ayah_positions()
+    test_page_lookup()
+    test_divisions()
+    test_mapped_layout()
+    test_snapshot()
+    test_lazy_result()
+    test_calculate_many()
+    test_pair_matrix()
+    test_batch_cli()
+    test_json_api()
+    test_result_cache()
+    test_fragment_cache()
+    test_shared_page_state()
+    test_load_harness()
+    test_benchmark_suite()
+    test_metrics()
+    test_fuzzy_suggestions()
+    test_search_index()
+    test_arabic_normalization()
+    test_task_scheduler()
+    test_virtual_list()
     
     print("✅ All tests completed!")
     print("\nNow you can run the GUI application with:")
@@ -6,6 +6,8 @@ Modern UI components using customtkinter for Django-like styling
 import customtkinter as ctk
 from typing import List, Callable, Optional
 
+from search_index import IncrementalSearch, get_search_index
+
 
 class ModernEntry(ctk.CTkEntry):
     """Modern entry widget with validation and autocomplete"""
@@ -79,8 +81,122 @@ class ModernFrame(ctk.CTkFrame):
         super().__init__(**frame_kwargs)
 
 
+class VirtualList(ctk.CTkFrame):
+    """Scrollable list that shows its items through a fixed pool of row widgets
+    
+    Only `rows` widgets are ever created. set_items() and scrolling rebind
+    the visible window of the items to the pool, formatting just the
+    visible items and reconfiguring only rows whose text changed, so the
+    cost of an update does not depend on the number of items.
+    """
+    
+    WHEEL_ROWS = 3  # Rows scrolled per mouse wheel notch
+    
+    def __init__(self, master, rows, create_row, format_item=str, **kwargs):
+        """
+        Args:
+            master: Parent widget
+            rows (int): Size of the row pool (rows visible at once)
+            create_row (callable): create_row(list, row) returns the widget for a pool row
+            format_item (callable): Text shown for an item
+        """
+        super().__init__(master, **kwargs)
+        self.rows = rows
+        self.format_item = format_item
+        self.items = ()
+        self.first_row = 0  # Index in items of the top visible row
+        self.grid_columnconfigure(0, weight=1)
+        
+        self.row_widgets = []
+        self.row_texts = []  # Text currently bound to each row (None when hidden)
+        for row in range(rows):
+            widget = create_row(self, row)
+            widget.grid(row=row, column=0, sticky="ew", padx=2, pady=1)
+            self.bind_mouse_wheel(widget)
+            self.row_widgets.append(widget)
+            self.row_texts.append("")
+            
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scroll)
+        self.scrollbar.grid(row=0, column=1, rowspan=rows, sticky="ns", padx=(0, 2), pady=2)
+        self.bind_mouse_wheel(self)
+        
+    def bind_mouse_wheel(self, widget):
+        """Scroll the list with the mouse wheel over a widget"""
+        widget.bind("<MouseWheel>", self.on_mouse_wheel)  # Windows and macOS
+        widget.bind("<Button-4>", self.on_mouse_wheel)  # X11 wheel up
+        widget.bind("<Button-5>", self.on_mouse_wheel)  # X11 wheel down
+        
+    def set_items(self, items):
+        """Show a new sequence of items, scrolled to the top"""
+        self.items = items
+        self.first_row = 0
+        self.render_rows()
+        
+    def item_at(self, row):
+        """Item shown in a row of the pool, or None if the row is empty"""
+        index = self.first_row + row
+        return self.items[index] if index < len(self.items) else None
+        
+    def render_rows(self):
+        """Bind the visible window of items to the row pool"""
+        total = len(self.items)
+        self.first_row = max(0, min(self.first_row, total - self.rows))
+        
+        for row, widget in enumerate(self.row_widgets):
+            index = self.first_row + row
+            text = self.format_item(self.items[index]) if index < total else None
+            if text == self.row_texts[row]:
+                continue
+            if text is None:
+                widget.grid_remove()
+            else:
+                widget.configure(text=text)
+                if self.row_texts[row] is None:
+                    widget.grid()
+            self.row_texts[row] = text
+            
+        # Scrollbar only when not everything fits
+        if total > self.rows:
+            self.scrollbar.grid()
+            self.scrollbar.set(self.first_row / total, (self.first_row + self.rows) / total)
+        else:
+            self.scrollbar.grid_remove()
+            
+    def scroll_to(self, first_row):
+        """Make first_row the top visible row (clamped)"""
+        self.first_row = first_row
+        self.render_rows()
+        
+    def on_scroll(self, action, amount, unit="units"):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", steps, "units"/"pages")"""
+        if action == "moveto":
+            self.scroll_to(round(float(amount) * len(self.items)))
+        elif action == "scroll":
+            step = self.rows if unit == "pages" else 1
+            self.scroll_to(self.first_row + int(amount) * step)
+            
+    def on_mouse_wheel(self, event):
+        """Scroll a few rows per wheel notch"""
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.scroll_to(self.first_row - self.WHEEL_ROWS)
+        else:
+            self.scroll_to(self.first_row + self.WHEEL_ROWS)
+        return "break"
+
+
 class ResultCard(ModernFrame):
-    """Card component for displaying calculation results"""
+    """Card component for displaying calculation results
+    
+    The card has three views in its content frame: the welcome view
+    (welcome_frame, filled in by the application), an error label and the
+    result view. Each view is built on first use and then kept; switching
+    views only packs and forgets frames, and display_result() reconfigures
+    just the labels whose text changed. The included suras are shown in a
+    VirtualList of SURA_ROWS labels: only the visible suras are formatted
+    and bound, so even a full-Quran range costs a few label updates.
+    """
+    
+    SURA_ROWS = 10  # Sura rows visible at once
     
     def __init__(self, master, width=600, height=400, **kwargs):
         super().__init__(master=master, width=width, height=height, **kwargs)
@@ -98,108 +214,137 @@ class ResultCard(ModernFrame):
         self.content_frame = ctk.CTkScrollableFrame(self, width=550, height=320)
         self.content_frame.pack(pady=10, padx=20, fill="both", expand=True)
         
+        # Views, built on first use
+        self.welcome_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        self.error_label = None
+        self.result_frame = None
+        self.current_view = None
+        
+        self.label_texts = {}  # Label -> text it currently shows
+        
+    def show_view(self, view):
+        """Show one of the card's views and hide the others"""
+        if view is self.current_view:
+            return
+        if self.current_view is not None:
+            self.current_view.pack_forget()
+        if view is self.error_label:
+            view.pack(pady=20)
+        else:
+            view.pack(fill="both", expand=True)
+        self.current_view = view
+        
+    def show_welcome(self):
+        """Show the welcome view (its content is added to welcome_frame by the application)"""
+        self.show_view(self.welcome_frame)
+        
+    def set_text(self, label, text):
+        """Configure a label only if its text changed"""
+        if self.label_texts.get(label) != text:
+            label.configure(text=text)
+            self.label_texts[label] = text
+            
+    def set_row_visible(self, widget, visible):
+        """Show or hide a widget in the result view, keeping its grid position"""
+        if visible:
+            widget.grid()
+        else:
+            widget.grid_remove()
+            
+    def build_result_view(self):
+        """Create the labels of the result view (once)"""
+        frame = self.result_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        frame.grid_columnconfigure(0, weight=1)
+        
+        self.total_label = ModernLabel(frame, font_size=24, font_weight="bold", text_color="#2E8B57")
+        self.total_label.grid(row=0, column=0, pady=(0, 10))
+        
+        self.pages_label = ModernLabel(frame, font_size=20, font_weight="bold", text_color="#2E8B57")
+        self.pages_label.grid(row=1, column=0, pady=(0, 20))
+        
+        self.range_label = ModernLabel(frame, font_size=14)
+        self.range_label.grid(row=2, column=0, pady=(0, 20))
+        
+        self.suras_count_label = ModernLabel(frame, font_size=16, font_weight="bold")
+        self.suras_count_label.grid(row=3, column=0, pady=(0, 15))
+        
+        self.page_calc_label = ModernLabel(frame, font_size=10, text_color="#666666")
+        self.page_calc_label.grid(row=4, column=0, pady=(0, 15))
+        
+        details_label = ModernLabel(frame, text="Included Suras:", font_size=14, font_weight="bold")
+        details_label.grid(row=5, column=0, pady=(0, 10))
+        
+        # Sura list; its rows are bound to the visible included suras
+        self.sura_list = VirtualList(
+            frame,
+            rows=self.SURA_ROWS,
+            create_row=lambda sura_list, row: ModernLabel(sura_list, font_size=12, anchor="w", padx=20),
+            format_item=self.format_sura,
+            width=500,
+            corner_radius=10
+        )
+        self.sura_list.grid(row=6, column=0, pady=10, padx=10, sticky="ew")
+        
     def display_result(self, result_data: dict):
         """Display calculation result in the card"""
-        # Clear existing content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-            
         if not result_data.get("success", False):
-            error_label = ModernLabel(
-                self.content_frame,
-                text=f"Error: {result_data.get('error', 'Unknown error')}",
-                font_size=16,
-                text_color="red"
-            )
-            error_label.pack(pady=20)
+            if self.error_label is None:
+                self.error_label = ModernLabel(self.content_frame, font_size=16, text_color="red")
+            self.set_text(self.error_label, f"Error: {result_data.get('error', 'Unknown error')}")
+            self.show_view(self.error_label)
             return
             
+        if self.result_frame is None:
+            self.build_result_view()
+            
         # Display total ayahs (main result)
-        total_label = ModernLabel(
-            self.content_frame,
-            text=f"Total Ayahs: {result_data['total_ayahs']}",
-            font_size=24,
-            font_weight="bold",
-            text_color="#2E8B57"
-        )
-        total_label.pack(pady=(0, 10))
+        self.set_text(self.total_label, f"Total Ayahs: {result_data['total_ayahs']}")
         
         # Display estimated pages
         estimated_pages = result_data.get("estimated_pages", 0)
         if estimated_pages > 0:
-            pages_label = ModernLabel(
-                self.content_frame,
-                text=f"Estimated Pages: {estimated_pages}",
-                font_size=20,
-                font_weight="bold",
-                text_color="#2E8B57"
-            )
-            pages_label.pack(pady=(0, 20))
+            self.set_text(self.pages_label, f"Estimated Pages: {estimated_pages}")
+        self.set_row_visible(self.pages_label, estimated_pages > 0)
         
         # Display range information
         range_text = f"From Sura {result_data['start_sura']['number']}: {result_data['start_sura']['name']}\n"
         range_text += f"To Sura {result_data['end_sura']['number']}: {result_data['end_sura']['name']}"
-        
-        range_label = ModernLabel(
-            self.content_frame,
-            text=range_text,
-            font_size=14
-        )
-        range_label.pack(pady=(0, 20))
+        self.set_text(self.range_label, range_text)
         
         # Display number of suras
-        suras_count_label = ModernLabel(
-            self.content_frame,
-            text=f"Number of Suras: {result_data['number_of_suras']}",
-            font_size=16,
-            font_weight="bold"
-        )
-        suras_count_label.pack(pady=(0, 15))
+        self.set_text(self.suras_count_label, f"Number of Suras: {result_data['number_of_suras']}")
         
         # Display page calculation info
         if "page_info" in result_data:
             page_info = result_data["page_info"]
             page_calc_text = f"Page Calculation: Based on average {page_info['average_ayahs_per_page']} ayahs per page\n"
             page_calc_text += f"(Standard Mushaf has {page_info['total_quran_pages']} pages total)"
-            
-            page_calc_label = ModernLabel(
-                self.content_frame,
-                text=page_calc_text,
-                font_size=10,
-                text_color="#666666"
-            )
-            page_calc_label.pack(pady=(0, 15))
+            self.set_text(self.page_calc_label, page_calc_text)
+        self.set_row_visible(self.page_calc_label, "page_info" in result_data)
         
         # Display detailed sura list
-        details_label = ModernLabel(
-            self.content_frame,
-            text="Included Suras:",
-            font_size=14,
-            font_weight="bold"
-        )
-        details_label.pack(pady=(0, 10))
-        
-        # Create a frame for the sura list
-        sura_list_frame = ModernFrame(self.content_frame, width=500)
-        sura_list_frame.pack(pady=10, padx=10, fill="x")
-        
-        for sura in result_data['included_suras']:
-            pages = sura.get('estimated_pages', 1)
-            sura_text = f"{sura['number']}. {sura['name']} ({sura['ayahs']} ayahs, ~{pages} pages)"
-            sura_label = ModernLabel(
-                sura_list_frame,
-                text=sura_text,
-                font_size=12
-            )
-            sura_label.pack(anchor="w", padx=20, pady=2)
+        self.sura_list.set_items(result_data['included_suras'])
+        self.show_view(self.result_frame)
+        
+    @staticmethod
+    def format_sura(sura):
+        """Text of one row of the sura list"""
+        pages = sura.get('estimated_pages', 1)
+        return f"{sura['number']}. {sura['name']} ({sura['ayahs']} ayahs, ~{pages} pages)"
 
 
 class AutocompleteEntry(ModernEntry):
-    """Entry widget with dropdown autocomplete"""
+    """Entry widget with dropdown autocomplete
+    
+    With a scheduler (task_scheduler.TaskScheduler), matching runs on its
+    worker thread once typing pauses; otherwise on every key release.
+    """
     
-    def __init__(self, master, autocomplete_values=None, **kwargs):
+    def __init__(self, master, autocomplete_values=None, scheduler=None, **kwargs):
         super().__init__(master, **kwargs)
-        self.autocomplete_values = autocomplete_values or []
+        self.scheduler = scheduler
+        self.filter_key = f"{self}.filter"
+        self.set_autocomplete_values(autocomplete_values or [])
         self.dropdown_frame = None
         self.selected_callback = None
         
@@ -210,6 +355,9 @@ class AutocompleteEntry(ModernEntry):
     def set_autocomplete_values(self, values: List[str]):
         """Update autocomplete values"""
         self.autocomplete_values = values
+        self.search = IncrementalSearch(get_search_index(values))
+        if self.scheduler:
+            self.scheduler.cancel(self.filter_key)
         
     def set_selection_callback(self, callback: Callable[[str], None]):
         """Set callback for when item is selected"""
@@ -217,16 +365,21 @@ class AutocompleteEntry(ModernEntry):
         
     def on_key_release(self, event):
         """Handle key release for autocomplete"""
-        current_text = self.get().lower()
+        current_text = self.get()
         
         if len(current_text) < 2:
             self.hide_dropdown()
             return
             
-        # Filter matches
-        matches = [name for name in self.autocomplete_values 
-                  if current_text in name.lower()][:5]  # Limit to 5 results
-        
+        # Filter matches, narrowing the previous ones while the text grows
+        if self.scheduler:
+            self.scheduler.schedule(self.filter_key, self.search.update, (current_text, 5),
+                                    callback=self.show_matches)
+        else:
+            self.show_matches(self.search.update(current_text, limit=5))
+            
+    def show_matches(self, matches: List[str]):
+        """Show the matches for the current text (or hide the dropdown if none)"""
         if matches:
             self.show_dropdown(matches)
         else:
@@ -258,6 +411,8 @@ class AutocompleteEntry(ModernEntry):
             
     def hide_dropdown(self, event=None):
         """Hide dropdown"""
+        if self.scheduler:
+            self.scheduler.cancel(self.filter_key)
         if self.dropdown_frame:
             self.dropdown_frame.destroy()
             self.dropdown_frame = None
@@ -273,11 +428,27 @@ class AutocompleteEntry(ModernEntry):
 
 
 class SearchableComboBox(ctk.CTkFrame):
-    """A searchable combobox that shows a dropdown list with search functionality"""
+    """A searchable combobox that shows a dropdown list with search functionality
+    
+    The dropdown is a VirtualList built once with a fixed pool of
+    DROPDOWN_ROWS row buttons, and every update only rebinds the row texts
+    to the visible window of the filtered values. Opening, typing and
+    scrolling never create or destroy widgets, so the cost of a keystroke
+    does not depend on the number of matches.
+    
+    With a scheduler (task_scheduler.TaskScheduler), filtering runs on its
+    worker thread once typing pauses and only the latest result is shown.
+    """
     
-    def __init__(self, master, values=None, width=300, height=40, placeholder_text="Select or search...", **kwargs):
+    DROPDOWN_ROWS = 8  # Row buttons in the pool (visible at once)
+    ROW_HEIGHT = 30
+    
+    def __init__(self, master, values=None, width=300, height=40, placeholder_text="Select or search...",
+                 scheduler=None, **kwargs):
         super().__init__(master, width=width, height=height, **kwargs)
         
+        self.scheduler = scheduler
+        self.filter_key = f"{self}.filter"
         self.values = values or []
         self.filtered_values = self.values.copy()
         self.selected_value = ""
@@ -307,7 +478,7 @@ class SearchableComboBox(ctk.CTkFrame):
         )
         self.dropdown_button.grid(row=0, column=1, padx=(0, 2), pady=2)
         
-        # Dropdown frame (initially hidden)
+        # Dropdown list, built on first open and then reused
         self.dropdown_frame = None
         
         # Bind events
@@ -321,6 +492,9 @@ class SearchableComboBox(ctk.CTkFrame):
         """Set the list of values for the combobox"""
         self.values = values
         self.filtered_values = values.copy()
+        self.search = IncrementalSearch(get_search_index(values))
+        if self.scheduler:
+            self.scheduler.cancel(self.filter_key)
         
     def get(self):
         """Get the current value"""
@@ -348,23 +522,29 @@ class SearchableComboBox(ctk.CTkFrame):
             self.hide_dropdown()
             return
             
-        current_text = self.entry.get().lower()
+        current_text = self.entry.get()
+        if not current_text:
+            self.filtered_values = self.values.copy()
+            self.hide_dropdown()
+            return
         
-        # Filter values based on search text
-        if current_text:
-            self.filtered_values = [value for value in self.values 
-                                  if current_text in value.lower()]
+        # Filter values based on search text (shared index, narrowed per keystroke)
+        if self.scheduler:
+            self.scheduler.schedule(self.filter_key, self.search.update, (current_text,),
+                                    callback=self.show_matches)
         else:
-            self.filtered_values = self.values.copy()
+            self.show_matches(self.search.update(current_text))
+            
+    def show_matches(self, matches):
+        """Show the filtered values for the current text"""
+        self.filtered_values = matches
             
         # Update dropdown if open
-        if len(current_text) >= 1 and len(self.filtered_values) > 0:
+        if len(self.filtered_values) > 0:
             if self.is_open:
                 self.update_dropdown()
             else:
                 self.show_dropdown()
-        elif len(current_text) == 0:
-            self.hide_dropdown()
             
     def toggle_dropdown(self):
         """Toggle dropdown visibility"""
@@ -381,20 +561,17 @@ class SearchableComboBox(ctk.CTkFrame):
         self.is_open = True
         self.dropdown_button.configure(text="⌃")
         
-        # Create dropdown frame
-        self.dropdown_frame = ctk.CTkScrollableFrame(
-            self.master,
-            width=self.winfo_width(),
-            height=min(200, len(self.filtered_values) * 35 + 10),
-            fg_color=("white", "gray20")
-        )
+        if self.dropdown_frame is None:
+            self.build_dropdown()
         
         # Position dropdown below the combobox
         self.update_idletasks()
         x = self.winfo_x()
         y = self.winfo_y() + self.winfo_height()
         
+        self.dropdown_frame.configure(width=self.winfo_width())
         self.dropdown_frame.place(x=x, y=y)
+        self.dropdown_frame.lift()
         
         # Populate dropdown
         self.update_dropdown()
@@ -402,28 +579,38 @@ class SearchableComboBox(ctk.CTkFrame):
         # Simple global click handler
         self.master.winfo_toplevel().bind("<Button-1>", self.check_click_outside, add="+")
         
+    def build_dropdown(self):
+        """Create the dropdown list and its pool of row buttons (once)"""
+        self.dropdown_frame = VirtualList(
+            self.master,
+            rows=self.DROPDOWN_ROWS,
+            create_row=self.create_row_button,
+            fg_color=("white", "gray20")
+        )
+        
+    def create_row_button(self, dropdown_list, row):
+        """Button for one row of the dropdown pool"""
+        return ctk.CTkButton(
+            dropdown_list,
+            text="",
+            height=self.ROW_HEIGHT,
+            anchor="w",
+            fg_color="transparent",
+            hover_color=("lightgray", "gray30"),
+            text_color=("black", "white"),
+            command=lambda: self.select_row(row)
+        )
+        
     def update_dropdown(self):
-        """Update dropdown contents"""
-        if not self.dropdown_frame:
-            return
-            
-        # Clear existing items
-        for widget in self.dropdown_frame.winfo_children():
-            widget.destroy()
-            
-        # Add filtered items (limit to 20 for better performance)
-        for value in self.filtered_values[:20]:
-            item_button = ctk.CTkButton(
-                self.dropdown_frame,
-                text=value,
-                height=30,
-                anchor="w",
-                fg_color="transparent",
-                hover_color=("lightgray", "gray30"),
-                text_color=("black", "white"),
-                command=lambda v=value: self.select_and_close(v)
-            )
-            item_button.pack(fill="x", padx=2, pady=1)
+        """Show the top of the filtered values in the dropdown"""
+        if self.dropdown_frame:
+            self.dropdown_frame.set_items(self.filtered_values)
+        
+    def select_row(self, row):
+        """Select the value shown in a row of the pool"""
+        value = self.dropdown_frame.item_at(row)
+        if value is not None:
+            self.select_and_close(value)
             
     def select_and_close(self, value):
         """Select an item and close dropdown"""
@@ -431,7 +618,9 @@ class SearchableComboBox(ctk.CTkFrame):
         self.hide_dropdown()
         
     def hide_dropdown(self):
-        """Hide the dropdown list"""
+        """Hide the dropdown list (its widgets are kept for the next open)"""
+        if self.scheduler:
+            self.scheduler.cancel(self.filter_key)
         if not self.is_open:
             return
             
@@ -439,8 +628,7 @@ class SearchableComboBox(ctk.CTkFrame):
         self.dropdown_button.configure(text="⌄")
         
         if self.dropdown_frame:
-            self.dropdown_frame.destroy()
-            self.dropdown_frame = None
+            self.dropdown_frame.place_forget()
             
         # Remove click handler
         try:
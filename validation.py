@@ -3,8 +3,10 @@ Validation Module
 User input validation and UX enhancement utilities
 """
 
-from quran_data import get_sura_names, is_valid_sura_name
-from difflib import get_close_matches
+from quran_data import get_sura_names, get_sura_number_by_name, is_valid_sura_name
+from fuzzy_index import get_fuzzy_index
+from search_index import get_search_index
+from metrics import timed
 
 
 class InputValidator:
@@ -13,6 +15,7 @@ class InputValidator:
     def __init__(self):
         self.sura_names = get_sura_names()
         
+    @timed("validator.validate_sura_name")
     def validate_sura_name(self, name: str) -> dict:
         """
         Validate sura name and provide suggestions if invalid
@@ -36,13 +39,8 @@ class InputValidator:
                 "suggestions": []
             }
             
-        # Find close matches
-        suggestions = get_close_matches(
-            name, 
-            self.sura_names, 
-            n=3, 
-            cutoff=0.6
-        )
+        # Find close matches through the trigram index (bounded cost, any script)
+        suggestions = get_fuzzy_index().suggest(name, limit=3)
         
         return {
             "valid": False,
@@ -50,28 +48,16 @@ class InputValidator:
             "suggestions": suggestions
         }
         
+    @timed("validator.get_autocomplete_suggestions")
     def get_autocomplete_suggestions(self, partial_name: str, limit: int = 5) -> list:
         """Get autocomplete suggestions for partial sura name"""
         if len(partial_name) < 2:
             return []
             
-        partial_name = partial_name.lower()
-        suggestions = []
-        
-        # Exact prefix matches first
-        for name in self.sura_names:
-            if name.lower().startswith(partial_name):
-                suggestions.append(name)
-                
-        # Then substring matches
-        if len(suggestions) < limit:
-            for name in self.sura_names:
-                if (partial_name in name.lower() and 
-                    name not in suggestions):
-                    suggestions.append(name)
-                    
-        return suggestions[:limit]
+        # Prefix matches first, then substring matches (shared search index)
+        return get_search_index(self.sura_names).search(partial_name, limit)
         
+    @timed("validator.validate_calculation_input")
     def validate_calculation_input(self, sura1: str, sura2: str) -> dict:
         """Validate both sura inputs for calculation"""
         sura1 = sura1.strip()
@@ -88,8 +74,9 @@ class InputValidator:
                 }
             }
             
-        # Check if same sura
-        if sura1.lower() == sura2.lower():
+        # Check if same sura (aliases and numbers resolve to the same sura)
+        sura1_num = get_sura_number_by_name(sura1)
+        if sura1_num is not None and sura1_num == get_sura_number_by_name(sura2):
             return {
                 "valid": False,
                 "error": "Please enter two different suras",